@@ -1,17 +1,48 @@
 import streamlit as st
 import pandas as pd
 import logging
-import concurrent.futures
-from src.db.mongo import MongoDB
+from datetime import datetime, timedelta, timezone
+from src.db.mongo import MongoDB, JOB_LIST_FIELDS, CANONICAL_ONLY
+from src.db.sink import BatchingSink
 from src.scrapers.linkedin_scraper import LinkedInScraper
 from src.scrapers.indeed_scraper import IndeedScraper
 from src.scrapers.glints_scraper import GlintsScraper
+from src.scrapers.orchestrator import CrawlOrchestrator
+from src.scrapers.checkpoint import CrawlCheckpoint
+from src.scrapers.dead_letters import DeadLetterQueue
 from src.resume.optimizer import ResumeOptimizer
+from src.utils.dedup import BackgroundDedupe
+from src.utils.description_compactor import DescriptionCompactor
+from src.utils.job_index import JobIndex
 from src.agent.agent import ApplicationAgent
 
+@st.cache_resource
+def load_db() -> MongoDB:
+    # Connecting ensures indexes and migrates old rows, so do it once per process.
+    # A failed connection raises, which st.cache_resource doesn't cache, so the next rerun retries
+    return MongoDB()
+
+@st.cache_resource
+def load_checkpoint() -> CrawlCheckpoint:
+    return CrawlCheckpoint()
+
+@st.cache_resource
+def load_dead_letters() -> DeadLetterQueue:
+    return DeadLetterQueue()
+
+@st.cache_resource
+def load_job_index() -> JobIndex:
+    # One memory-mapped index per process, shared by every session
+    return JobIndex()
+
+@st.cache_resource
+def load_deduper(_db: MongoDB) -> BackgroundDedupe:
+    # One background deduplication per process, so crawls from several sessions never overlap
+    return BackgroundDedupe(_db)
+
 # Initialize services
 try:
-    db = MongoDB()
+    db = load_db()
 except:
     st.error("Could not connect to MongoDB. Ensure Docker is running.")
     db = None
@@ -38,9 +69,33 @@ if page == "Search Jobs":
     
     with col2:
         remote_only = st.checkbox("Remote Only")
+        incremental = st.checkbox("Incremental crawl (skip jobs already scraped)", value=True)
+        refresh_after_days = st.number_input("Re-fetch details older than (days)", min_value=1, value=7, disabled=not incremental)
         
 
-    if st.button("Start Crawling"):
+    # Crawls interrupted before finishing can be picked up where they stopped
+    checkpoint = load_checkpoint()
+    resume_crawl_id = None
+    for crawl in checkpoint.unfinished():
+        params = crawl["params"]
+        resume_col, info_col = st.columns([1, 5])
+        with info_col:
+            st.caption(
+                f"Unfinished crawl from {crawl['updated_at']}: "
+                f"{', '.join(params['job_titles'])} in {', '.join(params['locations'])}"
+            )
+        with resume_col:
+            if st.button("Resume", key=f"resume_{crawl['crawl_id']}"):
+                resume_crawl_id = crawl["crawl_id"]
+
+    failed_pages = load_dead_letters().counts()
+    if failed_pages:
+        st.caption(
+            "Detail pages to retry on the next crawl: "
+            + ", ".join(f"{platform}: {count}" for platform, count in failed_pages.items())
+        )
+
+    if st.button("Start Crawling") or resume_crawl_id:
         if not db:
             st.error("Database not connected.")
         else:
@@ -48,39 +103,174 @@ if page == "Search Jobs":
                 titles = [t.strip() for t in job_titles.split(",")]
                 locs = [l.strip() for l in locations.split(",")]
                 
-                scrapers = [LinkedInScraper(), IndeedScraper(), GlintsScraper()]
-                all_jobs = []
-                
-                def run_scraper(scraper):
-                    try:
-                        return scraper.scrape(titles, locs, remote_only)
-                    except Exception as e:
-                        st.error(f"Error with scraper {type(scraper).__name__}: {e}")
-                        return []
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-                    results = list(executor.map(run_scraper, scrapers))
-                
-                for jobs in results:
-                    all_jobs.extend(jobs)
+                orchestrator = CrawlOrchestrator([LinkedInScraper(), IndeedScraper(), GlintsScraper()])
+
+                # Live progress, updated as jobs stream in and batches are saved
+                scraped_counts = {}
+                progress = st.empty()
+                saved = st.empty()
+
+                def report_event(name, job, error):
+                    if job is not None:
+                        scraped_counts[name] = scraped_counts.get(name, 0) + 1
+                        progress.write(" | ".join(f"{n}: {c} scraped" for n, c in scraped_counts.items()))
+                    elif error:
+                        st.error(f"Error with scraper {name}: {error}")
+                    else:
+                        st.write(f"{name} finished: {scraped_counts.get(name, 0)} jobs")
+
+                def report_flush(summary):
+                    saved.info(f"Saved so far: {summary['inserted']} new, {summary['updated']} updated.")
+
+                known_urls = None
+                if incremental:
+                    known_urls = lambda urls: db.find_fresh_urls(urls, timedelta(days=refresh_after_days))
+
+                # Descriptions are stored trimmed to the token budget used for resume prompts
+                sink = BatchingSink(db, batch_size=50, flush_interval=5.0, on_flush=report_flush, compactor=DescriptionCompactor(), index=load_job_index())
+                if resume_crawl_id:
+                    summary = orchestrator.resume(sink, checkpoint, resume_crawl_id, known_urls=known_urls, on_event=report_event)
+                else:
+                    summary = orchestrator.run(
+                        sink, titles, locs, remote_only, known_urls=known_urls, on_event=report_event, checkpoint=checkpoint
+                    )
                 
-                if all_jobs:
-                    db.save_jobs(all_jobs)
-                    st.success(f"Found and saved {len(all_jobs)} jobs!")
+                if sink.received:
+                    # Counts, facets and the resume ranking shown with the job list include the new jobs
+                    st.session_state.pop("job_counts", None)
+                    st.session_state.pop("job_facets", None)
+                    st.session_state.pop("job_ranking", None)
+                    st.success(
+                        f"Found {sink.received} jobs: {summary['inserted']} new, {summary['updated']} updated, "
+                        f"{summary['unchanged']} unchanged, {summary['tokens_saved']} description tokens trimmed."
+                    )
+                    if summary["failed"]:
+                        st.warning(f"{summary['failed']} jobs could not be saved.")
+                        with st.expander("Save errors"):
+                            st.dataframe(pd.DataFrame(summary["errors"]), use_container_width=True)
+
+                    # The same role is often posted on several sites; merging them is a full
+                    # pass over the collection, so it runs after the results are shown
+                    load_deduper(db).request()
+                    st.info("Merging duplicate postings in the background; the job list updates once it is done.")
                 else:
                     st.warning("No jobs found.")
 
     # Display Jobs
     st.subheader("Available Jobs")
     if db:
-        jobs = db.get_jobs()
+        # Cursor of every page visited so far, so "Previous" can step back
+        if "job_page_cursors" not in st.session_state:
+            st.session_state.job_page_cursors = [None]
+
+        def reset_job_pages():
+            st.session_state.job_page_cursors = [None]
+
+        page_size = st.selectbox("Jobs per page", [25, 50, 100], index=1, on_change=reset_job_pages)
+        posted_within = st.selectbox("Posted within", [None, 1, 7, 30], format_func=lambda d: "Any time" if d is None else f"{d} days", on_change=reset_job_pages)
+        posted_after = datetime.now(timezone.utc) - timedelta(days=posted_within) if posted_within is not None else None
+        # Postings merged into another job are listed through that job only
+        canonical_only = dict(CANONICAL_ONLY)
+        if posted_after is not None:
+            canonical_only["date_posted"] = {"$gte": posted_after}
+
+        # Facet counts from the last search label the filter options
+        if "job_facets" not in st.session_state:
+            st.session_state.job_facets = db.search_jobs(limit=1)["facets"]
+        facet_counts = {name: {b["value"]: b["count"] for b in buckets} for name, buckets in st.session_state.job_facets.items()}
+
+        def with_count(facet):
+            return lambda value: f"{value} ({facet_counts[facet][value]})" if value in facet_counts[facet] else str(value)
+
+        search_text = st.text_input("Search title, company and description", placeholder='python "machine learning" -senior', on_change=reset_job_pages)
+        source_col, location_col, remote_col = st.columns(3)
+        with source_col:
+            # Platform names, so sites added by spec are listed under their own name
+            source_options = list(dict.fromkeys([*st.session_state.get("search_sources", []), *(v for v in facet_counts["source"] if v)]))
+            sources = st.multiselect("Source", source_options, format_func=with_count("source"), key="search_sources", on_change=reset_job_pages)
+        with location_col:
+            # Selected locations stay listed even when a narrower search no longer counts them
+            location_options = list(dict.fromkeys([*st.session_state.get("search_locations", []), *(v for v in facet_counts["location"] if v)]))
+            locations = st.multiselect("Location", location_options, format_func=with_count("location"), key="search_locations", on_change=reset_job_pages)
+        with remote_col:
+            remote = st.selectbox("Remote", [None, True, False], format_func=lambda r: "Any" if r is None else f"{'Remote only' if r else 'On-site only'} ({facet_counts['remote'].get(r, 0)})", on_change=reset_job_pages)
+        searching = bool(search_text or sources or locations or remote is not None)
+
+        base_resume = st.session_state.get("base_resume")
+        rank_by_resume = st.checkbox("Sort by match with my resume", value=bool(base_resume), disabled=not base_resume or searching, on_change=reset_job_pages)
+        total = None
+        empty_message = "No jobs in database. Start crawling!"
+        if searching:
+            result = db.search_jobs(
+                search_text or None, sources=sources, locations=locations, posted_after=posted_after, remote=remote,
+                limit=page_size, after=st.session_state.job_page_cursors[-1]
+            )
+            st.session_state.job_facets = result["facets"]
+            jobs, total, next_cursor = result["jobs"], result["total"], result["next"]
+        elif rank_by_resume:
+            job_index = load_job_index()
+            job_index.sync(db)
+            # Every listed job ranked once per resume and date filter, then paged by offset;
+            # redone when a sync grows the index, and cleared by a crawl
+            ranking_key = (hash(base_resume), posted_within, len(job_index))
+            ranking = st.session_state.get("job_ranking")
+            if ranking is None or ranking["key"] != ranking_key:
+                listed = {job["url"] for batch in db.iter_job_batches(canonical_only, fields=["url"]) for job in batch}
+                matches = job_index.search(base_resume, k=None)
+                ranking = {"key": ranking_key, "matched": bool(matches), "jobs": [(url, score) for url, score in matches if url in listed]}
+                st.session_state.job_ranking = ranking
+            ranked, total = ranking["jobs"], len(ranking["jobs"])
+            offset = (st.session_state.job_page_cursors[-1] or {}).get("offset", 0)
+            if offset >= total:
+                # A new resume or a smaller ranking starts again from the first page
+                reset_job_pages()
+                offset = 0
+            scores = dict(ranked[offset:offset + page_size])
+            jobs = db.find_jobs({"$and": [canonical_only, {"url": {"$in": list(scores)}}]}, fields=JOB_LIST_FIELDS, limit=len(scores))[0]
+            jobs = sorted(jobs, key=lambda job: -scores[job["url"]])
+            for job in jobs:
+                job["match"] = round(scores[job["url"]], 3)
+            next_cursor = {"offset": offset + page_size} if offset + page_size < total else None
+            if len(job_index) and not ranking["matched"]:
+                empty_message = "Your resume has no words to match against job descriptions. Upload a TXT resume with its full text, or turn off sorting by match."
+        else:
+            jobs, next_cursor = db.find_jobs(
+                canonical_only, fields=JOB_LIST_FIELDS, limit=page_size, after=st.session_state.job_page_cursors[-1]
+            )
         if jobs:
-            df = pd.DataFrame(jobs)
+            df = pd.DataFrame(jobs).drop(columns=["_id"])
             st.dataframe(df, use_container_width=True)
-            
+
+            page_number = len(st.session_state.job_page_cursors)
+            prev_col, info_col, next_col = st.columns([1, 4, 1])
+            with prev_col:
+                if st.button("Previous", disabled=page_number == 1):
+                    st.session_state.job_page_cursors.pop()
+                    st.rerun()
+            with info_col:
+                if total is None:
+                    # Counted once per date filter rather than on every rerun; a crawl clears the counts
+                    counts = st.session_state.setdefault("job_counts", {})
+                    if posted_within not in counts:
+                        counts[posted_within] = db.count_jobs(canonical_only)
+                    total = counts[posted_within]
+                st.caption(f"Page {page_number} of {total} jobs")
+            with next_col:
+                if st.button("Next", disabled=next_cursor is None):
+                    st.session_state.job_page_cursors.append(next_cursor)
+                    st.rerun()
+
             # Action buttons for each job (simplified)
-            selected_job_idx = st.selectbox("Select Job to Apply", range(len(jobs)), format_func=lambda i: f"{jobs[i]['title']} at {jobs[i]['company']}")
-            selected_job = jobs[selected_job_idx]
+            selected_job_idx = st.selectbox("Select Job to Apply", range(len(jobs)), format_func=lambda i: f"{jobs[i].get('title')} at {jobs[i].get('company')}")
+            # Only the selected job's description is loaded
+            selected_job = db.get_job(jobs[selected_job_idx]["url"])
+            with st.expander("Job Description"):
+                st.write(selected_job.get("description") or "No description stored.")
+            if selected_job.get("sources"):
+                st.caption("Also posted on: " + ", ".join(
+                    f"[{posting['source']}]({posting['url']})"
+                    for posting in selected_job["sources"] if posting["url"] != selected_job["url"]
+                ))
             
             if st.button("Generate Optimized Resume"):
                 st.info("Generating resume... (Requires OpenAI Key)")
@@ -95,7 +285,7 @@ if page == "Search Jobs":
                 # agent.apply(selected_job['url'], user_profile)
                 st.warning("Agent requires User Profile setup first.")
         else:
-            st.info("No jobs in database. Start crawling!")
+            st.info(empty_message)
 
 elif page == "My Profile":
     st.header("My Profile")
@@ -104,6 +294,11 @@ elif page == "My Profile":
     uploaded_file = st.file_uploader("Upload Base Resume (PDF/TXT)", type=["pdf", "txt"])
     if uploaded_file:
         st.success("File uploaded successfully!")
+        if uploaded_file.name.lower().endswith(".txt"):
+            # Used to rank jobs by how well they match
+            st.session_state.base_resume = uploaded_file.getvalue().decode("utf-8", errors="ignore")
+        else:
+            st.info("Upload a TXT version of your resume to sort jobs by match.")
         # Save file content to DB or disk
     
     with st.form("profile_form"):
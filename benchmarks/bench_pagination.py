@@ -0,0 +1,65 @@
+"""
+Compares time per 100 listings for the old fixed-sleep scroll loop and the
+event-driven `load_more_results`, against a local infinite-scroll fixture.
+
+Usage:
+    python -m benchmarks.bench_pagination [--total 300] [--batch 20] [--delay 300]
+"""
+import argparse
+import asyncio
+import pathlib
+import time
+from playwright.async_api import async_playwright, Page
+from src.scrapers.pagination import AdaptiveTimeout, load_more_results
+
+FIXTURE = pathlib.Path(__file__).parent / "fixtures" / "infinite_scroll.html"
+RESULTS_SELECTOR = "li.job-card"
+
+
+async def fixed_sleep_scroll(page: Page):
+    """The previous loop: scroll, sleep 2s, stop when the page stops growing."""
+    last_height = await page.evaluate("document.body.scrollHeight")
+    while True:
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await page.wait_for_timeout(2000)
+        new_height = await page.evaluate("document.body.scrollHeight")
+        if new_height == last_height:
+            break
+        last_height = new_height
+
+
+async def event_driven_scroll(page: Page):
+    timeout = AdaptiveTimeout()
+    while await load_more_results(page, RESULTS_SELECTOR, None, timeout):
+        pass
+
+
+async def measure(browser, url: str, strategy) -> tuple[float, int]:
+    page = await browser.new_page()
+    await page.goto(url)
+    await page.wait_for_selector(RESULTS_SELECTOR)
+    started = time.perf_counter()
+    await strategy(page)
+    elapsed = time.perf_counter() - started
+    listings = await page.locator(RESULTS_SELECTOR).count()
+    await page.close()
+    return elapsed, listings
+
+
+async def main(total: int, batch: int, delay: int):
+    url = f"{FIXTURE.as_uri()}?total={total}&batch={batch}&delay={delay}"
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        for name, strategy in [("fixed sleep", fixed_sleep_scroll), ("event driven", event_driven_scroll)]:
+            elapsed, listings = await measure(browser, url, strategy)
+            print(f"{name:>12}: {listings} listings in {elapsed:.1f}s -> {100 * elapsed / listings:.2f}s per 100 listings")
+        await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--total", type=int, default=300)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--delay", type=int, default=300, help="Simulated search XHR latency in ms")
+    args = parser.parse_args()
+    asyncio.run(main(args.total, args.batch, args.delay))
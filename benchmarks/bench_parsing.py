@@ -0,0 +1,132 @@
+"""
+Compares description extraction with the previous BeautifulSoup/html.parser
+code and the lxml parser, over Glints-style detail pages built from the jobs in
+glints_jobs.csv (rows are reused until `--pages` pages exist).
+
+Also measures how long the event loop stalls while a batch of pages is parsed
+inline on the loop versus in worker threads.
+
+Usage:
+    python -m benchmarks.bench_parsing [--pages 180] [--rounds 3]
+"""
+import argparse
+import asyncio
+import csv
+import html
+import json
+import pathlib
+import time
+from bs4 import BeautifulSoup
+from src.scrapers.glints_scraper import GlintsScraper
+
+CSV_PATH = pathlib.Path(__file__).parent.parent / "glints_jobs.csv"
+
+
+def build_page(job: dict, index: int) -> str:
+    """A detail page shaped like Glints': app shell, inline state, then <main>."""
+    paragraphs = "".join(f"<p>{html.escape(line)}</p>" for line in job["description"].splitlines() if line.strip())
+    nav = "".join(f"<li><a href='/id/opportunities/jobs/explore?page={i}'>Link {i}</a></li>" for i in range(80))
+    similar = "".join(
+        f"<div class='CompactOpportunityCard'><h2><a href='/job/{i}'>Similar job {i}</a></h2><span>Jakarta</span></div>"
+        for i in range(30)
+    )
+    state = json.dumps({"props": {"job": job, "index": index, "similar": list(range(500))}})
+    return (
+        "<!DOCTYPE html><html><head><title>Glints</title>"
+        "<style>body{font-family:sans-serif}</style><script>window.dataLayer=[];</script></head>"
+        f"<body><div id='__next'><header><nav><ul>{nav}</ul></nav></header>"
+        f"<main><h1>{html.escape(job['title'])}</h1><div>{html.escape(job['company'])}</div>"
+        f"<section><h2>Deskripsi pekerjaan</h2>{paragraphs}</section>"
+        f"<section><h2>Tentang Perusahaan</h2><p>{html.escape(job['company'])} is hiring.</p></section>"
+        f"<aside>{similar}</aside></main><footer>Glints</footer></div>"
+        f"<script id='__NEXT_DATA__' type='application/json'>{state}</script></body></html>"
+    )
+
+
+def bs4_parse_description(page: str) -> str | None:
+    """The previous GlintsScraper.parse_description."""
+    soup = BeautifulSoup(page, "html.parser")
+    main_content = soup.find("main") or soup.find("div", {"id": "__next"})
+    if not main_content:
+        return None
+    text_content = main_content.get_text(separator="\n")
+    if "Deskripsi pekerjaan" in text_content and "Tentang Perusahaan" in text_content:
+        start = text_content.find("Deskripsi pekerjaan")
+        end = text_content.find("Tentang Perusahaan")
+        if start != -1 and end != -1 and end > start:
+            return text_content[start:end].strip()
+        return text_content.split("Tentang Perusahaan")[0].strip()
+    elif "Tentang Perusahaan" in text_content:
+        return text_content.split("Tentang Perusahaan")[0].strip()
+    return text_content[:2000]
+
+
+def time_sequential(parse, pages, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for page in pages:
+            parse(page)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+async def loop_stall(parse, pages, threaded: bool) -> tuple[float, float]:
+    """Parses every page and returns (wall time, longest event loop stall)."""
+    longest = 0.0
+    done = False
+
+    async def heartbeat():
+        nonlocal longest
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            longest = max(longest, now - last)
+            last = now
+
+    ticker = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    if threaded:
+        await asyncio.gather(*(asyncio.to_thread(parse, page) for page in pages))
+    else:
+        for page in pages:
+            parse(page)
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    done = True
+    await ticker
+    return elapsed, longest
+
+
+def main(page_count: int, rounds: int):
+    with open(CSV_PATH, newline="", encoding="utf-8") as f:
+        jobs = list(csv.DictReader(f))
+    pages = [build_page(jobs[i % len(jobs)], i) for i in range(page_count)]
+    lxml_parse = GlintsScraper().parse_description
+
+    mismatches = sum(bs4_parse_description(page).split() != lxml_parse(page).split() for page in pages)
+    print(f"{len(pages)} pages from {len(jobs)} CSV rows, {sum(map(len, pages)) / len(pages) / 1024:.0f} KiB each; "
+          f"{mismatches} extraction mismatches")
+
+    bs4_time = time_sequential(bs4_parse_description, pages, rounds)
+    lxml_time = time_sequential(lxml_parse, pages, rounds)
+    print(f"{'bs4 html.parser':>16}: {1000 * bs4_time / len(pages):.2f} ms/page")
+    print(f"{'lxml':>16}: {1000 * lxml_time / len(pages):.2f} ms/page ({bs4_time / lxml_time:.1f}x faster)")
+
+    for name, parse, threaded in [
+        ("bs4 on loop", bs4_parse_description, False),
+        ("lxml on loop", lxml_parse, False),
+        ("lxml threaded", lxml_parse, True),
+    ]:
+        elapsed, stall = asyncio.run(loop_stall(parse, pages, threaded))
+        print(f"{name:>16}: {elapsed:.2f}s for all pages, longest loop stall {1000 * stall:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=180)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    main(args.pages, args.rounds)
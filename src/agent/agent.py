@@ -3,13 +3,19 @@ from playwright.sync_api import sync_playwright
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.caches import BaseCache
+from langchain_core.language_models import BaseChatModel
 from typing import Dict, Any
 
 from src.prompts.field_mapper_prompt import FIELD_MAPPER_SYSTEM_PROMPT, FIELD_MAPPER_USER_PROMPT
+from src.utils.llm_cache import LLMCache
 
 class ApplicationAgent:
-    def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o", temperature=0) # Use a smarter model for reasoning
+    def __init__(self, cache: BaseCache | None = None, llm: BaseChatModel | None = None):
+        # The same profile and form fields map the same way, so repeats come from the cache
+        self.cache = cache if cache is not None else LLMCache()
+        llm = llm or ChatOpenAI(model="gpt-4o", temperature=0) # Use a smarter model for reasoning
+        self.llm = llm.model_copy(update={"cache": self.cache})
         
         self.field_mapper_prompt = ChatPromptTemplate.from_messages([
             ("system", FIELD_MAPPER_SYSTEM_PROMPT),
@@ -19,6 +25,10 @@ class ApplicationAgent:
         self.parser = JsonOutputParser()
         self.chain = self.field_mapper_prompt | self.llm | self.parser
 
+    def cache_stats(self) -> Dict[str, Any] | None:
+        """Hits, misses and hit rate of the LLM cache, or None when the cache keeps no stats."""
+        return self.cache.stats() if isinstance(self.cache, LLMCache) else None
+
     def apply(self, job_url: str, user_profile: Dict[str, Any]):
         """
         Navigates to the job URL and attempts to fill the application form.
@@ -54,6 +64,8 @@ class ApplicationAgent:
             })
             
             logging.info(f"Field Mapping: {mapping}")
+            if isinstance(self.cache, LLMCache):
+                self.cache.log_stats("Application agent")
             
             # Fill fields
             for field_id, value in mapping.items():
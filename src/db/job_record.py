@@ -0,0 +1,193 @@
+import re
+import sys
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import List, Dict, Any, Iterable
+import pandas as pd
+
+# Values scrapers used for "unknown"; stored as None
+MISSING_VALUES = {"", "n/a", "na", "none", "null", "-"}
+# Stand-ins older scrapers stored when a detail page failed or was never visited
+PLACEHOLDER_DESCRIPTIONS = {"Description not found", "Description not scraped", "Description not scraped in list view"}
+
+# Relative posting dates as shown by the job sites, in English and Indonesian
+RELATIVE_DATE = re.compile(
+    r"\b(?P<count>\d+|an?|se)\+?\s*(?P<unit>minute|minggu|min|menit|hour|hr|jam|day|hari|week|month|bulan)",
+    re.IGNORECASE
+)
+UNIT_DAYS = {
+    "minute": 1 / 1440, "min": 1 / 1440, "menit": 1 / 1440,
+    "hour": 1 / 24, "hr": 1 / 24, "jam": 1 / 24,
+    "day": 1, "hari": 1,
+    "week": 7, "minggu": 7,
+    "month": 30, "bulan": 30,
+}
+TODAY_WORDS = ("just posted", "today", "hari ini", "baru saja", "active today")
+REMOTE = re.compile(r"\b(remote|wfh|work from home|kerja dari rumah|anywhere)\b", re.IGNORECASE)
+YESTERDAY_WORDS = ("yesterday", "kemarin")
+
+
+class JobSource(str, Enum):
+    """The site a posting was scraped from."""
+
+    LINKEDIN = "LinkedIn"
+    INDEED = "Indeed"
+    GLINTS = "Glints"
+    OTHER = "Other"
+
+    @classmethod
+    def _missing_(cls, value):
+        # Platform names are matched case-insensitively; sites added by spec map to
+        # OTHER, and JobRecord.platform keeps their name
+        if isinstance(value, str):
+            for source in cls:
+                if source.value.lower() == value.lower():
+                    return source
+        return cls.OTHER
+
+
+def clean_text(value: Any) -> str | None:
+    """Collapses whitespace and maps placeholders such as "N/A" to None."""
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    return None if text.lower() in MISSING_VALUES else text
+
+def normalize_location(value: Any) -> str | None:
+    """Whitespace-normalized "Area, City, Region" with empty parts dropped."""
+    text = clean_text(value)
+    if text is None:
+        return None
+    parts = [part.strip() for part in text.split(",")]
+    return ", ".join(part for part in parts if part) or None
+
+def parse_date(value: Any, now: datetime | None = None) -> datetime | None:
+    """
+    Parses a posting date: datetimes, ISO strings, or relative text such as
+    "3 days ago", "30+ days ago", "Just posted" or "2 hari yang lalu".
+    Returns a UTC datetime, or None when the value says nothing usable.
+    """
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    text = clean_text(value)
+    if text is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    except ValueError:
+        pass
+
+    # Relative dates are coarse anyway; whole seconds survive MongoDB's millisecond dates unchanged
+    now = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+    lowered = text.lower()
+    if any(word in lowered for word in TODAY_WORDS):
+        return now
+    if any(word in lowered for word in YESTERDAY_WORDS):
+        return now - timedelta(days=1)
+    match = RELATIVE_DATE.search(lowered)
+    if match:
+        count = match.group("count")
+        count = 1 if count in ("a", "an", "se") else int(count)
+        return now - timedelta(days=count * UNIT_DAYS[match.group("unit")])
+    return None
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """
+    One job posting, as every scraper emits it and every store reads it.
+
+    Slots keep a record far smaller than the equivalent dict, and repeated
+    strings (companies, locations) are interned so a large batch shares them.
+    `description` is None until the detail page has been scraped. `platform`
+    is the site's own name, which differs from `source` for sites added by
+    an extraction spec (source OTHER).
+    """
+
+    url: str
+    title: str
+    source: JobSource
+    company: str | None = None
+    location: str | None = None
+    date_posted: datetime | None = None
+    description: str | None = None
+    platform: str | None = None
+
+    @classmethod
+    def create(cls, url: str, title: Any, source: Any, company: Any = None, location: Any = None, date_posted: Any = None, description: Any = None) -> "JobRecord":
+        """Builds a record from raw scraped values, normalizing each field."""
+        company = clean_text(company)
+        location = normalize_location(location)
+        description = description.strip() if isinstance(description, str) else None
+        platform = source.value if isinstance(source, JobSource) else clean_text(source)
+        source = JobSource(source)
+        if source is not JobSource.OTHER:
+            platform = source.value
+        return cls(
+            url=url,
+            title=clean_text(title) or "",
+            source=source,
+            company=sys.intern(company) if company else None,
+            location=sys.intern(location) if location else None,
+            date_posted=parse_date(date_posted),
+            description=description if description and description not in PLACEHOLDER_DESCRIPTIONS else None,
+            platform=sys.intern(platform) if platform else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobRecord":
+        """Reads a record from a Mongo document, a checkpoint row or a loose scraped dict."""
+        return cls.create(
+            data["url"], data.get("title"), data.get("platform") or data.get("source"), data.get("company"),
+            data.get("location"), data.get("date_posted"), data.get("description")
+        )
+
+    @property
+    def remote(self) -> bool:
+        """Whether the location or title says the job is remote."""
+        return bool(REMOTE.search(self.location or "") or REMOTE.search(self.title))
+
+    def to_mongo(self) -> Dict[str, Any]:
+        """
+        The document fields to store. A missing description is left out so an
+        upsert keeps the stored one.
+        """
+        document = {
+            "url": self.url,
+            "title": self.title,
+            "source": self.source.value,
+            "platform": self.platform,
+            "company": self.company,
+            "location": self.location,
+            "date_posted": self.date_posted,
+            "remote": self.remote,
+        }
+        if self.description is not None:
+            document["description"] = self.description
+        return document
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe form, for checkpoints and queues."""
+        document = self.to_mongo()
+        if self.date_posted is not None:
+            document["date_posted"] = self.date_posted.isoformat()
+        return document
+
+    @staticmethod
+    def to_dataframe(records: Iterable["JobRecord"]) -> pd.DataFrame:
+        names = [field.name for field in fields(JobRecord)]
+        rows = [[getattr(record, name) for name in names] for record in records]
+        df = pd.DataFrame(rows, columns=names)
+        # JobSource is a str subclass, so the column already holds the values
+        df["source"] = pd.Categorical(df["source"].astype(str), categories=[source.value for source in JobSource])
+        df["date_posted"] = pd.to_datetime(df["date_posted"], utc=True)
+        return df
+
+    @staticmethod
+    def from_dataframe(df: pd.DataFrame) -> List["JobRecord"]:
+        return [
+            JobRecord.from_dict({key: (None if pd.isna(value) else value) for key, value in row.items()})
+            for row in df.to_dict("records")
+        ]
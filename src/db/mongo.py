@@ -1,11 +1,72 @@
 import os
+import hashlib
 import logging
-from pymongo import MongoClient
+from datetime import datetime, timedelta, timezone
+from pymongo import MongoClient, UpdateOne, ASCENDING, DESCENDING, TEXT
+from pymongo.errors import BulkWriteError, OperationFailure, PyMongoError
+from bson import ObjectId
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+from src.db.job_record import JobRecord, PLACEHOLDER_DESCRIPTIONS, parse_date
 
 load_dotenv()
 
+# Indexes every collection is expected to have, keyed by collection name.
+# Each entry is (index name, key spec, extra create_index options).
+INDEXES = {
+    "jobs": [
+        ("url_unique", [("url", ASCENDING)], {"unique": True}),
+        ("source_date_posted", [("source", ASCENDING), ("date_posted", DESCENDING)], {}),
+        ("location_date_posted", [("location", ASCENDING), ("date_posted", DESCENDING)], {}),
+        ("date_posted_id", [("date_posted", DESCENDING), ("_id", DESCENDING)], {}),
+        ("content_changed_at", [("content_changed_at", DESCENDING)], {}),
+        # Listings show canonical jobs only, newest first: CANONICAL_ONLY is an
+        # equality on null, so pages are read off this index in sort order
+        ("canonical_date_posted", [("duplicate_of", ASCENDING), ("date_posted", DESCENDING), ("_id", DESCENDING)], {}),
+        # Titles and descriptions mix English and Indonesian, so words are not stemmed
+        ("text_search", [("title", TEXT), ("company", TEXT), ("description", TEXT)], {
+            "weights": {"title": 10, "company": 5, "description": 1},
+            "default_language": "none",
+        }),
+    ],
+    "resumes": [
+        ("job_id", [("job_id", ASCENDING)], {}),
+    ],
+}
+
+# Light columns for job listings; descriptions are loaded per job with get_job
+JOB_LIST_FIELDS = ["title", "company", "location", "source", "date_posted", "url"]
+
+# Jobs not merged into another one. Unlike {"$exists": False}, equality on
+# null (which also matches a missing field) has tight index bounds.
+CANONICAL_ONLY = {"duplicate_of": None}
+
+# Facets counted by search_jobs, each over the jobs matching the search
+SEARCH_FACETS = ["source", "location", "remote"]
+# What each facet counts, when not the field itself. Sources are counted by
+# platform name, so sites added by spec are not all lumped under "Other"; jobs
+# stored before platforms were recorded fall back to their source.
+FACET_VALUES = {
+    "source": {"$ifNull": ["$platform", "$source"]},
+    "remote": {"$ifNull": ["$remote", False]},
+}
+
+# Fields whose content makes a posting what it is; listing metadata such as
+# relative dates ("2 days ago") changes on every crawl and is left out
+CONTENT_HASH_FIELDS = ["title", "company", "location", "description"]
+# The content fields a listing carries without its detail page
+LISTING_CONTENT_FIELDS = ["title", "company", "location"]
+
+def content_hash(job: Dict[str, Any]) -> str:
+    """
+    Stable hash of a job's content fields, insensitive to whitespace changes.
+    """
+    digest = hashlib.sha256()
+    for field in CONTENT_HASH_FIELDS:
+        digest.update(" ".join(str(job.get(field) or "").split()).encode())
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
 class MongoDB:
     def __init__(self):
         self.uri = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
@@ -19,6 +80,91 @@ class MongoDB:
         except Exception as e:
             logging.error(f"Failed to connect to MongoDB: {e}")
             raise e
+        self.ensure_indexes()
+        self.migrate_date_posted()
+
+    def check_indexes(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Compares the indexes on each collection with `INDEXES`.
+
+        Returns, per collection, the names of indexes that are `missing`, that exist
+        with different keys or options (`mismatched`), and that are not declared at
+        all (`unexpected`).
+        """
+        report = {}
+        for collection_name, specs in INDEXES.items():
+            existing = self.db[collection_name].index_information()
+            drift = {"missing": [], "mismatched": [], "unexpected": []}
+            for name, keys, options in specs:
+                if name not in existing:
+                    drift["missing"].append(name)
+                    continue
+                info = existing[name]
+                if not self._same_keys(info, keys) or info.get("unique", False) != options.get("unique", False):
+                    drift["mismatched"].append(name)
+            declared = {name for name, _, _ in specs}
+            drift["unexpected"] = [name for name in existing if name != "_id_" and name not in declared]
+            report[collection_name] = drift
+        return report
+
+    @staticmethod
+    def _same_keys(info: Dict[str, Any], keys: List[Tuple[str, Any]]) -> bool:
+        if any(direction == TEXT for _, direction in keys):
+            # Text indexes report their fields as weights rather than keys
+            return set(info.get("weights", {})) == {field for field, _ in keys}
+        return [tuple(k) for k in info["key"]] == keys
+
+    def ensure_indexes(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Creates missing indexes and logs any drift from `INDEXES`.
+
+        Mismatched indexes are reported but never dropped automatically. Returns the
+        drift report taken before the missing indexes were created.
+        """
+        report = self.check_indexes()
+        for collection_name, drift in report.items():
+            if drift["mismatched"]:
+                logging.warning(f"Index drift on '{collection_name}', definitions differ: {drift['mismatched']}")
+            if drift["unexpected"]:
+                logging.warning(f"Index drift on '{collection_name}', undeclared indexes: {drift['unexpected']}")
+
+            for name, keys, options in INDEXES[collection_name]:
+                if name not in drift["missing"]:
+                    continue
+                try:
+                    self.db[collection_name].create_index(keys, name=name, **options)
+                    logging.info(f"Created index '{name}' on '{collection_name}'")
+                except OperationFailure as e:
+                    # A unique index cannot be built while duplicates are stored
+                    logging.error(f"Could not create index '{name}' on '{collection_name}': {e}")
+        return report
+
+    def migrate_date_posted(self, chunk_size: int = 1000) -> int:
+        """
+        Converts posting dates stored as text by scrapers older than JobRecord
+        ("2 days ago", ISO strings) into datetimes, read relative to when the
+        job was last seen. Text that says nothing usable is cleared. Finds the
+        rows through the date_posted index, so once migrated this costs one
+        empty index lookup. Returns how many jobs were converted.
+        """
+        cursor = self.jobs_collection.find(
+            {"date_posted": {"$type": "string"}},
+            {"_id": 1, "date_posted": 1, "last_seen": 1, "first_seen": 1}
+        )
+        operations, migrated = [], 0
+        for job in cursor:
+            seen = job.get("last_seen") or job.get("first_seen")
+            if seen is not None and seen.tzinfo is None:
+                seen = seen.replace(tzinfo=timezone.utc)
+            operations.append(UpdateOne({"_id": job["_id"]}, {"$set": {"date_posted": parse_date(job["date_posted"], now=seen)}}))
+            if len(operations) >= chunk_size:
+                migrated += self.jobs_collection.bulk_write(operations, ordered=False).modified_count
+                operations = []
+        if operations:
+            migrated += self.jobs_collection.bulk_write(operations, ordered=False).modified_count
+        if migrated:
+            logging.info(f"Converted {migrated} text posting dates to datetimes")
+        return migrated
 
     def save_job(self, job_data: Dict[str, Any]):
         """Saves a single job to the database. Avoids duplicates based on URL."""
@@ -31,10 +177,222 @@ class MongoDB:
         except Exception as e:
             logging.error(f"Error saving job: {e}")
 
-    def save_jobs(self, jobs: List[Dict[str, Any]]):
-        """Saves a list of jobs."""
+    def save_jobs(self, jobs: List[JobRecord | Dict[str, Any]], chunk_size: int = 1000) -> Dict[str, Any]:
+        """
+        Saves a list of jobs (JobRecords or plain dicts) with unordered bulk
+        upserts keyed on URL.
+
+        Jobs with a description carry a `content_hash`; when it matches the stored
+        one, only their timestamps and listing metadata are refreshed instead of
+        rewriting the description. Jobs without one whose title, company or location
+        changed get a new hash and `content_changed_at`, so changed_since still
+        sees them. Jobs are sent in chunks of `chunk_size`. Returns a
+        summary with `inserted`, `updated`, `unchanged` and `failed` counts and an
+        `errors` list holding the URL and server message of every job that could
+        not be written.
+        """
+        summary = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0, "errors": []}
+        now = datetime.now(timezone.utc)
+
+        # Collapse duplicate URLs so one bulk never upserts the same document twice
+        jobs_by_url = {}
         for job in jobs:
-            self.save_job(job)
+            if isinstance(job, JobRecord):
+                job = job.to_mongo()
+            url = job.get("url")
+            if not url:
+                summary["failed"] += 1
+                summary["errors"].append({"url": None, "title": job.get("title"), "error": "Job has no url"})
+                continue
+            jobs_by_url[url] = job
+
+        urls = list(jobs_by_url)
+        for start in range(0, len(urls), chunk_size):
+            chunk_urls = urls[start:start + chunk_size]
+            # Jobs of this chunk not yet counted, for when a write fails outright
+            pending_urls = chunk_urls
+            try:
+                stored = self._stored_listings(chunk_urls)
+                updates, unchanged_urls, relisted = {}, [], []
+                for url in chunk_urls:
+                    update = self._job_update(jobs_by_url[url], now)
+                    new_hash = update["$set"].get("content_hash")
+                    if new_hash is not None:
+                        if url in stored and stored[url].get("content_hash") == new_hash:
+                            unchanged_urls.append(url)
+                            continue
+                    elif url in stored and self._listing_changed(stored[url], update["$set"]):
+                        relisted.append(url)
+                    updates[url] = update
+                if relisted:
+                    self._rehash_relisted(relisted, stored, updates, now)
+
+                if unchanged_urls:
+                    refreshes = [UpdateOne({"url": url}, self._refresh_update(jobs_by_url[url], now)) for url in unchanged_urls]
+                    self._bulk_write(refreshes, unchanged_urls, jobs_by_url, summary, unchanged=True)
+                pending_urls = list(updates)
+                if updates:
+                    operations = [UpdateOne({"url": url}, update, upsert=True) for url, update in updates.items()]
+                    self._bulk_write(operations, list(updates), jobs_by_url, summary)
+            except PyMongoError as e:
+                logging.error(f"Bulk write failed for {len(pending_urls)} jobs: {e}")
+                summary["failed"] += len(pending_urls)
+                summary["errors"].extend(
+                    {"url": url, "title": jobs_by_url[url].get("title"), "error": str(e)}
+                    for url in pending_urls
+                )
+
+        logging.info(
+            f"Saved jobs: {summary['inserted']} inserted, {summary['updated']} updated, "
+            f"{summary['unchanged']} unchanged, {summary['failed']} failed"
+        )
+        return summary
+
+    @staticmethod
+    def _job_update(job: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """
+        Builds the upsert for one job, stamping when it was first and last seen.
+
+        Jobs listed without a description (skipped by an incremental crawl, or
+        whose detail page failed) only refresh their listing fields, keeping the
+        stored description; save_jobs rehashes them when a listing field changed.
+        Jobs with one get a `content_hash` and `content_changed_at`; save_jobs
+        only sends this update when the hash differs from the stored one.
+        """
+        fields = dict(job)
+        fields["last_seen"] = now
+        on_insert = {"first_seen": now}
+        if not fields.get("description") or fields["description"] in PLACEHOLDER_DESCRIPTIONS:
+            fields.pop("description", None)
+            on_insert["content_changed_at"] = now
+        else:
+            fields["description_scraped_at"] = now
+            fields["content_hash"] = content_hash(fields)
+            fields["content_changed_at"] = now
+        return {"$set": fields, "$setOnInsert": on_insert}
+
+    @staticmethod
+    def _refresh_update(job: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """
+        Update for a job whose content hash is unchanged: its listing metadata
+        (source, posting date, remote flag, ...) is still refreshed, so fields
+        added to the schema later reach rows stored before them.
+        """
+        fields = {key: value for key, value in job.items() if key not in CONTENT_HASH_FIELDS}
+        fields["last_seen"] = now
+        fields["description_scraped_at"] = now
+        return {"$set": fields}
+
+    def _bulk_write(self, operations: List[UpdateOne], urls: List[str], jobs_by_url: Dict[str, Dict[str, Any]], summary: Dict[str, Any], unchanged: bool = False):
+        """
+        Sends one unordered bulk and folds its counts into `summary`, recording
+        each failed write. Matches of an `unchanged` bulk count as unchanged.
+        """
+        try:
+            result = self.jobs_collection.bulk_write(operations, ordered=False).bulk_api_result
+        except BulkWriteError as e:
+            # Unordered bulks keep going past failures, so count what did land
+            result = e.details
+            for write_error in e.details.get("writeErrors", []):
+                url = urls[write_error["index"]]
+                summary["failed"] += 1
+                summary["errors"].append({
+                    "url": url,
+                    "title": jobs_by_url[url].get("title"),
+                    "error": write_error.get("errmsg", "Unknown write error"),
+                })
+        if unchanged:
+            summary["unchanged"] += result.get("nMatched", 0)
+        else:
+            self._add_bulk_counts(summary, result)
+
+    def _stored_listings(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Returns the stored content hash and listing fields of each of `urls` already stored."""
+        cursor = self.jobs_collection.find(
+            {"url": {"$in": urls}},
+            {"_id": 0, "url": 1, "content_hash": 1, **{field: 1 for field in LISTING_CONTENT_FIELDS}}
+        )
+        return {job["url"]: job for job in cursor}
+
+    @staticmethod
+    def _listing_changed(stored: Dict[str, Any], fields: Dict[str, Any]) -> bool:
+        """Whether a listing-only update changes any content field it carries."""
+        return any(
+            field in fields and " ".join(str(fields[field] or "").split()) != " ".join(str(stored.get(field) or "").split())
+            for field in LISTING_CONTENT_FIELDS
+        )
+
+    def _rehash_relisted(self, urls: List[str], stored: Dict[str, Dict[str, Any]], updates: Dict[str, Dict[str, Any]], now: datetime):
+        """
+        Marks listing-only updates that changed a title, company or location as
+        content changes, hashing the new listing fields with the stored description.
+        """
+        cursor = self.jobs_collection.find({"url": {"$in": urls}}, {"_id": 0, "url": 1, "description": 1})
+        descriptions = {job["url"]: job.get("description") for job in cursor}
+        for url in urls:
+            fields = updates[url]["$set"]
+            fields["content_hash"] = content_hash({**stored[url], **fields, "description": descriptions.get(url)})
+            fields["content_changed_at"] = now
+            # MongoDB rejects an update naming one path in both $set and $setOnInsert
+            updates[url]["$setOnInsert"].pop("content_changed_at", None)
+
+    def changed_since(self, since: datetime, fields: List[str] | None = None, filter_query: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Streams the jobs first stored or whose content changed at or after
+        `since`, oldest change first, so later stages only process what changed.
+        """
+        query = {**(filter_query or {}), "content_changed_at": {"$gte": since}}
+        projection = {field: 1 for field in fields} if fields else None
+        yield from self.jobs_collection.find(query, projection).sort("content_changed_at", ASCENDING)
+
+    def find_fresh_urls(self, urls: List[str], ttl: timedelta) -> Set[str]:
+        """
+        Returns the URLs among `urls` whose description was scraped within `ttl`,
+        i.e. the ones an incremental crawl does not need to fetch again.
+        """
+        if not urls:
+            return set()
+        cursor = self.jobs_collection.find(
+            {
+                "url": {"$in": urls},
+                "description_scraped_at": {"$gte": datetime.now(timezone.utc) - ttl},
+                "description": {"$nin": list(PLACEHOLDER_DESCRIPTIONS)},
+            },
+            {"_id": 0, "url": 1}
+        )
+        return {job["url"] for job in cursor}
+
+    @staticmethod
+    def _add_bulk_counts(summary: Dict[str, Any], bulk_result: Dict[str, Any]):
+        """Adds the upsert/match counts of a bulk_write result to a save summary."""
+        summary["inserted"] += bulk_result.get("nUpserted", 0)
+        summary["updated"] += bulk_result.get("nMatched", 0)
+
+    def save_duplicate_clusters(self, clusters: List[Dict[str, Any]], chunk_size: int = 1000):
+        """
+        Records near-duplicate clusters on the jobs themselves.
+
+        The canonical job of each cluster gets `sources`, the source and URL of
+        every posting in it; the others get `duplicate_of` set to its URL. Marks
+        left by an earlier run on jobs no longer clustered are removed.
+        """
+        run_id = ObjectId()
+        operations = []
+        for cluster in clusters:
+            canonical = cluster["canonical_url"]
+            for posting in cluster["sources"]:
+                if posting["url"] == canonical:
+                    update = {"$set": {"sources": cluster["sources"], "dedup_run": run_id}, "$unset": {"duplicate_of": ""}}
+                else:
+                    update = {"$set": {"duplicate_of": canonical, "dedup_run": run_id}, "$unset": {"sources": ""}}
+                operations.append(UpdateOne({"url": posting["url"]}, update))
+
+        for start in range(0, len(operations), chunk_size):
+            self.jobs_collection.bulk_write(operations[start:start + chunk_size], ordered=False)
+        self.jobs_collection.update_many(
+            {"dedup_run": {"$ne": run_id}, "$or": [{"duplicate_of": {"$exists": True}}, {"sources": {"$exists": True}}]},
+            {"$unset": {"duplicate_of": "", "sources": "", "dedup_run": ""}}
+        )
 
     def get_jobs(self, filter_query: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Retrieves jobs based on a filter."""
@@ -42,10 +400,182 @@ class MongoDB:
             filter_query = {}
         return list(self.jobs_collection.find(filter_query, {"_id": 0}))
 
+    def find_jobs(
+            self,
+            filter_query: Dict[str, Any] = None,
+            fields: List[str] | None = None,
+            sort_field: str = "_id",
+            limit: int = 50,
+            after: Dict[str, Any] | None = None
+            ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Retrieves one page of jobs, newest first, using keyset pagination.
+
+        Jobs are sorted by `sort_field` then `_id`, both descending. Pass the cursor
+        returned with a page as `after` to get the next one. Only `fields` (plus
+        `_id` and `sort_field`, which the cursor is built from) are projected when
+        given. Returns the page and the next cursor, which is None on the last page.
+        """
+        query = dict(filter_query or {})
+        if after is not None:
+            query = {"$and": [query, self._keyset_condition(sort_field, after)]}
+
+        projection = {field: 1 for field in [*fields, sort_field]} if fields else None
+        sort = [("_id", DESCENDING)] if sort_field == "_id" else [(sort_field, DESCENDING), ("_id", DESCENDING)]
+
+        # Fetch one extra document to know whether another page exists
+        jobs = list(self.jobs_collection.find(query, projection).sort(sort).limit(limit + 1))
+        if len(jobs) <= limit:
+            return jobs, None
+        jobs = jobs[:limit]
+        last = jobs[-1]
+        return jobs, {"_id": last["_id"], sort_field: last.get(sort_field)}
+
+    def search_jobs(
+            self,
+            text: str | None = None,
+            sources: List[str] | None = None,
+            locations: List[str] | None = None,
+            posted_after: datetime | None = None,
+            posted_before: datetime | None = None,
+            remote: bool | None = None,
+            fields: List[str] | None = None,
+            limit: int = 50,
+            skip: int = 0,
+            facet_limit: int = 20,
+            after: Dict[str, Any] | None = None
+            ) -> Dict[str, Any]:
+        """
+        Full-text search with facet filters: one query for the page of jobs
+        and one aggregation for the total and facet counts.
+
+        `text` goes through the text index on title, company and description
+        (MongoDB $text syntax: "quoted phrases", -excluded words) and results
+        are ranked by relevance; without text they are newest first. Filters
+        combine with AND, and postings merged into another job are left out.
+        `sources` are platform names, so sites added by spec can be selected.
+
+        Returns {"jobs", "total", "facets", "next"}, where "facets" maps each
+        of SEARCH_FACETS to up to `facet_limit` {"value", "count"} buckets over
+        the matching jobs, largest first, and "next" is the cursor to pass as
+        `after` for the following page (None on the last one). Without text
+        the cursor is a keyset, so deep pages cost no more than the first.
+        """
+        match: Dict[str, Any] = dict(CANONICAL_ONLY)
+        if text:
+            match["$text"] = {"$search": text}
+        if sources:
+            match["$or"] = [{"platform": {"$in": sources}}, {"platform": None, "source": {"$in": sources}}]
+        if locations:
+            match["location"] = {"$in": locations}
+        if posted_after or posted_before:
+            match["date_posted"] = {op: value for op, value in (("$gte", posted_after), ("$lt", posted_before)) if value}
+        if remote is not None:
+            # Jobs stored before `remote` was recorded count as on-site
+            match["remote"] = True if remote else {"$ne": True}
+
+        # The page is its own query, so without text it walks canonical_date_posted
+        # in sort order and stops after `limit` documents instead of sorting every match
+        projection = {field: 1 for field in [*(fields or JOB_LIST_FIELDS), "date_posted"]}
+        page_query = match
+        if text:
+            # Relevance is not stored, so text results page by offset
+            skip = after["skip"] if after else skip
+            projection["score"] = {"$meta": "textScore"}
+            sort = [("score", {"$meta": "textScore"}), ("_id", DESCENDING)]
+        else:
+            if after is not None:
+                page_query = {"$and": [match, self._keyset_condition("date_posted", after)]}
+                skip = 0
+            sort = [("date_posted", DESCENDING), ("_id", DESCENDING)]
+        # One extra document tells whether another page exists
+        jobs = list(self.jobs_collection.find(page_query, projection).sort(sort).skip(skip).limit(limit + 1)) if limit > 0 else []
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            last = jobs[-1]
+            next_cursor = {"skip": skip + limit} if text else {"_id": last["_id"], "date_posted": last.get("date_posted")}
+
+        facets = {
+            name: [
+                {"$group": {"_id": FACET_VALUES.get(name, f"${name}"), "count": {"$sum": 1}}},
+                # Ties broken by value so counts list in a stable order
+                {"$sort": {"count": DESCENDING, "_id": ASCENDING}},
+                {"$limit": facet_limit},
+            ]
+            for name in SEARCH_FACETS
+        }
+        pipeline = [
+            {"$match": match},
+            # Only the faceted fields reach the facet stage
+            {"$project": {"_id": 0, **{field: 1 for field in {*SEARCH_FACETS, "platform"}}}},
+            {"$facet": {"total": [{"$count": "count"}], **facets}},
+        ]
+        result = next(self.jobs_collection.aggregate(pipeline))
+        return {
+            "jobs": jobs,
+            "next": next_cursor,
+            "total": result["total"][0]["count"] if result["total"] else 0,
+            "facets": {
+                name: [{"value": bucket["_id"], "count": bucket["count"]} for bucket in result[name]]
+                for name in SEARCH_FACETS
+            },
+        }
+
+    @staticmethod
+    def _keyset_condition(sort_field: str, after: Dict[str, Any]) -> Dict[str, Any]:
+        """Builds the filter selecting documents that sort after the `after` cursor."""
+        if sort_field == "_id":
+            return {"_id": {"$lt": after["_id"]}}
+        value = after.get(sort_field)
+        if value is None:
+            # Missing values sort last in descending order, so only _id can advance
+            return {sort_field: None, "_id": {"$lt": after["_id"]}}
+        return {"$or": [
+            {sort_field: {"$lt": value}},
+            {sort_field: value, "_id": {"$lt": after["_id"]}},
+            {sort_field: None},
+        ]}
+
+    def iter_job_batches(
+            self,
+            filter_query: Dict[str, Any] = None,
+            fields: List[str] | None = None,
+            batch_size: int = 500
+            ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Streams jobs matching a filter as lists of up to `batch_size` documents.
+
+        The cursor fetches the same number of documents per round trip, so memory
+        stays bounded by one batch regardless of collection size.
+        """
+        projection = {field: 1 for field in fields} if fields else None
+        cursor = self.jobs_collection.find(filter_query or {}, projection, batch_size=batch_size)
+        batch = []
+        for job in cursor:
+            batch.append(job)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def get_job(self, url: str, fields: List[str] | None = None) -> Optional[Dict[str, Any]]:
+        """Retrieves a single job by URL, including its description unless `fields` is given."""
+        projection = {field: 1 for field in fields} if fields else {}
+        projection["_id"] = 0
+        return self.jobs_collection.find_one({"url": url}, projection)
+
+    def count_jobs(self, filter_query: Dict[str, Any] = None) -> int:
+        """Counts jobs matching a filter, using collection metadata when unfiltered."""
+        if not filter_query:
+            return self.jobs_collection.estimated_document_count()
+        return self.jobs_collection.count_documents(filter_query)
+
     def save_resume(self, resume_data: Dict[str, Any]):
-        """Saves a generated resume."""
+        """Saves a generated resume, replacing any earlier one for the same `job_id`."""
         try:
-            self.resumes_collection.insert_one(resume_data)
+            self.resumes_collection.replace_one({"job_id": resume_data["job_id"]}, resume_data, upsert=True)
             logging.info("Saved resume.")
         except Exception as e:
             logging.error(f"Error saving resume: {e}")
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from typing import List, Dict, Any, Callable
+from src.db.mongo import MongoDB
+from src.db.job_record import JobRecord
+from src.utils.description_compactor import DescriptionCompactor
+from src.utils.job_index import JobIndex
+
+class BatchingSink:
+    """
+    Buffers scraped jobs and writes them to MongoDB in batches while a crawl runs.
+
+    The buffer is flushed whenever it reaches `batch_size` jobs and on a timer
+    every `flush_interval` seconds, so slow crawls still save progress. Writes run in a thread
+    so the crawl's event loop keeps going. Use it as an async context manager
+    so the last partial batch is flushed on exit.
+
+    With a `compactor`, descriptions are compacted in the same thread just
+    before saving, so they are stored already trimmed to its token budget.
+    With an `index`, saved jobs are added to it in the same thread.
+    """
+
+    def __init__(self, db: MongoDB, batch_size: int = 100, flush_interval: float = 5.0, on_flush: Callable[[Dict[str, Any]], None] | None = None, compactor: DescriptionCompactor | None = None, index: JobIndex | None = None):
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_flush = on_flush
+        self.compactor = compactor
+        self.index = index
+        self.buffer = []
+        self.received = 0
+        self.summary = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": 0, "tokens_saved": 0, "errors": []}
+        self._flush_lock = asyncio.Lock()
+        self._timer = None
+
+    async def __aenter__(self):
+        self._timer = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._timer.cancel()
+        await asyncio.gather(self._timer, return_exceptions=True)
+        await self.flush()
+
+    async def add(self, job: JobRecord):
+        self.buffer.append(job)
+        self.received += 1
+        if len(self.buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        """Writes the buffered jobs and folds the result into `summary`."""
+        async with self._flush_lock:
+            batch, self.buffer = self.buffer, []
+            if not batch:
+                return
+            try:
+                result = await asyncio.to_thread(self._save, batch)
+            except Exception as e:
+                logging.error(f"Failed to flush {len(batch)} jobs: {e}")
+                result = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": len(batch), "errors": [{"url": job.url, "title": job.title, "error": str(e)} for job in batch]}
+            for key in ("inserted", "updated", "unchanged", "failed"):
+                self.summary[key] += result[key]
+            self.summary["tokens_saved"] += result.get("tokens_saved", 0)
+            self.summary["errors"].extend(result["errors"])
+            if self.on_flush:
+                self.on_flush(self.summary)
+
+    def _save(self, batch: List[JobRecord]) -> Dict[str, Any]:
+        tokens_saved = sum(self.compactor.compact_job(job) for job in batch) if self.compactor else 0
+        result = self.db.save_jobs(batch)
+        if self.index is not None:
+            try:
+                self.index.add(batch)
+            except Exception as e:
+                # The index can be rebuilt from MongoDB, so a failure here never loses jobs
+                logging.error(f"Failed to index {len(batch)} jobs: {e}")
+        return {**result, "tokens_saved": tokens_saved}
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
@@ -1,18 +1,36 @@
 import os
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import List, Dict, Any, AsyncIterator
+import openai
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.caches import BaseCache
+from langchain_core.language_models import BaseChatModel
 
 from src.prompts.resume_optimizer_prompt import RESUME_OPTIMIZER_SYSTEM_PROMPT, RESUME_OPTIMIZER_USER_PROMPT
+from src.utils.llm_cache import LLMCache
+from src.db.mongo import MongoDB
+from src.scrapers.retry import RetryPolicy
+from src.scrapers.rate_limiter import parse_retry_after
+
+# OpenAI errors worth another attempt; anything else fails the job at once
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)
 
 class ResumeOptimizer:
-    def __init__(self, model_name="gpt-4o-mini"):
-        # Allow overriding model via env or init
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not found in environment variables.")
-        
-        self.llm = ChatOpenAI(model=model_name, temperature=0.7)
+    def __init__(self, model_name="gpt-4o-mini", cache: BaseCache | None = None, llm: BaseChatModel | None = None, retry_policy: RetryPolicy | None = None):
+        # Identical resume/job pairs are answered from the cache instead of the API
+        self.cache = cache if cache is not None else LLMCache()
+        if llm is None:
+            # Allow overriding model via env or init
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                raise ValueError("OPENAI_API_KEY not found in environment variables.")
+            llm = ChatOpenAI(model=model_name, temperature=0.7)
+        self.llm = llm.model_copy(update={"cache": self.cache})
+        self.retry_policy = retry_policy or RetryPolicy()
         
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", RESUME_OPTIMIZER_SYSTEM_PROMPT),
@@ -21,6 +39,10 @@ class ResumeOptimizer:
         
         self.chain = self.prompt | self.llm | StrOutputParser()
 
+    def cache_stats(self) -> Dict[str, Any] | None:
+        """Hits, misses and hit rate of the LLM cache, or None when the cache keeps no stats."""
+        return self.cache.stats() if isinstance(self.cache, LLMCache) else None
+
     def optimize(self, base_resume: str, job_description: str) -> str:
         """
         Optimizes the resume for the given job description.
@@ -29,3 +51,57 @@ class ResumeOptimizer:
             "base_resume": base_resume,
             "job_description": job_description
         })
+
+    async def aoptimize(self, base_resume: str, job_description: str) -> str:
+        """
+        Async version of `optimize`, retrying rate limits and transient API
+        errors with backoff (at least as long as the API's Retry-After).
+        """
+        inputs = {"base_resume": base_resume, "job_description": job_description}
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            try:
+                return await self.chain.ainvoke(inputs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.retry_policy.max_attempts:
+                    raise
+                response = getattr(e, "response", None)
+                retry_after = parse_retry_after(response.headers.get("retry-after")) if response is not None else None
+                delay = max(retry_after or 0.0, self.retry_policy.delay(attempt))
+                logging.info(f"Resume optimization hit {type(e).__name__}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def optimize_many(self, base_resume: str, jobs: List[Dict[str, Any]], max_concurrency: int = 5, db: MongoDB | None = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Optimizes the resume for many jobs (dicts with `url` and `description`),
+        at most `max_concurrency` calls at a time, yielding each result as soon
+        as it is ready: {"job_id", "resume"}, or {"job_id", "error"} when a job
+        failed every attempt. The job's URL is its `job_id`; with `db`, each
+        resume is also saved through `MongoDB.save_resume`. The cache's hit
+        rate is logged once every job is done.
+        """
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def run(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with slots:
+                try:
+                    resume = await self.aoptimize(base_resume, job["description"])
+                except Exception as e:
+                    logging.error(f"Resume optimization failed for {job['url']}: {e}")
+                    return {"job_id": job["url"], "error": str(e)}
+            result = {"job_id": job["url"], "resume": resume}
+            if db is not None:
+                # pymongo is blocking, so the save runs off the event loop
+                await asyncio.to_thread(db.save_resume, {**result, "created_at": datetime.now(timezone.utc)})
+            return result
+
+        tasks = [asyncio.create_task(run(job)) for job in jobs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # A consumer that stops early cancels the calls still running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if isinstance(self.cache, LLMCache):
+                self.cache.log_stats("Resume optimizer")
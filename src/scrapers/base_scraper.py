@@ -1,36 +1,128 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright, BrowserContext
+from typing import List, AsyncIterator, Callable, Set, Tuple
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 from dotenv import load_dotenv, find_dotenv
-from src.scrapers.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
+from src.scrapers.resource_policy import ResourcePolicy
+from src.scrapers.http_fetcher import HybridFetcher
+from src.scrapers.session_store import SessionStore
+from src.scrapers.pagination import AdaptiveTimeout, load_more_results
+from src.scrapers.checkpoint import PlatformProgress
+from src.scrapers.rate_limiter import RateLimit, DomainRateLimiter, RateLimited, THROTTLE_STATUS_CODES, DEFAULT_BLOCK_MARKERS
+from src.scrapers.retry import FetchError, DescriptionNotFound, RetryPolicy
+from src.scrapers.dead_letters import DeadLetterQueue
+from src.scrapers.spec import DescriptionRule, ExtractionSpec
+from src.db.job_record import JobRecord
 
 load_dotenv(find_dotenv())
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Reads every job card not yet marked as scraped in one browser round trip and
+# marks it, so later scroll iterations only return cards added since. Cards
+# without a link yet (still rendering) are left unmarked to be read again.
+EXTRACT_CARDS_JS = """
+(config) => {
+    const text = (card, selector) => {
+        const element = selector ? card.querySelector(selector) : null;
+        return element ? element.innerText.trim() : null;
+    };
+    const cards = document.querySelectorAll(`${config.card}:not([${config.marker}])`);
+    const jobs = [];
+    for (const card of cards) {
+        const link = config.link ? card.querySelector(config.link) : card;
+        const href = link ? link.getAttribute("href") : null;
+        if (!href) continue;
+        card.setAttribute(config.marker, "");
+        const dateElement = config.date ? card.querySelector(config.date) : null;
+        jobs.push({
+            href: href,
+            title: text(card, config.title) || card.innerText.trim().split("\\n")[0],
+            company: text(card, config.company),
+            location: text(card, config.location),
+            date_posted: dateElement
+                ? (config.dateAttribute ? dateElement.getAttribute(config.dateAttribute) : dateElement.innerText.trim())
+                : null
+        });
+    }
+    return jobs;
+}
+"""
+SCRAPED_ATTRIBUTE = "data-job-scraped"
+
 class BaseScraper(ABC):
     def __init__(self):
         pass
 
+    def scrape(self, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None) -> List[JobRecord]:
+        """
+        Synchronous wrapper for the async scraping logic.
+        """
+        return asyncio.run(self.scrape_async(job_titles, locations, remote_only, limit))
+
+    async def scrape_async(self, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None, browser: Browser | None = None, known_urls: Callable[[List[str]], Set[str]] | None = None, progress: PlatformProgress | None = None) -> List[JobRecord]:
+        """
+        Collects everything `stream` yields into a list.
+        """
+        return [job async for job in self.stream(job_titles, locations, remote_only, limit, browser, known_urls, progress)]
+
     @abstractmethod
-    def scrape(self, job_titles: List[str], locations: List[str], remote_only: bool) -> List[Dict[str, Any]]:
+    def stream(self, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None, browser: Browser | None = None, known_urls: Callable[[List[str]], Set[str]] | None = None, progress: PlatformProgress | None = None) -> AsyncIterator[JobRecord]:
         """
-        Scrapes jobs based on the provided criteria.
+        Scrapes jobs based on the provided criteria, yielding each job as soon as
+        it is complete.
         
         Args:
             job_titles: List of job titles to search for.
             locations: List of locations to search in.
             remote_only: Boolean indicating if only remote jobs should be scraped.
+            limit: Optional maximum number of jobs to yield.
+            browser: Shared browser to open this scraper's context in. When None,
+                the scraper launches and closes its own browser.
+            known_urls: Optional lookup returning which of the given URLs already
+                have fresh details stored; those are not fetched again.
+            progress: Optional checkpoint slice to record progress in. If it
+                holds progress from an interrupted run, the crawl resumes from it.
             
-        Returns:
-            A list of dictionaries, where each dictionary represents a job.
-            Expected keys: title, company, location, description, url, source, date_posted.
+        Yields:
+            A JobRecord per job; its description is None when it was not fetched.
         """
         pass
 
 
-class Scraper(ABC):
+class CrawlState:
+    """
+    Per-run state shared by a scraper's search tasks and detail workers.
+    """
+
+    def __init__(self, limit_per_search: int, known_urls: Callable[[List[str]], Set[str]] | None = None, progress: PlatformProgress | None = None):
+        self.queue = asyncio.Queue()
+        self.seen_urls = progress.seen_urls() if progress else set()
+        # Finished jobs, read by `Scraper.stream`; None marks the end of the run
+        self.output = asyncio.Queue()
+        self.limit_per_search = limit_per_search
+        # Returns the URLs whose stored details are fresh enough to skip
+        self.known_urls = known_urls
+        self.fetcher: HybridFetcher | None = None
+        self.rate_limiter: DomainRateLimiter | None = None
+        self.progress = progress
+        # Dead-lettered jobs queued again this run
+        self.redriven_urls: Set[str] = set()
+
+
+class Scraper(BaseScraper):
+    """
+    Producer/consumer scraper driven by selector configuration.
+
+    Every title x location search runs in its own tab and feeds job cards into an
+    asyncio.Queue; a pool of workers opens each job's detail page to fetch the
+    full description, paced per domain by `rate_limit`. A platform is usually
+    described by an ExtractionSpec (see `from_spec`); only platforms that need
+    an account subclass it, to set `requires_login` and implement `login` and
+    `is_logged_in`.
+    """
+
     def __init__(
             self, 
             base_url: str, 
@@ -43,8 +135,24 @@ class Scraper(ABC):
             company_name_class: str,
             location_class: str,
             date_posted_class: str | None = None,
-            pagination_next_button_class: str | None = None
+            pagination_next_button_class: str | None = None,
+            job_link_class: str | None = None,
+            date_posted_attribute: str | None = None,
+            remote_query: str = "",
+            headless: bool = True,
+            num_workers: int = 5,
+            max_parallel_searches: int = 3,
+            resource_policy: ResourcePolicy | None = None,
+            description_marker: str | None = None,
+            requires_login: bool = False,
+            session_store: SessionStore | None = None,
+            rate_limit: RateLimit | None = None,
+            block_markers: Tuple[str, ...] = DEFAULT_BLOCK_MARKERS,
+            retry_policy: RetryPolicy | None = None,
+            dead_letters: DeadLetterQueue | None = None,
+            description_rule: DescriptionRule | None = None
             ):
+        super().__init__()
         self.base_url = base_url
         self.platform_name = platform_name
         self.search_page_url = search_page_url
@@ -56,176 +164,394 @@ class Scraper(ABC):
         self.location_class = location_class
         self.date_posted_class = date_posted_class
         self.pagination_next_button_class = pagination_next_button_class
+        # Selector of the job link inside a card; None when the card itself is the link
+        self.job_link_class = job_link_class
+        # Attribute holding the posting date (e.g. "datetime" on <time>); None reads the text
+        self.date_posted_attribute = date_posted_attribute
+        self.remote_query = remote_query
+        self.headless = headless
+        # Detail workers to start with; the rate limiter adapts it within its bounds
+        self.num_workers = num_workers
+        self.max_parallel_searches = max_parallel_searches
+        # Requests to abort in this platform's browser context; pass one with no
+        # blocked types or domains to load pages in full
+        self.resource_policy = resource_policy or ResourcePolicy()
+        # Text that only appears in a detail page's HTML once the description is
+        # rendered. When set, detail pages are fetched over plain HTTP first.
+        self.description_marker = description_marker
+        self.requires_login = requires_login
+        self.session_store = session_store or SessionStore()
+        # Learns how long this platform takes to render the next batch of results
+        self.pagination_timeout = AdaptiveTimeout()
+        self.rate_limit = rate_limit or RateLimit()
+        # Lowercase fragments of the bot-check pages this platform serves when it throttles
+        self.block_markers = block_markers
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Detail pages that failed every retry; re-driven at the start of the next run
+        self.dead_letters = dead_letters or DeadLetterQueue()
+        self.description_rule = description_rule or DescriptionRule([job_desc_class])
+        # Selectors handed to EXTRACT_CARDS_JS on every results batch
+        self.card_config = {
+            "card": search_results_class,
+            "link": job_link_class,
+            "title": job_title_class,
+            "company": company_name_class,
+            "location": location_class,
+            "date": date_posted_class,
+            "dateAttribute": date_posted_attribute,
+            "marker": SCRAPED_ATTRIBUTE,
+        }
 
-    def scrape(self, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None) -> List[Dict[str, Any]]:
+    @classmethod
+    def from_spec(cls, spec: ExtractionSpec | str, **overrides) -> "Scraper":
         """
-        Synchronous wrapper for the async scraping logic.
+        Builds a scraper from an extraction spec, or the name or path of one.
+        `overrides` replace individual constructor arguments.
         """
-        return asyncio.run(self.scrape_async(job_titles, locations, remote_only, limit))
-    
+        if isinstance(spec, str):
+            spec = ExtractionSpec.load(spec)
+        return cls(**{**spec.scraper_args(), **overrides})
 
-    @abstractmethod
-    async def login(self, page):
+    async def login(self, page: Page):
         """
-        Abstract method for logging into the platform.
+        Logs into the platform. Only called when `requires_login` is set and no
+        valid saved session exists.
         """
         pass
 
+    async def is_logged_in(self, page: Page) -> bool:
+        """
+        Cheap probe telling whether the context's session is still authenticated.
+        """
+        return True
 
-    async def scrape_async(self, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None) -> List[Dict[str, Any]]:
-        all_jobs = []
+    async def ensure_session(self, context: BrowserContext, page: Page, restored: bool):
+        """
+        Reuses a restored session if the probe accepts it, otherwise logs in and
+        saves the new session for the next run.
+        """
+        if restored:
+            if await self.is_logged_in(page):
+                logging.info(f"Reusing saved {self.platform_name} session.")
+                return
+            logging.info(f"Saved {self.platform_name} session expired, logging in again.")
+            self.session_store.clear(self.platform_name)
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            )
-            page = await context.new_page()
+        await self.login(page)
+        if await self.is_logged_in(page):
+            await self.session_store.save(context, self.platform_name)
+        else:
+            logging.warning(f"{self.platform_name} login did not produce a session, continuing without one.")
+
+    def search_urls(self, job_titles: List[str], locations: List[str], remote_only: bool) -> List[str]:
+        """
+        Builds the search page URL for every title x location pair.
+
+        Platforms whose search URL has no {location} placeholder get one URL per title.
+        """
+        urls = []
+        for title in job_titles:
+            for location in locations:
+                search_url = self.search_page_url.format(
+                    job_title=title.replace(" ", self.search_splitter),
+                    location=location.replace(" ", self.search_splitter)
+                )
+                if remote_only:
+                    search_url += self.remote_query
+                urls.append(search_url)
+        return list(dict.fromkeys(urls))
+
+    async def stream(self, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None, browser: Browser | None = None, known_urls: Callable[[List[str]], Set[str]] | None = None, progress: PlatformProgress | None = None) -> AsyncIterator[JobRecord]:
+        """
+        Scrapes listings and descriptions, yielding each job as its worker finishes.
+        With `known_urls`, runs incrementally: listings whose URL it returns are
+        yielded without refetching the detail page. With `progress`, records a
+        checkpoint and resumes from any progress an earlier run left there.
+        """
+        if browser is None:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=self.headless)
+                try:
+                    async for job in self.stream(job_titles, locations, remote_only, limit, browser=browser, known_urls=known_urls, progress=progress):
+                        yield job
+                finally:
+                    await browser.close()
+            return
+
+        storage_state = self.session_store.load(self.platform_name) if self.requires_login else None
+        context = await browser.new_context(user_agent=USER_AGENT, storage_state=storage_state)
+        await self.resource_policy.attach(context)
+        pipeline = None
+        try:
+            if self.requires_login:
+                page = await context.new_page()
+                try:
+                    await self.ensure_session(context, page, restored=storage_state is not None)
+                except Exception as e:
+                    # Raised rather than ending quietly, so the crawl is not taken as complete
+                    logging.error(f"{self.platform_name} login failed: {e}")
+                    raise
+                finally:
+                    await page.close()
+            
+            search_urls = self.search_urls(job_titles, locations, remote_only)
+            limit_per_search = max(1, limit // len(search_urls)) if limit is not None else 100
+            state = CrawlState(limit_per_search, known_urls, progress)
+
+            pipeline = asyncio.create_task(self.run_pipeline(context, search_urls, state))
+            yielded = 0
+            while (job := await state.output.get()) is not None:
+                yield job
+                yielded += 1
+                if limit and yielded >= limit:
+                    break
+            # Surface errors raised by the pipeline itself
+            if pipeline.done():
+                pipeline.result()
+        finally:
+            if pipeline is not None and not pipeline.done():
+                pipeline.cancel()
+                await asyncio.gather(pipeline, return_exceptions=True)
+            await context.close()
+            self.resource_policy.log_stats(self.platform_name)
+
+    async def run_pipeline(self, context: BrowserContext, search_urls: List[str], state: CrawlState):
+        """
+        Runs the searches and the detail workers until every queued job is done,
+        then marks the end of the output stream.
+        """
+        try:
+            if self.description_marker:
+                # Opened after login so the HTTP client carries the session cookies
+                state.fetcher = HybridFetcher(self.description_marker, USER_AGENT, max_connections=self.rate_limit.max_concurrency)
+                await state.fetcher.open(context)
+            state.rate_limiter = DomainRateLimiter(self.rate_limit, self.num_workers)
+
+            if state.progress is not None:
+                # Resume an interrupted run: re-emit fetched jobs (they may not have
+                # been saved), requeue unfetched ones and skip finished searches
+                for job in state.progress.pending_jobs(fetched=True):
+                    state.output.put_nowait(job)
+                for job in state.progress.pending_jobs(fetched=False):
+                    state.queue.put_nowait(job)
+                search_urls = [url for url in search_urls if not state.progress.search_done(url)]
+
+            for job in self.dead_letters.pending(self.platform_name):
+                if job.url not in state.seen_urls:
+                    state.seen_urls.add(job.url)
+                    state.redriven_urls.add(job.url)
+                    state.queue.put_nowait(job)
+            if state.redriven_urls:
+                logging.info(f"Re-driving {len(state.redriven_urls)} failed {self.platform_name} detail pages")
+
+            # Enough workers for the highest concurrency; the limiter decides how many run at once
+            consumers = [asyncio.create_task(self.worker(context, state)) for _ in range(self.rate_limit.max_concurrency)]
+            search_slots = asyncio.Semaphore(self.max_parallel_searches)
+
+            async def run_search(search_url: str):
+                async with search_slots:
+                    await self.search(context, search_url, state)
 
             try:
-                await self.login(page)
+                await asyncio.gather(*(run_search(search_url) for search_url in search_urls))
+                await state.queue.join()
+            finally:
+                for c in consumers:
+                    c.cancel()
+        finally:
+            if state.fetcher is not None:
+                await state.fetcher.close()
+                state.fetcher.log_stats(self.platform_name)
+            if state.rate_limiter is not None:
+                state.rate_limiter.log_stats(self.platform_name)
+            state.output.put_nowait(None)
+
+    async def search(self, context: BrowserContext, search_url: str, state: CrawlState):
+        """
+        Walks one search's result pages in its own tab and dispatches every new job card.
+        """
+        page = await context.new_page()
+        try:
+            logging.info(f"Scraping {self.platform_name}: {search_url}")
+            await page.goto(search_url, timeout=60000)
+
+            try:
+                await page.wait_for_selector(self.search_results_class, timeout=10000)
             except Exception as e:
-                logging.error(f"Login failed: {e}")
-                await browser.close()
-                return all_jobs
-            
-            queue = asyncio.Queue()
-            seen_all_urls = set()
-
-            consumers = [asyncio.create_task(self.worker(context, queue, all_jobs)) for _ in range(5)]
-
-            limit_per_job = limit // len(job_titles) if limit is not None else 100
-            # TODO improve efficiency
-            for title in job_titles:
-                for location in locations:
-                    try:
-                        title_search_keyword = title.replace(" ", self.search_splitter)
-                        location_search_keyword = location.replace(" ", self.search_splitter)
-                        search_url = self.search_page_url.format(job_title=title_search_keyword, location=location_search_keyword)
-                        await page.goto(search_url, timeout=60000)
-
-                        try:
-                            await page.wait_for_selector(self.search_results_class, timeout=10000)
-                        except Exception as e:
-                            logging.error(f"Search results did not load properly: {e}")
-                        
-                        last_height = await page.evaluate("document.body.scrollHeight")
-
-                        seen_job_urls = set()
-                        while True:
-                            job_lists = await page.query_selector_all(self.search_results_class)
-                            new_jobs_found_in_this_batch = False
-
-                            for job_list in job_lists:
-                                try:
-                                    job_href = await job_list.get_attribute("href")
-                                    job_url = self.base_url + job_href if job_href and job_href.startswith("/") else job_href
-                                    
-                                    if job_url in seen_all_urls:
-                                        continue
-                                    
-                                    seen_job_urls.add(job_url)
-                                    new_jobs_found_in_this_batch = True
-
-                                    title_element = await job_list.query_selector(self.job_title_class)
-                                    company_element = await job_list.query_selector(self.company_name_class)
-                                    location_element = await job_list.query_selector(self.location_class)
-                                    date_posted_element = await job_list.query_selector(self.date_posted_class) if self.date_posted_class else None
-
-                                    job_info = {
-                                        "title": (await title_element.inner_text()).strip() if title_element else "N/A",
-                                        "company": (await company_element.inner_text()).strip() if company_element else "N/A",
-                                        "location": (await location_element.inner_text()).strip() if location_element else "N/A",
-                                        "url": job_url,
-                                        "source": self.platform_name,
-                                        "description": "",
-                                        "date_posted": (await date_posted_element.inner_text()).strip() if date_posted_element else "N/A"
-                                    }
-                                    
-                                    await queue.put(job_info)
-
-                                    if len(seen_job_urls) >= limit_per_job:
-                                        seen_all_urls.update(seen_job_urls)
-                                        break
-                                except Exception as e:
-                                    logging.error(f"Error processing job listing: {e}")
-                                    continue
-                            
-                            if len(seen_job_urls) >= limit_per_job:
-                                break
-
-                            if not self.pagination_next_button_class:
-                                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                                await page.wait_for_timeout(2000)
-
-                                new_height = await page.evaluate("document.body.scrollHeight")
-                                if new_height == last_height and not new_jobs_found_in_this_batch:
-                                    logging.info("No more new jobs found, ending search.")
-                                    break
-                                last_height = new_height
-                            else:
-                                # TODO: be caution with this loop
-                                next_button = await page.query_selector(self.pagination_next_button_class)
-                                if next_button:
-                                    await next_button.click()
-                                    await page.wait_for_timeout(3000)
-                                else:
-                                    while True:
-                                        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                                        await page.wait_for_timeout(2000)
-
-                                        new_height = await page.evaluate("document.body.scrollHeight")
-                                        if new_height == last_height and not new_jobs_found_in_this_batch:
-                                            logging.info("No more new jobs found, ending search.")
-                                            break
-                                        last_height = new_height
-                                        next_button = await page.query_selector(self.pagination_next_button_class)
-                                        if next_button:
-                                            await next_button.click()
-                                            await page.wait_for_timeout(3000)
-                                            break
-                    except Exception as e:
-                        logging.error(f"Error during search for title '{title}' and location '{location}': {e}")
-            await queue.join()
-            for c in consumers:
-                c.cancel()
-            await browser.close()
-            return all_jobs
-
-    
-    async def worker(self, context: BrowserContext, queue: asyncio.Queue, all_jobs):
+                logging.warning(f"{self.platform_name} search results did not load for {search_url}: {e}")
+                return
+
+            # Listings an interrupted run already took count toward the limit; the
+            # ones it saw are in state.seen_urls, so the walk skips past them
+            found = state.progress.search_found(search_url) if state.progress else 0
+            while found < state.limit_per_search:
+                listings = await self.extract_cards(page)
+                found += await self.dispatch_listings(listings, state, state.limit_per_search - found)
+                if state.progress:
+                    state.progress.record_search(search_url, found, done=False)
+                if found >= state.limit_per_search:
+                    break
+
+                if not await self.next_page(page):
+                    logging.info(f"No more new jobs found for {search_url}, ending search.")
+                    break
+
+            if state.progress:
+                state.progress.record_search(search_url, found, done=True)
+        except Exception as e:
+            logging.error(f"Error during {self.platform_name} search {search_url}: {e}")
+        finally:
+            await page.close()
+
+    async def dispatch_listings(self, listings: List[JobRecord], state: CrawlState, budget: int) -> int:
+        """
+        Queues up to `budget` unseen listings for detail fetching and returns how
+        many were taken. In incremental mode, listings whose details are already
+        stored and fresh go straight to the output without a description, so
+        saving them only refreshes their listing fields and `last_seen`.
+        """
+        new_listings = []
+        for job_info in listings:
+            if job_info.url in state.seen_urls:
+                continue
+            state.seen_urls.add(job_info.url)
+            new_listings.append(job_info)
+            if len(new_listings) >= budget:
+                break
+
+        fresh_urls = set()
+        if state.known_urls is not None and new_listings:
+            # pymongo is blocking, so the lookup runs off the event loop
+            fresh_urls = await asyncio.to_thread(state.known_urls, [job.url for job in new_listings])
+
+        queued = [job_info for job_info in new_listings if job_info.url not in fresh_urls]
+        if state.progress:
+            state.progress.record_listings(new_listings, queued)
+
+        for job_info in new_listings:
+            if job_info.url in fresh_urls:
+                state.output.put_nowait(job_info)
+            else:
+                await state.queue.put(job_info)
+        return len(new_listings)
+
+    async def extract_cards(self, page: Page) -> List[JobRecord]:
+        """
+        Reads the listing fields of the job cards added since the last call.
+        """
+        jobs = []
+        for card in await page.evaluate(EXTRACT_CARDS_JS, self.card_config):
+            job_href = card["href"]
+            jobs.append(JobRecord.create(
+                url=self.base_url + job_href if job_href.startswith("/") else job_href,
+                title=card["title"],
+                source=self.platform_name,
+                company=card["company"],
+                location=card["location"],
+                date_posted=card["date_posted"],
+            ))
+        return jobs
+
+    async def next_page(self, page: Page) -> bool:
+        """
+        Loads the next batch of results, by next button or scrolling, and waits
+        for it to render. Returns False once no new results appear.
+        """
+        return await load_more_results(page, self.search_results_class, self.pagination_next_button_class, self.pagination_timeout)
+
+    async def worker(self, context: BrowserContext, state: CrawlState):
         while True:
-            job = await queue.get()
+            job = await state.queue.get()
             try:
-                job_url = job['url']
-                job_description = "Description not found"
-
-                page = None
-                try:
-                    page = await context.new_page()
-                    await page.goto(job_url, timeout=60000)
-                    try:
-                        await page.wait_for_selector("body", timeout=10000)
-                    except:
-                        pass
-
-                    content = await page.content()
-                    soup = BeautifulSoup(content, soup = BeautifulSoup(content, "html.parser"))
-
-                    job_desc_element = soup.find("div", attrs=({"class": self.job_desc_class}))
-
-                    if job_desc_element:
-                        job_description = job_desc_element.get_text(separator="\n").strip()
-                    
-                    if page is not None:
-                        await page.close()
-                except Exception as e:
-                    logging.error(f"worker error for {job_url}: {e}")
-                    if page is not None:
-                        await page.close()
-                job['description'] = job_description
-                all_jobs.append(job)
+                description = await self.fetch_with_retries(context, job, state)
+                # Failed jobs go out with listing fields only, so a stored description is kept
+                if description is not None:
+                    job.description = description
+                if state.progress:
+                    state.progress.record_fetched(job)
+                state.output.put_nowait(job)
             except Exception as e:
                 logging.error(f"worker critical error: {e}")
             finally:
-                queue.task_done()
+                state.queue.task_done()
+
+    async def fetch_with_retries(self, context: BrowserContext, job: JobRecord, state: CrawlState) -> str | None:
+        """
+        Fetches a job's description, retrying retryable failures with backoff.
+        Returns None once the job is dead-lettered.
+        """
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            try:
+                async with state.rate_limiter.slot(job.url):
+                    description = await self.fetch_description(context, job.url, state.fetcher)
+                if job.url in state.redriven_urls:
+                    self.dead_letters.remove(self.platform_name, job.url)
+                return description
+            except FetchError as e:
+                if not e.retryable or attempt == self.retry_policy.max_attempts:
+                    logging.warning(f"{self.platform_name} gave up on {job.url} after {attempt} attempts: {e.reason}")
+                    self.dead_letters.add(self.platform_name, job, e)
+                    return None
+                delay = self.retry_policy.delay(attempt)
+                logging.info(f"{self.platform_name} {e.kind} error on {job.url}, retrying in {delay:.1f}s: {e.reason}")
+                await asyncio.sleep(delay)
+
+    async def fetch_description(self, context: BrowserContext, job_url: str, fetcher: HybridFetcher | None = None) -> str:
+        """
+        Extracts a job's description, over plain HTTP when `fetcher` gets the
+        rendered page, otherwise by opening the detail page in a new tab.
+
+        Raises RateLimited when the site throttles, serves a bot check or times
+        out, DescriptionNotFound when the page has no description, and
+        FetchError when it fails to load.
+        """
+        if fetcher is not None:
+            html = await fetcher.fetch(job_url)
+            description = await asyncio.to_thread(self.parse_description, html) if html is not None else None
+            if description:
+                return description
+
+        page = None
+        try:
+            page = await context.new_page()
+            response = await page.goto(job_url, timeout=60000)
+            if response is not None and response.status in THROTTLE_STATUS_CODES:
+                raise RateLimited(job_url, f"HTTP {response.status}")
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=10000)
+            except:
+                pass # Proceed even if timeout, content might be there
+
+            html = await page.content()
+        except FetchError:
+            raise
+        except PlaywrightTimeoutError as e:
+            raise RateLimited(job_url, "timed out") from e
+        except Exception as e:
+            raise FetchError(job_url, f"page failed to load: {e}") from e
+        finally:
+            if page is not None:
+                await page.close()
+
+        description = await asyncio.to_thread(self.parse_description, html)
+        if description:
+            return description
+        if self.is_blocked(html):
+            raise RateLimited(job_url, "bot check page")
+        raise DescriptionNotFound(job_url)
+
+    def is_blocked(self, html: str) -> bool:
+        """
+        Tells whether a page without a description is a captcha or bot check.
+        """
+        html = html.lower()
+        return any(marker in html for marker in self.block_markers)
+
+    def parse_description(self, html: str) -> str | None:
+        """
+        Extracts the description text from a detail page, or None if it is missing.
+
+        Parsing is CPU-bound, so workers run it in a thread; lxml releases the
+        GIL while parsing, letting pages parse in parallel with the event loop.
+        """
+        return self.description_rule.extract(html)
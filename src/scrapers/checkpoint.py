@@ -0,0 +1,170 @@
+import os
+import json
+import uuid
+import sqlite3
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Set
+from src.db.job_record import JobRecord
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawls (
+    crawl_id TEXT PRIMARY KEY,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS searches (
+    crawl_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    search_url TEXT NOT NULL,
+    found INTEGER NOT NULL,
+    done INTEGER NOT NULL,
+    PRIMARY KEY (crawl_id, platform, search_url)
+);
+CREATE TABLE IF NOT EXISTS seen_urls (
+    crawl_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (crawl_id, platform, url)
+);
+CREATE TABLE IF NOT EXISTS pending_jobs (
+    crawl_id TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    url TEXT NOT NULL,
+    job TEXT NOT NULL,
+    fetched INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (crawl_id, platform, url)
+);
+"""
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+class CrawlCheckpoint:
+    """
+    Persistent progress of crawls in a local SQLite file, so an interrupted
+    crawl can resume where it stopped.
+
+    A crawl records its parameters; each platform records its searches (how
+    many listings were taken and whether the search finished), every listing
+    URL it has seen, and the listings queued for detail fetching. Every write
+    commits immediately, so a killed process loses nothing it had recorded.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or os.getenv("CRAWL_CHECKPOINT_PATH", ".crawl_checkpoints.sqlite3")
+        # The app keeps one checkpoint per process, used from each rerun's thread
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def start(self, params: Dict[str, Any]) -> str:
+        """Records a new running crawl with its parameters and returns its id."""
+        crawl_id = uuid.uuid4().hex
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO crawls (crawl_id, params, status, started_at, updated_at) VALUES (?, ?, 'running', ?, ?)",
+                (crawl_id, json.dumps(params), _now(), _now())
+            )
+        return crawl_id
+
+    def params(self, crawl_id: str) -> Dict[str, Any]:
+        row = self.conn.execute("SELECT params FROM crawls WHERE crawl_id = ?", (crawl_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown crawl: {crawl_id}")
+        return json.loads(row["params"])
+
+    def unfinished(self) -> List[Dict[str, Any]]:
+        """Lists crawls that never finished, newest first."""
+        rows = self.conn.execute(
+            "SELECT crawl_id, params, started_at, updated_at FROM crawls WHERE status = 'running' ORDER BY started_at DESC"
+        ).fetchall()
+        return [{**dict(row), "params": json.loads(row["params"])} for row in rows]
+
+    def finish(self, crawl_id: str):
+        """Marks a crawl complete and drops its progress rows."""
+        with self.conn:
+            for table in ("searches", "seen_urls", "pending_jobs"):
+                self.conn.execute(f"DELETE FROM {table} WHERE crawl_id = ?", (crawl_id,))
+            self.conn.execute("UPDATE crawls SET status = 'done', updated_at = ? WHERE crawl_id = ?", (_now(), crawl_id))
+
+    def progress(self, crawl_id: str, platform: str) -> "PlatformProgress":
+        return PlatformProgress(self, crawl_id, platform)
+
+    def touch(self, crawl_id: str):
+        self.conn.execute("UPDATE crawls SET updated_at = ? WHERE crawl_id = ?", (_now(), crawl_id))
+
+
+class PlatformProgress:
+    """
+    One platform's slice of a crawl checkpoint, as used by a running scraper.
+    """
+
+    def __init__(self, checkpoint: CrawlCheckpoint, crawl_id: str, platform: str):
+        self.conn = checkpoint.conn
+        self.checkpoint = checkpoint
+        self.crawl_id = crawl_id
+        self.platform = platform
+
+    def seen_urls(self) -> Set[str]:
+        rows = self.conn.execute(
+            "SELECT url FROM seen_urls WHERE crawl_id = ? AND platform = ?", (self.crawl_id, self.platform)
+        ).fetchall()
+        return {row["url"] for row in rows}
+
+    def search_found(self, search_url: str) -> int:
+        """How many listings an earlier attempt already took from this search."""
+        row = self.conn.execute(
+            "SELECT found FROM searches WHERE crawl_id = ? AND platform = ? AND search_url = ?",
+            (self.crawl_id, self.platform, search_url)
+        ).fetchone()
+        return row["found"] if row else 0
+
+    def search_done(self, search_url: str) -> bool:
+        row = self.conn.execute(
+            "SELECT done FROM searches WHERE crawl_id = ? AND platform = ? AND search_url = ?",
+            (self.crawl_id, self.platform, search_url)
+        ).fetchone()
+        return bool(row and row["done"])
+
+    def record_search(self, search_url: str, found: int, done: bool):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO searches (crawl_id, platform, search_url, found, done) VALUES (?, ?, ?, ?, ?)",
+                (self.crawl_id, self.platform, search_url, found, int(done))
+            )
+            self.checkpoint.touch(self.crawl_id)
+
+    def record_listings(self, seen: List[JobRecord], queued: List[JobRecord]):
+        """Records newly seen listings and the ones queued for detail fetching."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO seen_urls (crawl_id, platform, url) VALUES (?, ?, ?)",
+                [(self.crawl_id, self.platform, job.url) for job in seen]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO pending_jobs (crawl_id, platform, url, job) VALUES (?, ?, ?, ?)",
+                [(self.crawl_id, self.platform, job.url, json.dumps(job.to_dict())) for job in queued]
+            )
+
+    def record_fetched(self, job: JobRecord):
+        """Stores a job's fetched details so a resumed crawl can re-emit it without refetching."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE pending_jobs SET job = ?, fetched = 1 WHERE crawl_id = ? AND platform = ? AND url = ?",
+                (json.dumps(job.to_dict()), self.crawl_id, self.platform, job.url)
+            )
+
+    def pending_jobs(self, fetched: bool) -> List[JobRecord]:
+        """Returns the jobs still waiting for details, or those already fetched."""
+        rows = self.conn.execute(
+            "SELECT job FROM pending_jobs WHERE crawl_id = ? AND platform = ? AND fetched = ?",
+            (self.crawl_id, self.platform, int(fetched))
+        ).fetchall()
+        return [JobRecord.from_dict(json.loads(row["job"])) for row in rows]
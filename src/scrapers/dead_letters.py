@@ -0,0 +1,95 @@
+import os
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from typing import List, Dict
+from src.scrapers.retry import FetchError
+from src.db.job_record import JobRecord
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dead_letters (
+    platform TEXT NOT NULL,
+    url TEXT NOT NULL,
+    job TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    error TEXT NOT NULL,
+    failures INTEGER NOT NULL,
+    first_failed_at TEXT NOT NULL,
+    last_failed_at TEXT NOT NULL,
+    PRIMARY KEY (platform, url)
+);
+"""
+
+class DeadLetterQueue:
+    """
+    Detail pages that failed every attempt, kept in a local SQLite file.
+
+    Each entry holds the job's listing fields, so a later run can re-drive it
+    by fetching just that page. The file is only created on the first failure.
+    """
+
+    def __init__(self, path: str | None = None, max_failures: int = 5):
+        self.path = path or os.getenv("DEAD_LETTER_PATH", ".dead_letters.sqlite3")
+        # Entries that failed this many runs are kept for inspection but no longer re-driven
+        self.max_failures = max_failures
+        self.conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.conn is None:
+            # The app keeps one queue per process, used from each rerun's thread
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
+            self.conn.executescript(SCHEMA)
+        return self.conn
+
+    def _exists(self) -> bool:
+        return self.conn is not None or os.path.exists(self.path)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def add(self, platform: str, job: JobRecord, error: FetchError):
+        """Records a failed job, counting how many runs it has failed."""
+        listing = {key: value for key, value in job.to_dict().items() if key != "description"}
+        now = datetime.now(timezone.utc).isoformat()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO dead_letters (platform, url, job, kind, error, failures, first_failed_at, last_failed_at)
+                VALUES (?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT (platform, url) DO UPDATE SET
+                    job = excluded.job, kind = excluded.kind, error = excluded.error,
+                    failures = failures + 1, last_failed_at = excluded.last_failed_at
+                """,
+                (platform, job.url, json.dumps(listing), error.kind, error.reason, now, now)
+            )
+        logging.info(f"Dead-lettered {platform} job {job.url}: {error.kind} ({error.reason})")
+
+    def pending(self, platform: str) -> List[JobRecord]:
+        """Returns the failed jobs of a platform that are still worth re-driving."""
+        if not self._exists():
+            return []
+        rows = self._connect().execute(
+            "SELECT job FROM dead_letters WHERE platform = ? AND failures < ? ORDER BY last_failed_at",
+            (platform, self.max_failures)
+        ).fetchall()
+        return [JobRecord.from_dict(json.loads(row["job"])) for row in rows]
+
+    def remove(self, platform: str, url: str):
+        """Drops an entry once its page has been scraped."""
+        if not self._exists():
+            return
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM dead_letters WHERE platform = ? AND url = ?", (platform, url))
+
+    def counts(self) -> Dict[str, int]:
+        """Number of dead-lettered jobs per platform."""
+        if not self._exists():
+            return {}
+        rows = self._connect().execute("SELECT platform, COUNT(*) AS n FROM dead_letters GROUP BY platform").fetchall()
+        return {row["platform"]: row["n"] for row in rows}
@@ -0,0 +1,35 @@
+import threading
+from functools import lru_cache
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+
+# Elements whose text is never shown on the page
+HIDDEN_TAGS = ("script", "style", "noscript", "template")
+
+_local = threading.local()
+
+def _parser() -> lxml_html.HTMLParser:
+    # lxml parsers must not be shared between threads, so each pool thread gets one
+    if not hasattr(_local, "parser"):
+        _local.parser = lxml_html.HTMLParser(remove_comments=True, remove_pis=True)
+    return _local.parser
+
+@lru_cache(maxsize=None)
+def css(selector: str) -> CSSSelector:
+    """Compiles a CSS selector to XPath once per process."""
+    return CSSSelector(selector, translator="html")
+
+def parse_html(html: str) -> etree._Element | None:
+    """Parses a page with lxml, returning None for empty or unparsable input."""
+    try:
+        return lxml_html.document_fromstring(html, parser=_parser())
+    except (etree.ParserError, ValueError):
+        return None
+
+def element_text(element: etree._Element, separator: str = "\n") -> str:
+    """
+    Joins the visible text under `element`, one string per text node, like
+    BeautifulSoup's get_text(separator). Hidden elements are dropped in place.
+    """
+    etree.strip_elements(element, *HIDDEN_TAGS, with_tail=False)
+    return separator.join(element.itertext())
@@ -0,0 +1,77 @@
+import logging
+import httpx
+from typing import Dict, Any
+from playwright.async_api import BrowserContext
+from src.scrapers.rate_limiter import RateLimited, THROTTLE_STATUS_CODES, parse_retry_after
+
+class HybridFetcher:
+    """
+    Fetches server-rendered detail pages over a pooled HTTP client.
+
+    The client reuses the browser context's cookies, so logged-in pages work
+    too. A page only counts as an HTTP hit when its HTML contains
+    `description_marker`; otherwise `fetch` returns None and the caller falls
+    back to a browser tab. Throttled responses raise RateLimited instead, since
+    the browser would be throttled too.
+    """
+
+    def __init__(self, description_marker: str, user_agent: str, max_connections: int = 10, timeout: float = 20.0):
+        self.description_marker = description_marker
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.client = None
+        self.http_hits = 0
+        self.browser_fallbacks = 0
+
+    async def open(self, context: BrowserContext):
+        """Creates the keep-alive client, seeded with the context's current cookies."""
+        cookies = httpx.Cookies()
+        for cookie in await context.cookies():
+            cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": self.user_agent, "Accept": "text/html,application/xhtml+xml"},
+            cookies=cookies,
+            limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def fetch(self, url: str) -> str | None:
+        """
+        Returns the page HTML when plain HTTP gets the full description, else None.
+        """
+        try:
+            response = await self.client.get(url)
+            if response.status_code in THROTTLE_STATUS_CODES:
+                raise RateLimited(url, f"HTTP {response.status_code}", parse_retry_after(response.headers.get("Retry-After")))
+            if response.status_code == 200 and self.description_marker in response.text:
+                self.http_hits += 1
+                return response.text
+            logging.debug(f"HTTP fetch missed description for {url} (status {response.status_code})")
+        except httpx.HTTPError as e:
+            logging.debug(f"HTTP fetch failed for {url}: {e}")
+        self.browser_fallbacks += 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns how many pages each path served and the HTTP hit ratio."""
+        total = self.http_hits + self.browser_fallbacks
+        return {
+            "http_hits": self.http_hits,
+            "browser_fallbacks": self.browser_fallbacks,
+            "hit_ratio": self.http_hits / total if total else 0.0,
+        }
+
+    def log_stats(self, platform_name: str):
+        stats = self.stats()
+        logging.info(
+            f"{platform_name} detail pages: {stats['http_hits']} over HTTP, "
+            f"{stats['browser_fallbacks']} via browser (hit ratio {stats['hit_ratio']:.0%})"
+        )
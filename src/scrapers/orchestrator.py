@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from typing import List, Dict, Any, AsyncIterator, Callable, Set, Tuple
+from playwright.async_api import async_playwright, Browser
+from src.scrapers.base_scraper import BaseScraper
+from src.db.sink import BatchingSink
+from src.scrapers.checkpoint import CrawlCheckpoint
+from src.db.job_record import JobRecord
+
+# (scraper name, job, error). A job is None on the event that marks its
+# scraper finished, which carries the scraper's exception if it failed.
+CrawlEvent = Tuple[str, JobRecord | None, Exception | None]
+
+class CrawlOrchestrator:
+    """
+    Runs several scrapers concurrently as coroutines on one event loop.
+
+    All scrapers share a single Chromium instance; each one opens its own
+    BrowserContext in it, so cookies and sessions stay isolated per site.
+    """
+
+    def __init__(self, scrapers: List[BaseScraper], headless: bool = False):
+        self.scrapers = scrapers
+        self.headless = headless
+
+    async def stream(self, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None, known_urls: Callable[[List[str]], Set[str]] | None = None, checkpoint: CrawlCheckpoint | None = None, crawl_id: str | None = None) -> AsyncIterator[CrawlEvent]:
+        """
+        Yields every job from every scraper as soon as it is scraped, followed by
+        one end event per scraper. Passing `known_urls` makes every scraper crawl
+        incrementally. With a `checkpoint`, progress is recorded under `crawl_id`;
+        marking the crawl finished is left to `ingest`, once its jobs are saved.
+        """
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            events = asyncio.Queue()
+            tasks = [
+                asyncio.create_task(self._run_scraper(
+                    scraper, browser, events, job_titles, locations, remote_only, limit, known_urls,
+                    checkpoint.progress(crawl_id, self._platform_name(scraper)) if checkpoint else None
+                ))
+                for scraper in self.scrapers
+            ]
+            try:
+                running = len(tasks)
+                while running:
+                    event = await events.get()
+                    if event[1] is None:
+                        running -= 1
+                    yield event
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await browser.close()
+
+    @staticmethod
+    def _platform_name(scraper: BaseScraper) -> str:
+        return getattr(scraper, "platform_name", type(scraper).__name__)
+
+    async def _run_scraper(self, scraper: BaseScraper, browser: Browser, events: asyncio.Queue, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None, known_urls: Callable[[List[str]], Set[str]] | None, progress):
+        name = type(scraper).__name__
+        count = 0
+        error = None
+        try:
+            async for job in scraper.stream(job_titles, locations, remote_only, limit, browser=browser, known_urls=known_urls, progress=progress):
+                count += 1
+                events.put_nowait((name, job, None))
+            logging.info(f"{name} finished with {count} jobs")
+        except Exception as e:
+            logging.error(f"Error with scraper {name}: {e}")
+            error = e
+        events.put_nowait((name, None, error))
+
+    async def ingest(self, sink: BatchingSink, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None, known_urls: Callable[[List[str]], Set[str]] | None = None, on_event: Callable[[str, JobRecord | None, Exception | None], None] | None = None, checkpoint: CrawlCheckpoint | None = None, crawl_id: str | None = None) -> Dict[str, Any]:
+        """
+        Streams every scraped job into `sink` and returns the sink's save summary.
+
+        With a `checkpoint`, the crawl is recorded there (under a new id unless
+        `crawl_id` names one to resume) so it can be resumed if interrupted. It
+        is marked finished only after the sink flushed its last batch, and only
+        if every scraper succeeded and every job was saved.
+        """
+        if checkpoint and crawl_id is None:
+            crawl_id = checkpoint.start({
+                "job_titles": job_titles, "locations": locations, "remote_only": remote_only, "limit": limit
+            })
+        scraper_failed = False
+        async with sink:
+            async for name, job, error in self.stream(job_titles, locations, remote_only, limit, known_urls, checkpoint, crawl_id):
+                if job is not None:
+                    await sink.add(job)
+                elif error is not None:
+                    scraper_failed = True
+                if on_event:
+                    on_event(name, job, error)
+        if checkpoint:
+            if scraper_failed or sink.summary["failed"]:
+                logging.warning(f"Crawl {crawl_id} left unfinished so it can be resumed")
+            else:
+                checkpoint.finish(crawl_id)
+        return sink.summary
+
+    def run(self, sink: BatchingSink, job_titles: List[str], locations: List[str], remote_only: bool, limit: int | None = None, known_urls: Callable[[List[str]], Set[str]] | None = None, on_event: Callable[[str, JobRecord | None, Exception | None], None] | None = None, checkpoint: CrawlCheckpoint | None = None, crawl_id: str | None = None) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around `ingest`.
+        """
+        return asyncio.run(self.ingest(sink, job_titles, locations, remote_only, limit, known_urls, on_event, checkpoint, crawl_id))
+
+    def resume(self, sink: BatchingSink, checkpoint: CrawlCheckpoint, crawl_id: str, known_urls: Callable[[List[str]], Set[str]] | None = None, on_event: Callable[[str, JobRecord | None, Exception | None], None] | None = None) -> Dict[str, Any]:
+        """
+        Continues an interrupted crawl with the parameters it was started with.
+        """
+        params = checkpoint.params(crawl_id)
+        logging.info(f"Resuming crawl {crawl_id}: {params}")
+        return self.run(sink, params["job_titles"], params["locations"], params["remote_only"], params["limit"], known_urls, on_event, checkpoint, crawl_id)
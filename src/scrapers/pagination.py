@@ -0,0 +1,93 @@
+import time
+import logging
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+# Set on every result node present before a pagination step, so the next batch
+# is simply whichever result nodes lack it
+SEEN_ATTRIBUTE = "data-pager-seen"
+
+MARK_RESULTS_JS = """
+([selector, attribute]) => {
+    const nodes = document.querySelectorAll(selector);
+    nodes.forEach(node => node.setAttribute(attribute, ""));
+    return nodes.length;
+}
+"""
+
+# Resolves true as soon as an unmarked result node is attached, false on timeout
+WAIT_FOR_UNSEEN_JS = """
+([selector, attribute, timeoutMs]) => new Promise(resolve => {
+    const unseen = `${selector}:not([${attribute}])`;
+    if (document.querySelector(unseen)) return resolve(true);
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(unseen)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    observer.observe(document.body, {childList: true, subtree: true});
+    const timer = setTimeout(() => { observer.disconnect(); resolve(false); }, timeoutMs);
+})
+"""
+
+class AdaptiveTimeout:
+    """
+    Timeout derived from how long new results have actually taken to appear.
+
+    Keeps an exponentially weighted average of observed waits and allows
+    `factor` times that, clamped to [min_ms, max_ms], so fast sites stop
+    waiting quickly at the end of the results and slow ones are not cut off.
+    """
+
+    def __init__(self, initial_ms: float = 3000, min_ms: float = 750, max_ms: float = 15000, factor: float = 3.0, alpha: float = 0.3):
+        self.average_ms = initial_ms / factor
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.factor = factor
+        self.alpha = alpha
+
+    @property
+    def timeout_ms(self) -> float:
+        return min(self.max_ms, max(self.min_ms, self.factor * self.average_ms))
+
+    def observe(self, elapsed_ms: float):
+        """Records how long a successful wait took."""
+        self.average_ms = self.alpha * elapsed_ms + (1 - self.alpha) * self.average_ms
+
+async def load_more_results(page: Page, results_selector: str, next_button_selector: str | None, timeout: AdaptiveTimeout) -> bool:
+    """
+    Triggers the next batch of results and waits for it to render.
+
+    Clicks the next button when one is visible, otherwise scrolls to the bottom,
+    then waits for result nodes that were not on the page before. If none show
+    up within the adaptive timeout, waits once for the network to go idle so a
+    slow search request still counts. Returns False when nothing new arrived.
+    """
+    await page.evaluate(MARK_RESULTS_JS, [results_selector, SEEN_ATTRIBUTE])
+    unseen_selector = f"{results_selector}:not([{SEEN_ATTRIBUTE}])"
+    started = time.monotonic()
+
+    next_button = await page.query_selector(next_button_selector) if next_button_selector else None
+    if next_button and await next_button.is_visible():
+        await next_button.click()
+        try:
+            # wait_for_selector also survives a full navigation to the next page
+            await page.wait_for_selector(unseen_selector, timeout=timeout.timeout_ms)
+            arrived = True
+        except PlaywrightTimeoutError:
+            arrived = False
+    else:
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        arrived = await page.evaluate(WAIT_FOR_UNSEEN_JS, [results_selector, SEEN_ATTRIBUTE, timeout.timeout_ms])
+
+    if not arrived:
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout.max_ms)
+        except PlaywrightTimeoutError:
+            logging.debug("Network did not go idle after pagination.")
+        arrived = await page.query_selector(unseen_selector) is not None
+
+    if arrived:
+        timeout.observe((time.monotonic() - started) * 1000)
+    return arrived
@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator
+from urllib.parse import urlparse
+from src.scrapers.retry import FetchError
+
+# Responses telling us to slow down
+THROTTLE_STATUS_CODES = {429, 503}
+
+# Fragments of bot-check pages served instead of a job page
+DEFAULT_BLOCK_MARKERS = ("g-recaptcha", "h-captcha", "cf-challenge", "captcha-delivery", "px-captcha")
+
+class RateLimited(FetchError):
+    """
+    Raised when a site answers with a throttle status, a captcha page or a
+    timeout, so the limiter backs off that domain.
+    """
+
+    kind = "throttled"
+
+    def __init__(self, url: str, reason: str, retry_after: float | None = None):
+        super().__init__(url, reason)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Reads a Retry-After header given in seconds; HTTP dates are ignored."""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class RateLimit:
+    """
+    Per-platform limits for detail page fetching.
+
+    Each domain gets a token bucket refilling at `requests_per_second` up to
+    `burst` tokens, and a concurrency limit that moves between `min_concurrency`
+    and `max_concurrency`: it grows by one after a window of fast, successful
+    requests and halves on throttling or when the error rate passes
+    `max_error_rate`. A throttled domain also pauses for `cooldown` seconds, or
+    for as long as the site's Retry-After asks.
+    """
+
+    def __init__(
+            self,
+            requests_per_second: float = 2.0,
+            burst: int = 5,
+            min_concurrency: int = 1,
+            max_concurrency: int = 10,
+            latency_target: float = 8.0,
+            max_error_rate: float = 0.25,
+            cooldown: float = 30.0
+            ):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+
+
+class TokenBucket:
+    """
+    Spaces requests to a steady rate while allowing short bursts.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Hands out no tokens for `seconds`, then restarts from an empty bucket."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        self.updated = self.paused_until
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease limit on requests in flight.
+    """
+
+    # Weight of the latest request in the latency and error rate averages
+    SMOOTHING = 0.2
+
+    def __init__(self, initial: int, min_limit: int, max_limit: int, latency_target: float, max_error_rate: float):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = max(min_limit, min(initial, max_limit))
+        self.latency_target = latency_target
+        self.max_error_rate = max_error_rate
+        self.in_flight = 0
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.successes = 0
+        self.decreased_at = 0.0
+        self.changed = asyncio.Event()
+
+    async def acquire(self):
+        while self.in_flight >= self.limit:
+            self.changed.clear()
+            await self.changed.wait()
+        self.in_flight += 1
+
+    def release(self, started_at: float, latency: float, outcome: str):
+        """
+        Frees a slot and adapts the limit to a finished request's `outcome`:
+        "ok", "throttled", "error", or "cancelled" (which is not counted).
+        """
+        self.in_flight -= 1
+        if outcome != "cancelled":
+            self.error_rate += self.SMOOTHING * ((outcome != "ok") - self.error_rate)
+            if outcome == "ok":
+                self.latency += self.SMOOTHING * (latency - self.latency)
+
+            if outcome == "throttled" or self.error_rate > self.max_error_rate:
+                # Requests already in flight when we last backed off report the
+                # same congestion, so they must not halve the limit again
+                if started_at >= self.decreased_at:
+                    self.limit = max(self.min_limit, int(self.limit / 2))
+                    self.decreased_at = time.monotonic()
+                    self.successes = 0
+            elif outcome == "ok" and self.latency <= self.latency_target:
+                self.successes += 1
+                if self.successes >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self.successes = 0
+        self.changed.set()
+
+
+class DomainRateLimiter:
+    """
+    Runtime limiter for one crawl: a token bucket and an AIMD controller per domain.
+    """
+
+    def __init__(self, rate_limit: RateLimit, initial_concurrency: int):
+        self.rate_limit = rate_limit
+        self.initial_concurrency = initial_concurrency
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.controllers: Dict[str, AIMDController] = {}
+        self.throttled: Dict[str, int] = {}
+
+    def _domain(self, domain: str):
+        if domain not in self.controllers:
+            limits = self.rate_limit
+            self.buckets[domain] = TokenBucket(limits.requests_per_second, limits.burst)
+            self.controllers[domain] = AIMDController(
+                self.initial_concurrency, limits.min_concurrency, limits.max_concurrency,
+                limits.latency_target, limits.max_error_rate
+            )
+            self.throttled[domain] = 0
+        return self.buckets[domain], self.controllers[domain]
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Waits until `url`'s domain has both a free concurrency slot and a token,
+        then times the request made inside the block. Raising RateLimited from
+        the block backs the domain off.
+        """
+        domain = urlparse(url).netloc
+        bucket, controller = self._domain(domain)
+        await controller.acquire()
+        started_at = time.monotonic()
+        outcome = "error"
+        try:
+            await bucket.acquire()
+            started_at = time.monotonic()
+            yield
+            outcome = "ok"
+        except RateLimited as e:
+            outcome = "throttled"
+            self.throttled[domain] += 1
+            bucket.pause(e.retry_after if e.retry_after is not None else self.rate_limit.cooldown)
+            logging.warning(f"Throttled by {domain}: {e.reason}")
+            raise
+        except FetchError as e:
+            # A page that simply has no description says nothing about the site's health
+            outcome = "error" if e.retryable else "ok"
+            raise
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        finally:
+            controller.release(started_at, time.monotonic() - started_at, outcome)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Returns each domain's final concurrency limit, average latency and throttle count."""
+        return {
+            domain: {
+                "concurrency": controller.limit,
+                "latency": controller.latency,
+                "throttled": self.throttled[domain],
+            }
+            for domain, controller in self.controllers.items()
+        }
+
+    def log_stats(self, platform_name: str):
+        for domain, stats in self.stats().items():
+            logging.info(
+                f"{platform_name} rate limit for {domain}: concurrency {stats['concurrency']}, "
+                f"average latency {stats['latency']:.1f}s, throttled {stats['throttled']} times"
+            )
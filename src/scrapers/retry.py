@@ -0,0 +1,45 @@
+import random
+
+class FetchError(Exception):
+    """
+    A detail page that could not be scraped, classified by `kind`.
+
+    Retryable errors are worth another attempt within the same run; the rest
+    only go to the dead-letter queue for a later run to re-drive.
+    """
+
+    kind = "network"
+    retryable = True
+
+    def __init__(self, url: str, reason: str):
+        super().__init__(f"{reason} ({url})")
+        self.url = url
+        self.reason = reason
+
+
+class DescriptionNotFound(FetchError):
+    """The page loaded but holds no description, e.g. an expired posting."""
+
+    kind = "missing"
+    retryable = False
+
+    def __init__(self, url: str):
+        super().__init__(url, "description not found")
+
+
+class RetryPolicy:
+    """
+    Bounded retries with full-jitter exponential backoff.
+
+    Retry n waits a random time between 0 and `base_delay * 2**(n-1)` seconds,
+    capped at `max_delay`, so workers throttled together do not retry together.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 60.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after failed attempt number `attempt` (starting at 1)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
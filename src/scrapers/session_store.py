@@ -0,0 +1,47 @@
+import os
+import time
+import logging
+from playwright.async_api import BrowserContext
+
+class SessionStore:
+    """
+    Caches logged-in browser sessions on disk as Playwright storage_state files.
+
+    One JSON file per platform holds its cookies and local storage. The files
+    grant access to the account, so they are written readable by the owner only.
+    """
+
+    def __init__(self, directory: str | None = None, max_age_hours: float = 24 * 7):
+        self.directory = directory or os.getenv("SCRAPER_SESSION_DIR", ".sessions")
+        self.max_age_hours = max_age_hours
+
+    def path(self, platform_name: str) -> str:
+        return os.path.join(self.directory, f"{platform_name.lower()}_state.json")
+
+    def load(self, platform_name: str) -> str | None:
+        """
+        Returns the saved storage_state path for `new_context`, or None if there is
+        no session or it is older than `max_age_hours`.
+        """
+        path = self.path(platform_name)
+        if not os.path.exists(path):
+            return None
+        age_hours = (time.time() - os.path.getmtime(path)) / 3600
+        if age_hours > self.max_age_hours:
+            logging.info(f"Saved {platform_name} session is {age_hours:.0f}h old, discarding it.")
+            self.clear(platform_name)
+            return None
+        return path
+
+    async def save(self, context: BrowserContext, platform_name: str):
+        """Writes the context's current cookies and storage to disk."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(platform_name)
+        await context.storage_state(path=path)
+        os.chmod(path, 0o600)
+        logging.info(f"Saved {platform_name} session to {path}")
+
+    def clear(self, platform_name: str):
+        path = self.path(platform_name)
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,117 @@
+import json
+import pathlib
+import re
+from typing import List, Dict, Any
+from src.scrapers.html_text import css, parse_html, element_text
+from src.scrapers.rate_limiter import RateLimit
+from src.scrapers.resource_policy import ResourcePolicy
+
+SPEC_DIR = pathlib.Path(__file__).parent / "specs"
+
+# Keys every spec must define, per section
+REQUIRED_KEYS = {
+    "": ["platform_name", "base_url", "search", "cards", "description"],
+    "search": ["url_template", "splitter"],
+    "cards": ["card", "title", "company", "location"],
+    "description": ["selectors"],
+}
+
+class DescriptionRule:
+    """
+    Compiled description extraction for one platform.
+
+    Takes the text of the first element matched by `selectors` (tried in
+    order), then, when delimiters are given, keeps the section from the
+    `start_pattern` match up to the `end_pattern` match (regular expressions).
+    Text without the end delimiter is cut to `max_chars`.
+    """
+
+    def __init__(self, selectors: List[str], start_pattern: str | None = None, end_pattern: str | None = None, max_chars: int | None = None):
+        self.selectors = [css(selector) for selector in selectors]
+        self.start = re.compile(start_pattern) if start_pattern else None
+        self.end = re.compile(end_pattern) if end_pattern else None
+        self.max_chars = max_chars
+
+    def extract(self, html: str) -> str | None:
+        root = parse_html(html)
+        if root is None:
+            return None
+        for selector in self.selectors:
+            matches = selector(root)
+            if matches:
+                text = self.section(element_text(matches[0])).strip()
+                return text or None
+        return None
+
+    def section(self, text: str) -> str:
+        end = self.end.search(text) if self.end else None
+        start = self.start.search(text) if self.start else None
+        if start and end and end.start() > start.start():
+            return text[start.start():end.start()]
+        if end:
+            return text[:end.start()]
+        if self.max_chars:
+            # Expected section missing: keep the top of the page rather than nothing
+            return text[:self.max_chars]
+        return text
+
+
+class ExtractionSpec:
+    """
+    A platform's scraping rules as data: search URL template, job card
+    selectors, description rule and fetching limits.
+
+    Specs are JSON files in `SPEC_DIR` named after the platform; see
+    `scraper_args` for how each key maps onto a `Scraper`.
+    """
+
+    def __init__(self, data: Dict[str, Any], source: str = "<spec>"):
+        for section, keys in REQUIRED_KEYS.items():
+            values = data.get(section, {}) if section else data
+            missing = [key for key in keys if key not in values]
+            if missing:
+                where = f"'{section}'" if section else "top level"
+                raise ValueError(f"Spec {source} is missing {missing} at {where}")
+        self.data = data
+        self.source = source
+        self.description_rule = DescriptionRule(**{
+            key: data["description"][key]
+            for key in ("selectors", "start_pattern", "end_pattern", "max_chars")
+            if key in data["description"]
+        })
+
+    @classmethod
+    def load(cls, name_or_path: str) -> "ExtractionSpec":
+        """Loads a bundled spec by platform name (e.g. "indeed") or a spec file by path."""
+        path = pathlib.Path(name_or_path)
+        if path.suffix != ".json":
+            path = SPEC_DIR / f"{name_or_path.lower()}.json"
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), source=str(path))
+
+    def scraper_args(self) -> Dict[str, Any]:
+        """Keyword arguments for `Scraper.__init__`."""
+        search, cards, description = self.data["search"], self.data["cards"], self.data["description"]
+        fetching = self.data.get("fetching", {})
+        return {
+            "base_url": self.data["base_url"],
+            "platform_name": self.data["platform_name"],
+            "search_page_url": search["url_template"],
+            "search_splitter": search["splitter"],
+            "remote_query": search.get("remote_query", ""),
+            "search_results_class": cards["card"],
+            "job_title_class": cards["title"],
+            "company_name_class": cards["company"],
+            "location_class": cards["location"],
+            "date_posted_class": cards.get("date"),
+            "date_posted_attribute": cards.get("date_attribute"),
+            "job_link_class": cards.get("link"),
+            "pagination_next_button_class": cards.get("next_button"),
+            "job_desc_class": description["selectors"][0],
+            "description_rule": self.description_rule,
+            "description_marker": description.get("http_marker"),
+            "headless": fetching.get("headless", True),
+            "requires_login": fetching.get("requires_login", False),
+            "resource_policy": ResourcePolicy(extra_blocked_domains=set(fetching.get("extra_blocked_domains", []))),
+            "rate_limit": RateLimit(**fetching.get("rate_limit", {})),
+        }
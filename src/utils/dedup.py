@@ -0,0 +1,309 @@
+import re
+import logging
+import unicodedata
+import zlib
+import threading
+import numpy as np
+from collections import defaultdict
+from typing import List, Dict, Any, Iterable, Set, Tuple
+from src.db.job_record import PLACEHOLDER_DESCRIPTIONS
+
+# Company name suffixes that differ between sites for the same employer
+COMPANY_SUFFIXES = {
+    "pt", "tbk", "persero", "cv", "inc", "llc", "ltd", "limited", "corp",
+    "corporation", "co", "company", "gmbh", "plc", "group",
+}
+TITLE_ABBREVIATIONS = {"sr": "senior", "jr": "junior", "mgr": "manager", "eng": "engineer", "dev": "developer"}
+# Normalized locations that say nothing about where the job is ("n a" is N/A)
+VAGUE_LOCATIONS = {"", "n a", "remote", "anywhere", "worldwide", "indonesia", "united states"}
+
+HASH_SHIFT = np.uint64(32)
+MAX_HASH = np.uint64((1 << 32) - 1)
+SHINGLE_MULTIPLIER = np.uint64(1_000_003)
+
+def normalize(text: str | None) -> str:
+    """Lowercases, strips accents and punctuation, and collapses whitespace."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text.lower()).split())
+
+def normalize_company(company: str | None) -> str:
+    name = " ".join(word for word in normalize(company).split() if word not in COMPANY_SUFFIXES)
+    return "" if name == "n a" else name
+
+def normalize_title(title: str | None) -> str:
+    return " ".join(TITLE_ABBREVIATIONS.get(word, word) for word in normalize(title).split())
+
+def location_tokens(location: str | None) -> Set[str]:
+    if normalize(location) in VAGUE_LOCATIONS:
+        return set()
+    return {token for part in (location or "").split(",") if (token := normalize(part)) not in VAGUE_LOCATIONS}
+
+def locations_compatible(a: Set[str], b: Set[str]) -> bool:
+    """True when either location is unknown or remote, or they share a place name."""
+    if not a or not b:
+        return True
+    words_a = {word for token in a for word in token.split()}
+    words_b = {word for token in b for word in token.split()}
+    return bool(words_a & words_b)
+
+
+class MinHasher:
+    """
+    MinHash signatures over word shingles, so the Jaccard similarity of two
+    descriptions can be estimated from `num_perm` integers each.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        # Odd multipliers keep multiply-shift hashing universal
+        self.a = rng.randint(0, np.iinfo(np.int64).max, num_perm, dtype=np.int64).astype(np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = rng.randint(0, np.iinfo(np.int64).max, num_perm, dtype=np.int64).astype(np.uint64)
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        """
+        Hashes every run of `shingle_size` words, combining per-word hashes
+        arithmetically instead of building the shingle strings.
+        """
+        words = normalize(text).split()
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+        word_hashes = np.fromiter((zlib.crc32(word.encode()) for word in words), dtype=np.uint64, count=len(words))
+        size = min(self.shingle_size, len(words))
+        combined = np.zeros(len(words) - size + 1, dtype=np.uint64)
+        for offset in range(size):
+            combined = combined * SHINGLE_MULTIPLIER + word_hashes[offset:len(words) - size + 1 + offset]
+        return np.unique(combined & MAX_HASH)
+
+    def signature(self, text: str | None) -> np.ndarray | None:
+        """Returns the signature of `text`, or None when it has no words."""
+        hashes = self.shingle_hashes(text or "")
+        if not len(hashes):
+            return None
+        # Multiply-shift hashing: the high 32 bits of a*x + b (mod 2**64) per permutation
+        permuted = (hashes[:, None] * self.a + self.b) >> HASH_SHIFT
+        return permuted.min(axis=0).astype(np.uint32)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        return float(np.mean(a == b))
+
+
+class LSHIndex:
+    """
+    Banded locality-sensitive hashing over MinHash signatures.
+
+    Signatures that agree on every row of at least one of the `bands` bands
+    land in a shared bucket, which makes them candidates; with 16 bands of 8
+    rows, pairs above ~0.7 Jaccard collide with high probability. Buckets past
+    `max_bucket` members (boilerplate text) stop taking new members so lookups
+    stay bounded.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 8, max_bucket: int = 50):
+        self.bands = bands
+        self.rows = rows
+        self.max_bucket = max_bucket
+        self.buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+
+    def query_and_add(self, key: int, signature: np.ndarray) -> Set[int]:
+        """Returns the keys sharing a bucket with `signature`, then indexes it."""
+        candidates = set()
+        for band in range(self.bands):
+            bucket = self.buckets[(band, signature[band * self.rows:(band + 1) * self.rows].tobytes())]
+            candidates.update(bucket)
+            if len(bucket) < self.max_bucket:
+                bucket.append(key)
+        return candidates
+
+
+class Deduplicator:
+    """
+    Clusters postings of the same job found on different sites or URLs.
+
+    Two postings are duplicates when they share a normalized title and company
+    in compatible locations (unless both descriptions clearly differ), or when
+    their descriptions are near-identical (MinHash estimate of at least
+    `threshold`) for the same company in compatible locations. Candidates come only from the
+    title/company key and LSH buckets, so adding a job costs roughly the same
+    however many jobs were added before.
+
+    Clusters only merge when every member of one could be the same opening as
+    every member of the other, so matches do not chain across cities. A
+    posting with no description or only a vague location ("Indonesia")
+    matches openings it cannot tell apart, so it joins one cluster at most.
+    """
+
+    # Same title and company but descriptions this different are separate openings
+    MIN_SIMILARITY_SAME_TITLE = 0.3
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, bands: int = 16):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.lsh = LSHIndex(bands, num_perm // bands)
+        self.jobs: List[Dict[str, Any]] = []
+        self.signatures: List[np.ndarray | None] = []
+        self.by_key: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        self.parent: List[int] = []
+        self.members: Dict[int, List[int]] = {}
+
+    def add(self, job: Dict[str, Any]):
+        """Indexes one job; only its listing fields and description length are kept."""
+        index = len(self.jobs)
+        # Placeholders stored by older scrapers say nothing about the job
+        description = job.get("description")
+        if description in PLACEHOLDER_DESCRIPTIONS:
+            description = None
+        meta = {
+            "url": job["url"],
+            "source": job.get("platform") or job.get("source"),
+            "company": normalize_company(job.get("company")),
+            "locations": location_tokens(job.get("location")),
+            "description_length": len(description or ""),
+        }
+        key = (normalize_title(job.get("title")), meta["company"])
+        signature = self.hasher.signature(description)
+        self.jobs.append(meta)
+        self.signatures.append(signature)
+        self.parent.append(index)
+        self.members[index] = [index]
+
+        matches = []
+        if all(key):
+            same_key = self.by_key[key]
+            matches.extend(other for other in same_key if self._same_opening(index, other))
+            # Like LSH buckets, a very common title at one company stops growing
+            if len(same_key) < self.lsh.max_bucket:
+                same_key.append(index)
+
+        if signature is not None:
+            matches.extend(
+                other for other in sorted(self.lsh.query_and_add(index, signature))
+                if self.jobs[other]["company"] == meta["company"]
+                and locations_compatible(self.jobs[other]["locations"], meta["locations"])
+                and MinHasher.similarity(signature, self.signatures[other]) >= self.threshold
+            )
+
+        vague = signature is None or not meta["locations"]
+        for other in matches:
+            if self._union(index, other) and vague:
+                break
+
+    def add_all(self, jobs: Iterable[Dict[str, Any]]):
+        for job in jobs:
+            self.add(job)
+
+    def _same_opening(self, a: int, b: int) -> bool:
+        if not locations_compatible(self.jobs[a]["locations"], self.jobs[b]["locations"]):
+            return False
+        sig_a, sig_b = self.signatures[a], self.signatures[b]
+        if sig_a is None or sig_b is None:
+            return True
+        return MinHasher.similarity(sig_a, sig_b) >= self.MIN_SIMILARITY_SAME_TITLE
+
+    def _find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def _union(self, a: int, b: int) -> bool:
+        """Merges the clusters of `a` and `b` if all their members are compatible; returns whether they are one cluster."""
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a == root_b:
+            return True
+        if not all(self._same_opening(x, y) for x in self.members[root_a] for y in self.members[root_b]):
+            return False
+        root, merged = min(root_a, root_b), max(root_a, root_b)
+        self.parent[merged] = root
+        self.members[root].extend(self.members.pop(merged))
+        return True
+
+    def clusters(self) -> List[Dict[str, Any]]:
+        """
+        Returns every group of two or more postings as its canonical URL (the
+        fullest description, then the first added) and each posting's source
+        and URL.
+        """
+        groups = defaultdict(list)
+        for i in range(len(self.jobs)):
+            groups[self._find(i)].append(self.jobs[i])
+
+        clusters = []
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            canonical = max(members, key=lambda job: job["description_length"])
+            clusters.append({
+                "canonical_url": canonical["url"],
+                "sources": [{"source": job["source"], "url": job["url"]} for job in members],
+            })
+        return clusters
+
+
+def find_duplicates(jobs: Iterable[Dict[str, Any]], threshold: float = 0.7) -> List[Dict[str, Any]]:
+    """Clusters near-duplicate postings in `jobs`; see Deduplicator."""
+    deduplicator = Deduplicator(threshold)
+    deduplicator.add_all(jobs)
+    return deduplicator.clusters()
+
+
+def dedupe_collection(db, threshold: float = 0.7, batch_size: int = 1000) -> Dict[str, int]:
+    """
+    Streams every stored job through a Deduplicator and records the clusters
+    in MongoDB. Returns how many clusters and duplicate postings were found.
+    """
+    deduplicator = Deduplicator(threshold)
+    fields = ["url", "source", "platform", "title", "company", "location", "description"]
+    for batch in db.iter_job_batches(fields=fields, batch_size=batch_size):
+        deduplicator.add_all(batch)
+    clusters = deduplicator.clusters()
+    db.save_duplicate_clusters(clusters)
+
+    duplicates = sum(len(cluster["sources"]) - 1 for cluster in clusters)
+    logging.info(f"Deduplicated {len(deduplicator.jobs)} jobs: {len(clusters)} clusters, {duplicates} duplicate postings")
+    return {"jobs": len(deduplicator.jobs), "clusters": len(clusters), "duplicates": duplicates}
+
+
+class BackgroundDedupe:
+    """
+    Runs dedupe_collection on a daemon thread, so a crawl's results are shown
+    without waiting for the full pass (about half a minute at 100k jobs).
+    A request made while a pass is running queues one more pass after it,
+    so the jobs of the latest crawl are always covered.
+    """
+
+    def __init__(self, db, threshold: float = 0.7):
+        self.db = db
+        self.threshold = threshold
+        self.last_result: Dict[str, int] | None = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._again = False
+        self._thread: threading.Thread | None = None
+
+    def request(self) -> threading.Thread:
+        """Starts a pass, or queues one if a pass is running; returns the worker thread."""
+        with self._lock:
+            if self._running:
+                self._again = True
+                return self._thread
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="dedupe", daemon=True)
+            self._thread.start()
+            return self._thread
+
+    def _run(self):
+        while True:
+            try:
+                self.last_result = dedupe_collection(self.db, self.threshold)
+            except Exception as e:
+                logging.error(f"Background deduplication failed: {e}")
+            with self._lock:
+                if not self._again:
+                    self._running = False
+                    return
+                self._again = False
@@ -0,0 +1,146 @@
+import re
+import logging
+from dataclasses import dataclass
+from typing import List, Callable, Tuple
+import tiktoken
+from src.db.job_record import JobRecord, JobSource
+
+# Whole lines that are page chrome rather than job content, per platform
+BOILERPLATE_PATTERNS = {
+    None: [
+        r"show (more|less)", r"see (more|less)", r"read more", r"(easy )?apply( now)?", r"save( job)?",
+        r"share( this job)?", r"report (this )?job", r"back to (search|results)", r"\W*",
+    ],
+    JobSource.LINKEDIN: [
+        r"seniority level", r"employment type", r"job function", r"industries", r"about the job",
+        r"referrals increase your chances.*", r"get notified about new .* jobs.*", r"sign in to .*",
+        r"see who .* has hired for this role", r"\d+ applicants?", r"be an early applicant",
+    ],
+    JobSource.INDEED: [
+        r"full job description", r"job details", r"hiring insights", r"job activity",
+        r"(posted|active) \d+\+? days? ago", r"if you require alternative methods of application or screening.*",
+    ],
+    JobSource.GLINTS: [
+        r"lamar( sekarang)?", r"laporkan lowongan", r"bagikan", r"simpan", r"lihat semua( lowongan)?",
+        r"diperbarui .* yang lalu", r"\d+ pelamar",
+    ],
+}
+BOILERPLATE = {
+    source: re.compile("|".join(f"(?:{p})" for p in BOILERPLATE_PATTERNS[None] + (BOILERPLATE_PATTERNS[source] if source else [])), re.IGNORECASE)
+    for source in BOILERPLATE_PATTERNS
+}
+
+# Sections kept first and sections dropped first when a description is over budget
+KEY_SECTION = re.compile(
+    r"requirement|qualification|responsibilit|what you('ll| will) do|skills|must have|"
+    r"kualifikasi|persyaratan|tanggung jawab|deskripsi pekerjaan|job description",
+    re.IGNORECASE
+)
+LOW_SECTION = re.compile(
+    r"benefit|perks|about (us|the company)|tentang perusahaan|equal opportunit|how to apply|cara melamar|keuntungan",
+    re.IGNORECASE
+)
+
+def is_heading(line: str) -> bool:
+    """A short line ending in a colon, or a few words starting with a known section name."""
+    if len(line) > 60 or line.endswith((".", "!", "?", ",", ";")):
+        return False
+    if line.endswith(":"):
+        return True
+    return len(line.split()) <= 4 and bool(KEY_SECTION.match(line) or LOW_SECTION.match(line))
+
+def token_counter(model: str) -> Callable[[str], int]:
+    """Counts tokens with the model's tiktoken encoding, or estimates when it cannot be loaded."""
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except Exception as e:
+        # Unknown model, or the encoding file could not be downloaded
+        logging.warning(f"No tiktoken encoding for {model} ({e}); estimating 4 characters per token")
+        return lambda text: (len(text) + 3) // 4
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+@dataclass(slots=True)
+class Compacted:
+    text: str
+    tokens_before: int
+    tokens_after: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+
+class DescriptionCompactor:
+    """
+    Shrinks scraped descriptions before they are stored and sent to an LLM.
+
+    Lines are whitespace-normalized, repeated lines and known platform chrome
+    ("Show more", "Report this job", ...) are dropped, and a description still
+    over `max_tokens` is cut section by section: requirement and
+    responsibility sections are kept first, benefits and company blurbs
+    dropped first, and the kept sections stay in page order.
+    """
+
+    def __init__(self, max_tokens: int = 800, model: str = "gpt-4o-mini", count_tokens: Callable[[str], int] | None = None):
+        self.max_tokens = max_tokens
+        self.count_tokens = count_tokens or token_counter(model)
+
+    def clean_lines(self, text: str, source: JobSource | None = None) -> List[str]:
+        boilerplate = BOILERPLATE.get(source, BOILERPLATE[None])
+        lines, seen = [], set()
+        for raw in text.splitlines():
+            line = " ".join(raw.split())
+            key = line.lower()
+            if not line or key in seen or boilerplate.fullmatch(line):
+                continue
+            seen.add(key)
+            lines.append(line)
+        return lines
+
+    @staticmethod
+    def sections(lines: List[str]) -> List[Tuple[int, List[str]]]:
+        """Splits lines at headings into (rank, lines) sections; rank 0 is kept first."""
+        sections = [(1, [])]
+        for line in lines:
+            if is_heading(line):
+                rank = 0 if KEY_SECTION.search(line) else 2 if LOW_SECTION.search(line) else 1
+                sections.append((rank, [line]))
+            else:
+                sections[-1][1].append(line)
+        return [section for section in sections if section[1]]
+
+    def compact(self, text: str, source: JobSource | None = None) -> Compacted:
+        tokens_before = self.count_tokens(text)
+        lines = self.clean_lines(text, source)
+        cleaned = "\n".join(lines)
+        tokens = self.count_tokens(cleaned)
+        if tokens <= self.max_tokens:
+            return Compacted(cleaned, tokens_before, tokens)
+
+        sections = self.sections(lines)
+        kept: List[List[str]] = [[] for _ in sections]
+        budget = self.max_tokens
+        for index in sorted(range(len(sections)), key=lambda i: sections[i][0]):
+            for line in sections[index][1]:
+                # +1 for the newline joining it to the previous line
+                cost = self.count_tokens(line) + 1
+                if cost > budget:
+                    break
+                kept[index].append(line)
+                budget -= cost
+            if len(kept[index]) == 1 < len(sections[index][1]) and is_heading(kept[index][0]):
+                # A heading without any of its lines says nothing
+                budget += self.count_tokens(kept[index].pop()) + 1
+        compacted = "\n".join(line for section in kept for line in section)
+        return Compacted(compacted, tokens_before, self.count_tokens(compacted))
+
+    def compact_job(self, job: JobRecord) -> int:
+        """Compacts a job's description in place and returns the tokens saved."""
+        if not job.description:
+            return 0
+        result = self.compact(job.description, job.source)
+        job.description = result.text or None
+        if result.tokens_saved:
+            logging.debug(f"Compacted {job.url}: {result.tokens_before} -> {result.tokens_after} tokens")
+        return result.tokens_saved
@@ -0,0 +1,180 @@
+import os
+import json
+import zlib
+import logging
+import pathlib
+import threading
+import numpy as np
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Iterable, Tuple
+from src.db.job_record import JobRecord, PLACEHOLDER_DESCRIPTIONS
+from src.utils.dedup import normalize
+
+VECTOR_DTYPE = np.float32
+
+def hashed_term_counts(text: str, dim: int) -> np.ndarray:
+    """Counts of the text's words and word pairs, hashed into `dim` buckets."""
+    words = normalize(text).split()
+    terms = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    if not terms:
+        return np.zeros(dim, dtype=VECTOR_DTYPE)
+    buckets = np.fromiter((zlib.crc32(term.encode()) % dim for term in terms), dtype=np.int64, count=len(terms))
+    return np.bincount(buckets, minlength=dim).astype(VECTOR_DTYPE)
+
+
+class JobIndex:
+    """
+    Offline TF-IDF index of job postings, for ranking them against a resume.
+
+    Each job's title and description become a vector of log term frequencies
+    over hashed words and word pairs, stored as one row of a memory-mapped
+    float32 matrix on disk (`directory`, default JOB_INDEX_DIR or .job_index).
+    Document frequencies are kept alongside, so IDF weights are applied at
+    query time and adding jobs never rewrites existing rows. `search`
+    scores every row with a single matrix-vector product.
+    """
+
+    def __init__(self, directory: str | None = None, dim: int = 2048):
+        self.directory = pathlib.Path(directory or os.getenv("JOB_INDEX_DIR", ".job_index"))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._norms = None
+
+        meta_path = self.directory / "meta.json"
+        self.meta = json.loads(meta_path.read_text()) if meta_path.exists() else {"dim": dim, "count": 0, "synced_at": None}
+        self.dim = self.meta["dim"]
+        urls_path = self.directory / "urls.txt"
+        urls = urls_path.read_text(encoding="utf-8").splitlines()[:self.meta["count"]] if urls_path.exists() else []
+        self.urls: List[str] = urls
+        self.rows: Dict[str, int] = {url: row for row, url in enumerate(urls)}
+        df_path = self.directory / "df.npy"
+        self.df = np.load(df_path) if df_path.exists() else np.zeros(self.dim, dtype=np.int64)
+
+        vectors_path = self.directory / "vectors.f32"
+        if not vectors_path.exists():
+            vectors_path.write_bytes(b"")
+        capacity = vectors_path.stat().st_size // (self.dim * np.dtype(VECTOR_DTYPE).itemsize)
+        self._map(max(capacity, self.meta["count"]))
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def _map(self, capacity: int):
+        path = self.directory / "vectors.f32"
+        size = capacity * self.dim * np.dtype(VECTOR_DTYPE).itemsize
+        if path.stat().st_size < size:
+            with open(path, "r+b") as f:
+                f.truncate(size)
+        self.capacity = capacity
+        self.vectors = np.memmap(path, dtype=VECTOR_DTYPE, mode="r+", shape=(capacity, self.dim)) if capacity else None
+
+    def add(self, jobs: Iterable[JobRecord | Dict[str, Any]]) -> int:
+        """
+        Indexes jobs (JobRecords or stored documents) that have a real description,
+        replacing the vectors of URLs already indexed. Returns how many were indexed.
+        """
+        entries = []
+        for job in jobs:
+            if isinstance(job, JobRecord):
+                job = job.to_mongo()
+            if job.get("description") and job["description"] not in PLACEHOLDER_DESCRIPTIONS:
+                text = f"{job.get('title') or ''}\n{job['description']}"
+                entries.append((job["url"], np.log1p(hashed_term_counts(text, self.dim))))
+        if not entries:
+            return 0
+
+        with self._lock:
+            new_urls = [url for url, _ in entries if url not in self.rows]
+            needed = len(self.urls) + len(set(new_urls))
+            if needed > self.capacity:
+                # Doubling keeps growth amortized; rows already written stay where they are
+                if self.vectors is not None:
+                    self.vectors.flush()
+                self._map(max(1024, needed, 2 * self.capacity))
+
+            appended = []
+            for url, vector in entries:
+                row = self.rows.get(url)
+                if row is None:
+                    row = self.rows[url] = len(self.urls)
+                    self.urls.append(url)
+                    appended.append(url)
+                else:
+                    self.df -= self.vectors[row] > 0
+                self.vectors[row] = vector
+                self.df += vector > 0
+            self._save(appended)
+            self._norms = None
+        return len(entries)
+
+    def _save(self, appended: List[str]):
+        self.vectors.flush()
+        if appended:
+            with open(self.directory / "urls.txt", "a", encoding="utf-8") as f:
+                f.writelines(f"{url}\n" for url in appended)
+        np.save(self.directory / "df.npy", self.df)
+        self.meta["count"] = len(self.urls)
+        (self.directory / "meta.json").write_text(json.dumps(self.meta))
+
+    def _weights(self) -> np.ndarray:
+        idf = np.log((1 + len(self.urls)) / (1 + self.df)) + 1
+        return (idf * idf).astype(VECTOR_DTYPE)
+
+    def search(self, text: str, k: int | None = 50) -> List[Tuple[str, float]]:
+        """
+        Returns the `k` best matching job URLs for `text` (all of them when k
+        is None) with their cosine similarity, best first.
+        """
+        with self._lock:
+            count = len(self.urls)
+            if not count:
+                return []
+            weights = self._weights()
+            matrix = self.vectors[:count]
+            if self._norms is None:
+                # Row norms under the current IDF weights; recomputed only after adds
+                self._norms = np.sqrt((matrix * matrix) @ weights)
+            query = np.log1p(hashed_term_counts(text, self.dim))
+            query_norm = np.sqrt((query * query) @ weights)
+            if not query_norm:
+                return []
+            scores = (matrix @ (query * weights)) / (np.maximum(self._norms, 1e-9) * query_norm)
+
+        if k is None or k >= count:
+            top = np.argsort(-scores)
+        else:
+            top = np.argpartition(-scores, k)[:k]
+            top = top[np.argsort(-scores[top])]
+        return [(self.urls[row], float(scores[row])) for row in top]
+
+    def sync(self, db, batch_size: int = 500) -> int:
+        """
+        Indexes the jobs stored or changed in MongoDB since the last sync
+        (every job on the first one). Returns how many were indexed.
+        """
+        started = datetime.now(timezone.utc)
+        fields = ["url", "title", "description"]
+        synced_at = self.meta.get("synced_at")
+        if synced_at is None:
+            batches = db.iter_job_batches(fields=fields, batch_size=batch_size)
+        else:
+            changed = db.changed_since(datetime.fromisoformat(synced_at), fields=fields)
+            batches = _chunks(changed, batch_size)
+        indexed = sum(self.add(batch) for batch in batches)
+        with self._lock:
+            self.meta["synced_at"] = started.isoformat()
+            (self.directory / "meta.json").write_text(json.dumps(self.meta))
+        if indexed:
+            logging.info(f"Job index: indexed {indexed} jobs, {len(self)} in total")
+        return indexed
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,118 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import Dict, Any, Sequence
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS llm_cache_last_used ON llm_cache (last_used_at);
+"""
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    """
+    Content address of one LLM call. LangChain passes the rendered prompt
+    messages (template and inputs) as `prompt` and the model's name,
+    temperature and other parameters as `llm_string`.
+    """
+    return hashlib.sha256(f"{llm_string}\x00{prompt}".encode()).hexdigest()
+
+def _dump_generations(generations: Sequence[Generation]) -> str:
+    return json.dumps([
+        {"text": g.text, "message": message_to_dict(g.message)} if isinstance(g, ChatGeneration) else {"text": g.text}
+        for g in generations
+    ])
+
+def _load_generations(data: str) -> list[Generation]:
+    return [
+        ChatGeneration(message=messages_from_dict([g["message"]])[0]) if "message" in g else Generation(text=g["text"])
+        for g in json.loads(data)
+    ]
+
+
+class LLMCache(BaseCache):
+    """
+    LangChain cache of model responses in a local SQLite file.
+
+    Pass it as a chat model's `cache` so identical calls (same prompt, inputs,
+    model and temperature) are answered from disk. Entries expire after `ttl`
+    seconds, and past `max_entries` the least recently used are evicted.
+    Hits and misses are counted per instance; see `stats`.
+    """
+
+    def __init__(self, path: str | None = None, ttl: float | None = 30 * 24 * 3600, max_entries: int = 10000):
+        self.path = path or os.getenv("LLM_CACHE_PATH", ".llm_cache.sqlite3")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # Async chains look up from executor threads, so one connection is shared under a lock
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        key = cache_key(prompt, llm_string)
+        now = time.time()
+        with self._lock, self.conn:
+            row = self.conn.execute("SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                self.conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.conn.execute("UPDATE llm_cache SET last_used_at = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        return _load_generations(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+                (cache_key(prompt, llm_string), _dump_generations(return_val), now, now)
+            )
+            self.conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM llm_cache")
+
+    def close(self):
+        self.conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns this instance's hits, misses and hit rate, and the number of stored entries."""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def log_stats(self, name: str):
+        stats = self.stats()
+        logging.info(
+            f"{name} LLM cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate), {stats['entries']} entries stored"
+        )
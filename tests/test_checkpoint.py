@@ -0,0 +1,126 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from src.scrapers.checkpoint import CrawlCheckpoint
+from src.scrapers.orchestrator import CrawlOrchestrator
+from src.db.job_record import JobRecord
+from src.db.sink import BatchingSink
+from tests.test_scrapers import FakeBrowser, ScriptedScraper
+from tests.test_sink import RecordingDB
+
+
+class CheckpointedScraper(ScriptedScraper):
+    """Scripted scraper that records its searches like the real search walk."""
+
+    def __init__(self, listings_per_search=3):
+        super().__init__(listings_per_search)
+        self.searches_run = []
+
+    async def search(self, context, search_url, state):
+        self.searches_run.append(search_url)
+        await super().search(context, search_url, state)
+        if state.progress:
+            state.progress.record_search(search_url, self.listings_per_search, done=True)
+
+
+class ScriptedOrchestrator(CrawlOrchestrator):
+    """Replays a fixed list of crawl events instead of launching a browser."""
+
+    def __init__(self, events):
+        super().__init__([])
+        self.events = events
+
+    async def stream(self, *args, **kwargs):
+        for event in self.events:
+            yield event
+
+
+class TestCrawlCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.checkpoint = CrawlCheckpoint(os.path.join(self.tmpdir.name, "crawls.sqlite3"))
+
+    def tearDown(self):
+        self.checkpoint.close()
+        self.tmpdir.cleanup()
+
+    def test_unfinished_until_finished(self):
+        crawl_id = self.checkpoint.start({"job_titles": ["AI Engineer"], "locations": ["Jakarta"], "remote_only": False, "limit": None})
+        self.assertEqual([c["crawl_id"] for c in self.checkpoint.unfinished()], [crawl_id])
+        self.assertEqual(self.checkpoint.params(crawl_id)["job_titles"], ["AI Engineer"])
+
+        progress = self.checkpoint.progress(crawl_id, "Indeed")
+        job = JobRecord.create("a", "A", "Indeed")
+        progress.record_listings([job], [job])
+        self.checkpoint.finish(crawl_id)
+        self.assertEqual(self.checkpoint.unfinished(), [])
+        self.assertEqual(progress.seen_urls(), set())
+
+    def test_usable_from_another_thread(self):
+        # Streamlit runs every rerun on a new thread against the one cached checkpoint
+        crawl_id = self.checkpoint.start({"job_titles": ["AI Engineer"], "locations": ["Jakarta"], "remote_only": False, "limit": None})
+        worker = threading.Thread(target=self.checkpoint.finish, args=(crawl_id,))
+        worker.start()
+        worker.join()
+        self.assertEqual(self.checkpoint.unfinished(), [])
+
+    def test_crawl_finished_after_last_flush(self):
+        job = JobRecord.create("a", "A", "Indeed")
+        unfinished_at_flush = []
+        sink = BatchingSink(RecordingDB(), on_flush=lambda summary: unfinished_at_flush.append(len(self.checkpoint.unfinished())))
+        orchestrator = ScriptedOrchestrator([("Indeed", job, None), ("Indeed", None, None)])
+        orchestrator.run(sink, ["A"], ["Jakarta"], False, checkpoint=self.checkpoint)
+        self.assertEqual(unfinished_at_flush, [1])
+        self.assertEqual(self.checkpoint.unfinished(), [])
+
+    def test_crawl_left_unfinished_when_a_scraper_fails(self):
+        events = [("Indeed", JobRecord.create("a", "A", "Indeed"), None), ("Indeed", None, None), ("LinkedIn", None, RuntimeError("login failed"))]
+        ScriptedOrchestrator(events).run(BatchingSink(RecordingDB()), ["A"], ["Jakarta"], False, checkpoint=self.checkpoint)
+        self.assertEqual(len(self.checkpoint.unfinished()), 1)
+
+    def test_progress_per_platform(self):
+        crawl_id = self.checkpoint.start({})
+        indeed = self.checkpoint.progress(crawl_id, "Indeed")
+        indeed.record_search("search", 4, done=False)
+        a, b = JobRecord.create("a", "A", "Indeed"), JobRecord.create("b", "B", "Indeed", date_posted="2026-01-05")
+        indeed.record_listings([a, b], [b])
+        b.description = "Details"
+        indeed.record_fetched(b)
+
+        self.assertEqual(indeed.search_found("search"), 4)
+        self.assertFalse(indeed.search_done("search"))
+        self.assertEqual(indeed.seen_urls(), {"a", "b"})
+        self.assertEqual(indeed.pending_jobs(fetched=True), [b])
+        self.assertEqual(self.checkpoint.progress(crawl_id, "LinkedIn").seen_urls(), set())
+
+    def test_interrupted_crawl_resumes(self):
+        crawl_id = self.checkpoint.start({})
+        titles, locations = ["AI Engineer", "Data Scientist"], ["Jakarta"]
+
+        async def crawl(scraper, stop_after=None):
+            jobs = []
+            progress = self.checkpoint.progress(crawl_id, scraper.platform_name)
+            stream = scraper.stream(titles, locations, False, browser=FakeBrowser(), progress=progress)
+            async for job in stream:
+                jobs.append(job)
+                if len(jobs) == stop_after:
+                    # Stands in for the process being killed mid-crawl
+                    await stream.aclose()
+                    break
+            return jobs
+
+        first = asyncio.run(crawl(CheckpointedScraper(), stop_after=2))
+        self.assertEqual(len(first), 2)
+
+        resumed_scraper = CheckpointedScraper()
+        resumed = asyncio.run(crawl(resumed_scraper))
+        self.assertEqual(resumed_scraper.searches_run, [])
+        urls = {job.url for job in first + resumed}
+        self.assertEqual(len(urls), 6)
+        self.assertTrue(all(job.description.startswith("Description of") for job in resumed))
+
+
+if __name__ == '__main__':
+    unittest.main()
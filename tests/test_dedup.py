@@ -0,0 +1,122 @@
+import random
+import threading
+import unittest
+from src.utils.dedup import BackgroundDedupe, find_duplicates, normalize_company, location_tokens, locations_compatible
+
+DESCRIPTION = (
+    "We are looking for an AI Engineer to build and deploy machine learning models. "
+    "You will work with Python, PyTorch and cloud infrastructure to ship features to millions of users. "
+    "Requirements: 3 years of experience, strong software engineering skills and a degree in computer science."
+)
+
+
+class TestNormalization(unittest.TestCase):
+    def test_company_suffixes_dropped(self):
+        self.assertEqual(normalize_company("PT. Gojek Indonesia Tbk"), normalize_company("Gojek Indonesia"))
+        self.assertEqual(normalize_company("N/A"), "")
+
+    def test_locations(self):
+        self.assertTrue(locations_compatible(location_tokens("Tebet, Jakarta Selatan"), location_tokens("Jakarta, Indonesia")))
+        self.assertTrue(locations_compatible(location_tokens("Remote"), location_tokens("Bandung")))
+        self.assertFalse(locations_compatible(location_tokens("Bandung"), location_tokens("Surabaya")))
+
+
+class TestFindDuplicates(unittest.TestCase):
+    def test_cross_source_postings_clustered(self):
+        clusters = find_duplicates([
+            {"url": "https://linkedin.com/1", "source": "LinkedIn", "title": "Sr. AI Engineer", "company": "Acme Inc.", "location": "Jakarta, Indonesia", "description": DESCRIPTION},
+            {"url": "https://indeed.com/1", "source": "Indeed", "title": "Senior AI Engineer", "company": "ACME", "location": "Jakarta", "description": DESCRIPTION + " Apply now!"},
+            {"url": "https://glints.com/1", "source": "Glints", "title": "Senior AI Engineer", "company": "PT Acme", "location": "Jakarta Selatan"},
+        ])
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0]["canonical_url"], "https://indeed.com/1")
+        self.assertEqual({p["source"] for p in clusters[0]["sources"]}, {"LinkedIn", "Indeed", "Glints"})
+
+    def test_distinct_openings_kept_apart(self):
+        clusters = find_duplicates([
+            # Same title and company in different cities
+            {"url": "a", "title": "AI Engineer", "company": "Acme", "location": "Bandung", "description": DESCRIPTION},
+            {"url": "b", "title": "AI Engineer", "company": "Acme", "location": "Surabaya", "description": DESCRIPTION},
+            # An agency template reused for different clients
+            {"url": "c", "title": "ML Engineer", "company": "Globex", "location": "Jakarta", "description": DESCRIPTION},
+        ])
+        self.assertEqual(clusters, [])
+
+    def test_vague_postings_never_bridge_clusters(self):
+        jakarta = {"url": "jakarta", "title": "Software Engineer", "company": "Gojek", "location": "Jakarta", "description": DESCRIPTION}
+        surabaya = {"url": "surabaya", "title": "Software Engineer", "company": "Gojek", "location": "Surabaya",
+                    "description": "Maintain payment services in Go and Kotlin for our merchants across East Java, on call one week a month."}
+        # No description and a country-wide location: could be either opening
+        anywhere = {"url": "anywhere", "title": "Software Engineer", "company": "Gojek", "location": "Indonesia"}
+        for order in ([jakarta, surabaya, anywhere], [anywhere, jakarta, surabaya], [surabaya, anywhere, jakarta]):
+            clusters = find_duplicates(order)
+            self.assertEqual(len(clusters), 1)
+            self.assertEqual(len(clusters[0]["sources"]), 2)
+            self.assertIn("anywhere", {p["url"] for p in clusters[0]["sources"]})
+
+        # A second Jakarta posting still joins the Jakarta cluster
+        clusters = find_duplicates([jakarta, anywhere, surabaya, {**jakarta, "url": "jakarta-2", "location": "Jakarta Selatan"}])
+        self.assertEqual({p["url"] for p in clusters[0]["sources"]}, {"jakarta", "anywhere", "jakarta-2"})
+
+    def test_placeholder_descriptions_are_missing(self):
+        clusters = find_duplicates([
+            {"url": "a", "title": "Data Engineer", "company": "Acme", "location": "Jakarta", "description": "Description not found"},
+            {"url": "b", "title": "Sales Manager", "company": "Acme", "location": "Jakarta", "description": "Description not found"},
+            {"url": "c", "title": "Sales Manager", "company": "Acme", "location": "Jakarta", "description": "Description not scraped in list view"},
+        ])
+        self.assertEqual([{p["url"] for p in cluster["sources"]} for cluster in clusters], [{"b", "c"}])
+
+    def test_recovers_clusters_at_scale(self):
+        rng = random.Random(7)
+        vocabulary = [f"word{i}" for i in range(5000)]
+        jobs = []
+        for i in range(3000):
+            description = " ".join(rng.choices(vocabulary, k=120))
+            job = {"url": f"https://a/{i}", "source": "A", "title": f"Role {i}", "company": f"Company {i % 300}", "location": "Jakarta", "description": description}
+            jobs.append(job)
+            if i % 10 == 0:
+                # Reposted elsewhere under a different title with a small edit
+                edited = description.split()
+                edited[rng.randrange(len(edited))] = "changed"
+                jobs.append({**job, "url": f"https://b/{i}", "source": "B", "title": f"Position {i}", "description": " ".join(edited)})
+        rng.shuffle(jobs)
+
+        clusters = find_duplicates(jobs)
+        self.assertEqual(len(clusters), 300)
+        for cluster in clusters:
+            self.assertEqual(len({p["url"].rsplit("/", 1)[1] for p in cluster["sources"]}), 1)
+
+
+class StoredJobsDB:
+    """Stands in for MongoDB; each pass blocks until `release` is set."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.release = threading.Event()
+        self.saved = []
+
+    def iter_job_batches(self, fields=None, batch_size=500):
+        self.release.wait(5)
+        yield list(self.jobs)
+
+    def save_duplicate_clusters(self, clusters):
+        self.saved.append(clusters)
+
+
+class TestBackgroundDedupe(unittest.TestCase):
+    def test_requests_during_a_pass_queue_one_more(self):
+        db = StoredJobsDB([{"url": u, "title": "AI Engineer", "company": "Acme", "location": "Jakarta"} for u in ("a", "b")])
+        deduper = BackgroundDedupe(db)
+        thread = deduper.request()
+        # Jobs stored by a second crawl while the first pass is running
+        db.jobs.append({"url": "c", "title": "AI Engineer", "company": "Acme", "location": "Jakarta"})
+        self.assertIs(deduper.request(), thread)
+        self.assertIs(deduper.request(), thread)
+        db.release.set()
+        thread.join(5)
+        self.assertEqual(len(db.saved), 2)
+        self.assertEqual(deduper.last_result, {"jobs": 3, "clusters": 1, "duplicates": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from src.db.job_record import JobRecord, JobSource
+from src.utils.description_compactor import DescriptionCompactor, is_heading
+
+
+def words(text):
+    return len(text.split())
+
+
+class TestDescriptionCompactor(unittest.TestCase):
+    def test_drops_repeats_and_platform_boilerplate(self):
+        text = "About the job\n  We build   models.\nSee who Acme has hired for this role\nWe build models.\n•\nShow more"
+        result = DescriptionCompactor(count_tokens=words).compact(text, JobSource.LINKEDIN)
+        self.assertEqual(result.text, "We build models.")
+        self.assertEqual(result.tokens_saved, words(text) - 3)
+
+    def test_over_budget_keeps_requirements_first(self):
+        text = "\n".join([
+            "Acme is a fast growing startup in Jakarta.",
+            "Benefits:",
+            "Free lunch and a gym membership for everyone.",
+            "Requirements:",
+            "3 years of Python.",
+            "Responsibilities",
+            "Ship ML models to production.",
+        ])
+        result = DescriptionCompactor(max_tokens=25, count_tokens=words).compact(text)
+        self.assertEqual(result.text.splitlines(), [
+            "Acme is a fast growing startup in Jakarta.",
+            "Requirements:",
+            "3 years of Python.",
+            "Responsibilities",
+            "Ship ML models to production.",
+        ])
+        self.assertLessEqual(result.tokens_after, 25)
+
+        # With less room the intro goes too, and no heading is left without its lines
+        result = DescriptionCompactor(max_tokens=20, count_tokens=words).compact(text)
+        self.assertEqual(result.text.splitlines()[0], "Requirements:")
+        self.assertEqual(len(result.text.splitlines()), 4)
+
+    def test_headings(self):
+        self.assertTrue(is_heading("Kualifikasi"))
+        self.assertTrue(is_heading("What you'll do:"))
+        self.assertFalse(is_heading("Skills in SQL and Python are a plus."))
+        self.assertFalse(is_heading("Python"))
+
+    def test_compact_job_in_place(self):
+        job = JobRecord.create("https://example.com/1", "AI Engineer", "Glints", description="Lamar\nBuat model AI\nBagikan")
+        saved = DescriptionCompactor(count_tokens=words).compact_job(job)
+        self.assertEqual(job.description, "Buat model AI")
+        self.assertEqual(saved, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 import unittest
 import os
-import pandas as pd
 from dotenv import load_dotenv
 from src.scrapers.glints_scraper import GlintsScraper
+from src.db.job_record import JobRecord
 
 load_dotenv()
 
@@ -24,20 +24,19 @@ class TestGlintsScraper(unittest.TestCase):
         
         print(f"Found {len(jobs)} jobs.")
         for job in jobs:
-            print(f"Title: {job['title']}")
-            print(f"Description Length: {len(job['description'])}")
-            print(f"Description Snippet: {job['description'][:100]}...")
+            print(f"Title: {job.title}")
+            print(f"Description Length: {len(job.description or '')}")
+            print(f"Description Snippet: {(job.description or '')[:100]}...")
             print("-" * 20)
             
         self.assertTrue(len(jobs) > 0, "Should find at least one job")
-        self.assertIn("title", jobs[0])
-        self.assertIn("company", jobs[0])
-        self.assertIn("url", jobs[0])
-        self.assertNotEqual(jobs[0]["description"], "Description not scraped", "Description should be scraped")
+        self.assertTrue(jobs[0].title)
+        self.assertTrue(jobs[0].url)
+        self.assertIsNotNone(jobs[0].description, "Description should be scraped")
         
         # Export to CSV
         if jobs:
-            df = pd.DataFrame(jobs)
+            df = JobRecord.to_dataframe(jobs)
             csv_filename = "glints_jobs.csv"
             df.to_csv(csv_filename, index=False)
             print(f"Successfully exported {len(jobs)} jobs to {csv_filename}")
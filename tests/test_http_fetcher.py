@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from src.scrapers.http_fetcher import HybridFetcher
+from src.scrapers.rate_limiter import RateLimited
+
+PAGES = {
+    "/server-rendered": "<html><body><div id='jobDescriptionText'>Build APIs</div></body></html>",
+    "/client-rendered": "<html><body><div id='root'></div><script src='app.js'></script></body></html>",
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/throttled":
+            self.send_response(429)
+            self.send_header("Retry-After", "12")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/members-only" and "session=abc" not in self.headers.get("Cookie", ""):
+            body = b"<html><body>Please log in</body></html>"
+        elif self.path in PAGES or self.path == "/members-only":
+            body = PAGES.get(self.path, PAGES["/server-rendered"]).encode()
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeContext:
+    def __init__(self, cookies):
+        self._cookies = cookies
+
+    async def cookies(self):
+        return self._cookies
+
+
+class TestHybridFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def fetch_all(self, paths, cookies=()):
+        async def run():
+            fetcher = HybridFetcher("jobDescriptionText", "test-agent")
+            await fetcher.open(FakeContext(list(cookies)))
+            try:
+                return [await fetcher.fetch(self.base_url + path) for path in paths], fetcher.stats()
+            finally:
+                await fetcher.close()
+        return asyncio.run(run())
+
+    def test_server_rendered_page_is_http_hit(self):
+        pages, stats = self.fetch_all(["/server-rendered"])
+        self.assertIn("Build APIs", pages[0])
+        self.assertEqual(stats["http_hits"], 1)
+        self.assertEqual(stats["hit_ratio"], 1.0)
+
+    def test_missing_marker_falls_back_to_browser(self):
+        pages, stats = self.fetch_all(["/client-rendered", "/not-found", "/server-rendered"])
+        self.assertIsNone(pages[0])
+        self.assertIsNone(pages[1])
+        self.assertEqual(stats["browser_fallbacks"], 2)
+        self.assertAlmostEqual(stats["hit_ratio"], 1 / 3)
+
+    def test_reuses_context_cookies(self):
+        cookie = {"name": "session", "value": "abc", "domain": "127.0.0.1", "path": "/"}
+        pages, _ = self.fetch_all(["/members-only"], cookies=[cookie])
+        self.assertIsNotNone(pages[0])
+        pages, _ = self.fetch_all(["/members-only"])
+        self.assertIsNone(pages[0])
+
+    def test_throttled_response_raises(self):
+        with self.assertRaises(RateLimited) as raised:
+            self.fetch_all(["/throttled"])
+        self.assertEqual(raised.exception.retry_after, 12.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
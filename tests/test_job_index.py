@@ -0,0 +1,80 @@
+import tempfile
+import time
+import unittest
+from src.db.job_record import JobRecord
+from src.utils.job_index import JobIndex
+
+RESUME = "Machine learning engineer. Python, PyTorch, training and deploying deep learning models, MLOps on AWS."
+
+
+def job(i, title, description):
+    return JobRecord.create(f"https://example.com/{i}", title, "Indeed", description=description)
+
+
+class StoredJobsDB:
+    """Stands in for MongoDB's batch and change-stream reads."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.since = None
+
+    def iter_job_batches(self, fields=None, batch_size=500):
+        yield [j.to_mongo() for j in self.jobs]
+
+    def changed_since(self, since, fields=None):
+        self.since = since
+        return iter([self.jobs[-1].to_mongo()])
+
+
+class TestJobIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.jobs = [
+            job(1, "Accountant", "Prepare monthly financial statements and tax reports. Excel and SAP."),
+            job(2, "ML Engineer", "Train and deploy deep learning models with PyTorch. Python, AWS, MLOps."),
+            job(3, "Barista", "Brew coffee and serve customers at our Jakarta cafe."),
+            job(4, "Data Analyst", "SQL dashboards, Python scripting and reporting for the sales team."),
+        ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_ranks_by_resume_and_persists(self):
+        index = JobIndex(self.tmpdir.name, dim=512)
+        placeholder = {"url": "https://example.com/6", "title": "Legacy row", "description": "Description not scraped in list view"}
+        self.assertEqual(index.add(self.jobs + [JobRecord.create("https://example.com/5", "No details", "Indeed"), placeholder]), 4)
+        ranked = index.search(RESUME, k=2)
+        self.assertEqual([url for url, _ in ranked], ["https://example.com/2", "https://example.com/4"])
+        self.assertGreater(ranked[0][1], ranked[1][1])
+
+        reopened = JobIndex(self.tmpdir.name)
+        self.assertEqual(len(reopened), 4)
+        self.assertEqual(reopened.search(RESUME, k=None)[0][0], "https://example.com/2")
+
+        # Re-adding a URL replaces its vector
+        reopened.add([job(2, "Pastry Chef", "Bake bread and cakes.")])
+        self.assertEqual(len(reopened), 4)
+        self.assertNotEqual(reopened.search(RESUME, k=1)[0][0], "https://example.com/2")
+
+    def test_grows_past_capacity(self):
+        index = JobIndex(self.tmpdir.name, dim=256)
+        many = [job(i, f"Role {i}", f"Task number {i} for the team") for i in range(100, 2600)]
+        for start in range(0, len(many), 500):
+            index.add(many[start:start + 500])
+        index.add(self.jobs)
+        self.assertEqual(len(index), 2504)
+        started = time.perf_counter()
+        self.assertEqual(index.search(RESUME, k=1)[0][0], "https://example.com/2")
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+    def test_sync_indexes_everything_then_changes(self):
+        index = JobIndex(self.tmpdir.name, dim=512)
+        db = StoredJobsDB(self.jobs)
+        self.assertEqual(index.sync(db), 4)
+        self.assertIsNone(db.since)
+        self.assertEqual(index.sync(db), 1)
+        self.assertIsNotNone(db.since)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import tracemalloc
+import unittest
+from datetime import datetime, timedelta, timezone
+from src.db.job_record import JobRecord, JobSource, parse_date
+
+NOW = datetime(2026, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+
+class TestParseDate(unittest.TestCase):
+    def test_relative_dates(self):
+        self.assertEqual(parse_date("3 days ago", NOW), NOW - timedelta(days=3))
+        self.assertEqual(parse_date("Posted 30+ days ago", NOW), NOW - timedelta(days=30))
+        self.assertEqual(parse_date("an hour ago", NOW), NOW - timedelta(hours=1))
+        self.assertEqual(parse_date("2 minggu yang lalu", NOW), NOW - timedelta(days=14))
+        self.assertEqual(parse_date("Just posted", NOW), NOW)
+        self.assertEqual(parse_date("kemarin", NOW), NOW - timedelta(days=1))
+
+    def test_absolute_and_missing_dates(self):
+        self.assertEqual(parse_date("2026-03-01", NOW), datetime(2026, 3, 1, tzinfo=timezone.utc))
+        self.assertEqual(parse_date("2026-03-01T08:00:00Z", NOW), datetime(2026, 3, 1, 8, tzinfo=timezone.utc))
+        self.assertIsNone(parse_date("N/A", NOW))
+        self.assertIsNone(parse_date("Hiring now", NOW))
+
+
+class TestJobRecord(unittest.TestCase):
+    def test_create_normalizes_fields(self):
+        job = JobRecord.create(
+            "https://example.com/1", "  AI\nEngineer ", "linkedin", company="N/A",
+            location="Jakarta ,  , Indonesia", date_posted="2026-03-01", description="Description not found"
+        )
+        self.assertEqual(job.title, "AI Engineer")
+        self.assertIs(job.source, JobSource.LINKEDIN)
+        self.assertIsNone(job.company)
+        self.assertEqual(job.location, "Jakarta, Indonesia")
+        self.assertIsNone(job.description)
+        self.assertIsNone(JobRecord.create("https://example.com/2", "AI Engineer", "LinkedIn", description="Description not scraped in list view").description)
+        self.assertIs(JobSource("Jobstreet"), JobSource.OTHER)
+        self.assertEqual(job.platform, "LinkedIn")
+
+    def test_spec_sites_keep_their_platform(self):
+        job = JobRecord.create("https://example.com/1", "AI Engineer", "Jobstreet")
+        self.assertIs(job.source, JobSource.OTHER)
+        self.assertEqual(job.platform, "Jobstreet")
+        self.assertEqual(job.to_mongo()["source"], "Other")
+        self.assertEqual(JobRecord.from_dict(job.to_mongo()), job)
+        self.assertEqual(JobRecord.from_dict(json.loads(json.dumps(job.to_dict()))), job)
+        # Stored before platforms were recorded
+        self.assertEqual(JobRecord.from_dict({"url": "https://example.com/2", "source": "Indeed"}).platform, "Indeed")
+
+    def test_round_trips(self):
+        job = JobRecord.create("https://example.com/1", "AI Engineer", "Glints", "Acme", "Jakarta", "2026-03-01", "Train models")
+        self.assertEqual(JobRecord.from_dict(job.to_mongo()), job)
+        self.assertEqual(JobRecord.from_dict(json.loads(json.dumps(job.to_dict()))), job)
+
+        listing = JobRecord.create("https://example.com/2", "Data Scientist", "Indeed")
+        self.assertNotIn("description", listing.to_mongo())
+        df = JobRecord.to_dataframe([job, listing])
+        self.assertEqual(str(df["date_posted"].dt.tz), "UTC")
+        self.assertEqual(JobRecord.from_dataframe(df), [job, listing])
+
+    def test_smaller_than_dicts(self):
+        def allocated(build):
+            tracemalloc.start()
+            jobs = build()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del jobs
+            return size
+
+        raw = [
+            (f"https://example.com/{i}", f"Engineer {i}", "Indeed", f"Company {i % 50}", f"City {i % 20}, Indonesia", f"{i % 30} days ago")
+            for i in range(20000)
+        ]
+        as_dicts = allocated(lambda: [
+            {"url": u, "title": t, "source": s, "company": c.upper().lower(), "location": l.upper().lower(), "date_posted": d}
+            for u, t, s, c, l, d in raw
+        ])
+        as_records = allocated(lambda: [JobRecord.create(*row) for row in raw])
+        self.assertLess(as_records, as_dicts * 0.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from src.agent.agent import ApplicationAgent
+from src.resume.optimizer import ResumeOptimizer
+from src.utils.llm_cache import LLMCache
+
+
+class TestLLMCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "llm_cache.sqlite3")
+        self.cache = LLMCache(self.path)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_repeated_optimization_served_from_cache(self):
+        # The fake model answers differently on every call it actually receives
+        optimizer = ResumeOptimizer(cache=self.cache, llm=FakeListChatModel(responses=["first", "second", "third"]))
+        self.assertEqual(optimizer.optimize("My resume", "AI Engineer at Acme"), "first")
+        self.assertEqual(optimizer.optimize("My resume", "AI Engineer at Acme"), "first")
+        self.assertEqual(optimizer.optimize("My resume", "Data Scientist at Globex"), "second")
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 2, "hit_rate": 1 / 3, "entries": 2})
+
+        # Entries outlive the process (the fake's responses are part of its parameters)
+        reopened = LLMCache(self.path)
+        optimizer = ResumeOptimizer(cache=reopened, llm=FakeListChatModel(responses=["first", "second", "third"]))
+        self.assertEqual(optimizer.optimize("My resume", "AI Engineer at Acme"), "first")
+        self.assertEqual(reopened.hits, 1)
+        reopened.close()
+
+    def test_model_parameters_are_part_of_the_key(self):
+        ResumeOptimizer(cache=self.cache, llm=FakeListChatModel(responses=["a"])).optimize("CV", "Job")
+        other = ResumeOptimizer(cache=self.cache, llm=FakeListChatModel(responses=["b"]))
+        self.assertEqual(other.optimize("CV", "Job"), "b")
+
+    def test_field_mapping_cached(self):
+        agent = ApplicationAgent(cache=self.cache, llm=FakeListChatModel(responses=['{"name": "Ana"}', '{"name": "Bo"}']))
+        inputs = {"user_profile": {"name": "Ana"}, "form_fields": ["name"]}
+        self.assertEqual(agent.chain.invoke(inputs), {"name": "Ana"})
+        self.assertEqual(agent.chain.invoke(inputs), {"name": "Ana"})
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(agent.cache_stats()["hit_rate"], 0.5)
+
+    def test_expiry_and_eviction(self):
+        cache = LLMCache(os.path.join(self.tmpdir.name, "small.sqlite3"), ttl=None, max_entries=2)
+        llm = FakeListChatModel(responses=["1", "2", "3", "4"], cache=cache)
+        for prompt in ("a", "b", "c"):
+            llm.invoke(prompt)
+        self.assertEqual(cache.stats()["entries"], 2)
+        # "a" was least recently used and evicted; "c" is still cached
+        self.assertEqual(llm.invoke("c").content, "3")
+        self.assertEqual(llm.invoke("a").content, "4")
+
+        cache.ttl = -1
+        self.assertIsNone(cache.lookup("anything", "model"))
+        cache.update("anything", "model", [])
+        self.assertIsNone(cache.lookup("anything", "model"))
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
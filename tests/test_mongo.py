@@ -0,0 +1,273 @@
+import unittest
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+from dotenv import load_dotenv
+from src.db.mongo import MongoDB, content_hash
+from src.db.job_record import JobRecord
+
+load_dotenv()
+
+TEST_DB_NAME = "job_agent_test_db"
+
+
+class TestContentHash(unittest.TestCase):
+    def test_ignores_whitespace_and_listing_metadata(self):
+        job = {"title": "AI Engineer", "company": "Acme", "location": "Jakarta", "description": "Train models"}
+        self.assertEqual(content_hash(job), content_hash({**job, "description": " Train\n models ", "date_posted": "2 days ago"}))
+        self.assertNotEqual(content_hash(job), content_hash({**job, "company": "Globex"}))
+
+
+class StoredDescriptions:
+    """Stands in for the jobs collection, answering the description lookup of a rehash."""
+
+    def __init__(self, descriptions):
+        self.descriptions = descriptions
+
+    def find(self, query, projection=None):
+        return [{"url": url, "description": self.descriptions.get(url)} for url in query["url"]["$in"]]
+
+
+class TestJobUpdate(unittest.TestCase):
+    def test_relisted_update_has_no_conflicting_paths(self):
+        now = datetime.now(timezone.utc)
+        url = "https://example.com/1"
+        stored = {url: {"url": url, "title": "AI Engineer", "company": "Acme", "content_hash": "old"}}
+        updates = {url: MongoDB._job_update({"url": url, "title": "Senior AI Engineer", "company": "Acme"}, now)}
+        db = MongoDB.__new__(MongoDB)
+        db.jobs_collection = StoredDescriptions({url: "Train models"})
+        db._rehash_relisted([url], stored, updates, now)
+
+        update = updates[url]
+        self.assertEqual(set(update["$set"]) & set(update["$setOnInsert"]), set())
+        self.assertEqual(update["$set"]["content_changed_at"], now)
+        self.assertEqual(update["$set"]["content_hash"], content_hash({"title": "Senior AI Engineer", "company": "Acme", "description": "Train models"}))
+
+
+class TestMongoDB(unittest.TestCase):
+    def setUp(self):
+        uri = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+        try:
+            MongoClient(uri, serverSelectionTimeoutMS=1000).admin.command("ping")
+        except PyMongoError:
+            self.skipTest("MongoDB is not reachable.")
+
+        os.environ["MONGO_DB_NAME"] = TEST_DB_NAME
+        self.db = MongoDB()
+        self.db.jobs_collection.delete_many({})
+
+    def tearDown(self):
+        self.db.client.drop_database(TEST_DB_NAME)
+
+    def test_save_jobs_summary(self):
+        jobs = [
+            {"url": "https://example.com/1", "title": "AI Engineer"},
+            {"url": "https://example.com/2", "title": "Data Scientist"},
+            {"title": "No URL"},
+        ]
+        summary = self.db.save_jobs(jobs, chunk_size=1)
+        self.assertEqual(summary["inserted"], 2)
+        self.assertEqual(summary["updated"], 0)
+        self.assertEqual(summary["failed"], 1)
+        self.assertEqual(summary["errors"][0]["title"], "No URL")
+
+        summary = self.db.save_jobs([
+            {"url": "https://example.com/1", "title": "Senior AI Engineer"},
+            {"url": "https://example.com/3", "title": "ML Engineer"},
+        ])
+        self.assertEqual(summary["inserted"], 1)
+        self.assertEqual(summary["updated"], 1)
+        self.assertEqual(self.db.jobs_collection.count_documents({}), 3)
+
+    def test_incremental_crawl_bookkeeping(self):
+        self.db.save_jobs([
+            {"url": "https://example.com/1", "title": "AI Engineer", "description": "Train models"},
+            {"url": "https://example.com/2", "title": "Data Scientist"},
+        ])
+        first = self.db.get_job("https://example.com/1")
+        self.assertEqual(first["first_seen"], first["last_seen"])
+
+        fresh = self.db.find_fresh_urls(["https://example.com/1", "https://example.com/2"], timedelta(days=1))
+        self.assertEqual(fresh, {"https://example.com/1"})
+
+        # A listing seen again without details keeps the stored description
+        self.db.save_jobs([{"url": "https://example.com/1", "title": "AI Engineer"}])
+        again = self.db.get_job("https://example.com/1")
+        self.assertEqual(again["description"], "Train models")
+        self.assertEqual(again["first_seen"], first["first_seen"])
+        self.assertGreaterEqual(again["last_seen"], first["last_seen"])
+
+    def test_unchanged_content_skips_rewrite(self):
+        # Stored before sources and remote flags were recorded
+        job = {"url": "https://example.com/1", "title": "AI Engineer", "location": "Remote", "description": "Train models"}
+        self.db.save_jobs([job])
+        first = self.db.get_job(job["url"])
+
+        recrawled = JobRecord.create(job["url"], "AI Engineer", "LinkedIn", location="Remote", date_posted="1 day ago", description="Train   models\n")
+        summary = self.db.save_jobs([recrawled])
+        self.assertEqual(summary["unchanged"], 1)
+        again = self.db.get_job(job["url"])
+        self.assertEqual(again["content_changed_at"], first["content_changed_at"])
+        self.assertEqual(again["description"], "Train models")
+        # Listing metadata is still refreshed
+        self.assertTrue(again["remote"])
+        self.assertEqual(again["source"], "LinkedIn")
+        self.assertIsInstance(again["date_posted"], datetime)
+
+        since = again["last_seen"]
+        summary = self.db.save_jobs([{**job, "description": "Train and deploy models"}, {"url": "https://example.com/2", "title": "New"}])
+        self.assertEqual(summary["updated"], 1)
+        changed = [j["url"] for j in self.db.changed_since(since, fields=["url"])]
+        self.assertEqual(changed, ["https://example.com/1", "https://example.com/2"])
+
+    def test_listing_only_change_is_a_content_change(self):
+        job = {"url": "https://example.com/1", "title": "AI Engineer", "company": "Acme", "description": "Train models"}
+        self.db.save_jobs([job])
+        # Stored dates have millisecond precision
+        since = self.db.get_job(job["url"])["last_seen"] + timedelta(milliseconds=1)
+        time.sleep(0.01)
+
+        # Seen again without details and unchanged: not reported as changed
+        self.db.save_jobs([{"url": job["url"], "title": "AI Engineer", "company": "Acme"}])
+        self.assertEqual(list(self.db.changed_since(since)), [])
+
+        self.db.save_jobs([{"url": job["url"], "title": "Senior AI Engineer", "company": "Acme"}])
+        again = self.db.get_job(job["url"])
+        self.assertEqual(again["description"], "Train models")
+        self.assertEqual([j["url"] for j in self.db.changed_since(since)], [job["url"]])
+        self.assertEqual(again["content_hash"], content_hash({**job, "title": "Senior AI Engineer"}))
+
+        # The detail page later confirming the new title is not another change
+        self.assertEqual(self.db.save_jobs([{**job, "title": "Senior AI Engineer"}])["unchanged"], 1)
+
+    def test_placeholder_never_overwrites_description(self):
+        self.db.save_jobs([{"url": "https://example.com/1", "title": "AI Engineer", "description": "Train models"}])
+        self.db.save_jobs([{"url": "https://example.com/1", "title": "AI Engineer", "description": "Description not found"}])
+        self.assertEqual(self.db.get_job("https://example.com/1")["description"], "Train models")
+
+    def test_job_records_saved_with_typed_dates(self):
+        recent = JobRecord.create("https://example.com/1", "AI Engineer", "LinkedIn", location=" Jakarta ,  Indonesia", date_posted="2 days ago")
+        old = JobRecord.create("https://example.com/2", "Data Scientist", "Glints", date_posted="3 bulan yang lalu")
+        self.assertEqual(self.db.save_jobs([recent, old])["inserted"], 2)
+        week_ago = recent.date_posted - timedelta(days=5)
+        self.assertEqual([j["url"] for j in self.db.get_jobs({"date_posted": {"$gte": week_ago}})], ["https://example.com/1"])
+        self.assertEqual(JobRecord.from_dict(self.db.get_job(recent.url)), recent)
+
+    def test_find_jobs_pages_when_fields_omit_sort_field(self):
+        self.db.save_jobs([
+            JobRecord.create(f"https://example.com/{i}", f"Job {i}", "Indeed", date_posted=f"{i} days ago")
+            for i in range(1, 6)
+        ])
+        seen, cursor = [], None
+        while True:
+            page, cursor = self.db.find_jobs(fields=["url"], sort_field="date_posted", limit=2, after=cursor)
+            seen += [job["url"] for job in page]
+            if cursor is None:
+                break
+        self.assertEqual(seen, [f"https://example.com/{i}" for i in range(1, 6)])
+
+    def test_text_dates_migrated(self):
+        seen = datetime(2026, 3, 10, tzinfo=timezone.utc)
+        self.db.jobs_collection.insert_many([
+            {"url": "https://example.com/1", "title": "AI Engineer", "date_posted": "2 days ago", "last_seen": seen},
+            {"url": "https://example.com/2", "title": "Data Scientist", "date_posted": "2026-03-01"},
+            {"url": "https://example.com/3", "title": "Accountant", "date_posted": "Promoted"},
+        ])
+        self.assertEqual(self.db.migrate_date_posted(chunk_size=2), 3)
+        self.assertEqual(self.db.get_job("https://example.com/1")["date_posted"], datetime(2026, 3, 8))
+        self.assertEqual(self.db.get_job("https://example.com/2")["date_posted"], datetime(2026, 3, 1))
+        self.assertIsNone(self.db.get_job("https://example.com/3")["date_posted"])
+        self.assertEqual(self.db.migrate_date_posted(), 0)
+
+    def test_search_jobs_with_facets(self):
+        self.db.save_jobs([
+            JobRecord.create("https://example.com/1", "Python Developer", "LinkedIn", "Acme", "Jakarta, Indonesia", "2 days ago", "Build Django APIs"),
+            JobRecord.create("https://example.com/2", "Data Engineer", "Indeed", "Globex", "Remote", "1 day ago", "Python pipelines on Airflow"),
+            JobRecord.create("https://example.com/3", "Accountant", "Glints", "Initech", "Jakarta, Indonesia", "40 days ago", "Monthly tax reports"),
+        ])
+        everything = self.db.search_jobs()
+        self.assertEqual(everything["total"], 3)
+        self.assertEqual(everything["jobs"][0]["url"], "https://example.com/2")
+        self.assertIn({"value": "Jakarta, Indonesia", "count": 2}, everything["facets"]["location"])
+        self.assertIn({"value": True, "count": 1}, everything["facets"]["remote"])
+
+        # Sites added by spec are counted and filtered by their own name
+        self.db.save_jobs([JobRecord.create("https://example.com/4", "Tax Advisor", "Jobstreet", "Initech", "Surabaya")])
+        self.assertIn({"value": "Jobstreet", "count": 1}, self.db.search_jobs()["facets"]["source"])
+        self.assertEqual([job["url"] for job in self.db.search_jobs(sources=["Jobstreet"])["jobs"]], ["https://example.com/4"])
+        self.assertEqual(self.db.search_jobs(sources=["Indeed"])["total"], 1)
+
+        recent = self.db.search_jobs(locations=["Jakarta, Indonesia"], posted_after=datetime.now(timezone.utc) - timedelta(days=7))
+        self.assertEqual([job["url"] for job in recent["jobs"]], ["https://example.com/1"])
+        self.assertEqual(recent["facets"]["source"], [{"value": "LinkedIn", "count": 1}])
+        self.assertEqual(self.db.search_jobs(remote=True)["total"], 1)
+
+    def test_search_jobs_pages_by_keyset(self):
+        self.db.save_jobs([
+            JobRecord.create(f"https://example.com/{i}", f"Job {i}", "Indeed", location="Jakarta", date_posted=f"{i} days ago")
+            for i in range(1, 6)
+        ])
+        self.db.save_duplicate_clusters([{"canonical_url": "https://example.com/1", "sources": [
+            {"source": "Indeed", "url": "https://example.com/1"}, {"source": "Indeed", "url": "https://example.com/2"},
+        ]}])
+        seen, cursor = [], None
+        while True:
+            result = self.db.search_jobs(locations=["Jakarta"], limit=2, after=cursor)
+            self.assertEqual(result["total"], 4)
+            seen += [job["url"] for job in result["jobs"]]
+            cursor = result["next"]
+            if cursor is None:
+                break
+            self.assertIn("date_posted", cursor)
+        self.assertEqual(seen, [f"https://example.com/{i}" for i in (1, 3, 4, 5)])
+
+    def test_search_jobs_full_text(self):
+        self.db.save_jobs([
+            JobRecord.create("https://example.com/1", "Python Developer", "LinkedIn", "Acme", "Jakarta", description="Build Django APIs"),
+            JobRecord.create("https://example.com/2", "Data Engineer", "Indeed", "Globex", "Remote", description="Python pipelines on Airflow"),
+            JobRecord.create("https://example.com/3", "Accountant", "Glints", "Initech", "Jakarta", description="Monthly tax reports"),
+        ])
+        result = self.db.search_jobs("python")
+        # Title matches weigh more than description matches
+        self.assertEqual([job["url"] for job in result["jobs"]], ["https://example.com/1", "https://example.com/2"])
+        self.assertEqual(self.db.search_jobs("python", remote=True)["total"], 1)
+
+    def test_duplicate_clusters_recorded(self):
+        self.db.save_jobs([{"url": u, "title": "AI Engineer"} for u in ("a", "b", "c")])
+        sources = [{"source": "LinkedIn", "url": "a"}, {"source": "Indeed", "url": "b"}]
+        self.db.save_duplicate_clusters([{"canonical_url": "a", "sources": sources}])
+        self.assertEqual(self.db.get_job("a")["sources"], sources)
+        self.assertEqual(self.db.get_job("b")["duplicate_of"], "a")
+
+        # A later run that no longer clusters them clears the marks
+        self.db.save_duplicate_clusters([])
+        self.assertNotIn("duplicate_of", self.db.get_job("b"))
+        self.assertNotIn("sources", self.db.get_job("a"))
+
+    def test_save_resume_replaces_per_job(self):
+        self.db.save_resume({"job_id": "https://example.com/1", "resume": "First draft"})
+        self.db.save_resume({"job_id": "https://example.com/1", "resume": "Second draft"})
+        self.assertEqual(self.db.resumes_collection.count_documents({}), 1)
+        self.assertEqual(self.db.get_resume("https://example.com/1")["resume"], "Second draft")
+
+    def test_indexes_bootstrapped(self):
+        report = self.db.check_indexes()
+        self.assertEqual(report["jobs"]["missing"], [])
+        self.assertEqual(report["resumes"]["missing"], [])
+        self.assertTrue(self.db.jobs_collection.index_information()["url_unique"]["unique"])
+
+    def test_index_drift_reported(self):
+        self.db.jobs_collection.create_index("title", name="title_1")
+        self.db.jobs_collection.drop_index("source_date_posted")
+        report = self.db.check_indexes()
+        self.assertIn("title_1", report["jobs"]["unexpected"])
+        self.assertIn("source_date_posted", report["jobs"]["missing"])
+
+        self.db.ensure_indexes()
+        self.assertEqual(self.db.check_indexes()["jobs"]["missing"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+from src.scrapers.pagination import AdaptiveTimeout
+
+
+class TestAdaptiveTimeout(unittest.TestCase):
+    def test_starts_at_initial_timeout(self):
+        self.assertAlmostEqual(AdaptiveTimeout(initial_ms=3000).timeout_ms, 3000)
+
+    def test_shrinks_when_results_arrive_fast(self):
+        timeout = AdaptiveTimeout(initial_ms=3000, min_ms=750)
+        for _ in range(20):
+            timeout.observe(100)
+        self.assertEqual(timeout.timeout_ms, 750)
+
+    def test_grows_for_slow_sites_up_to_max(self):
+        timeout = AdaptiveTimeout(initial_ms=3000, max_ms=15000)
+        timeout.observe(4000)
+        self.assertGreater(timeout.timeout_ms, 3000)
+        for _ in range(20):
+            timeout.observe(60000)
+        self.assertEqual(timeout.timeout_ms, 15000)
+
+
+if __name__ == '__main__':
+    unittest.main()
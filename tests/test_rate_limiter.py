@@ -0,0 +1,92 @@
+import asyncio
+import time
+import unittest
+from src.scrapers.rate_limiter import RateLimit, DomainRateLimiter, RateLimited, TokenBucket, AIMDController
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_steady_rate(self):
+        async def run():
+            bucket = TokenBucket(rate=50, capacity=3)
+            start = time.monotonic()
+            for _ in range(8):
+                await bucket.acquire()
+            return time.monotonic() - start
+        # 3 tokens are free, the other 5 arrive every 20ms
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+    def test_pause_blocks_tokens(self):
+        async def run():
+            bucket = TokenBucket(rate=1000, capacity=5)
+            bucket.pause(0.05)
+            start = time.monotonic()
+            await bucket.acquire()
+            return time.monotonic() - start
+        self.assertGreaterEqual(asyncio.run(run()), 0.04)
+
+
+class TestAIMDController(unittest.TestCase):
+    def controller(self, initial=2):
+        return AIMDController(initial, min_limit=1, max_limit=4, latency_target=1.0, max_error_rate=0.5)
+
+    def test_grows_after_a_window_of_fast_successes(self):
+        controller = self.controller()
+        for _ in range(2):
+            controller.in_flight += 1
+            controller.release(time.monotonic(), 0.1, "ok")
+        self.assertEqual(controller.limit, 3)
+
+    def test_slow_responses_hold_the_limit(self):
+        controller = self.controller()
+        for _ in range(10):
+            controller.in_flight += 1
+            controller.release(time.monotonic(), 5.0, "ok")
+        self.assertEqual(controller.limit, 2)
+
+    def test_throttle_halves_once_per_congestion_event(self):
+        controller = self.controller(initial=4)
+        started_at = time.monotonic()
+        for _ in range(3):
+            controller.in_flight += 1
+            controller.release(started_at, 0.1, "throttled")
+        self.assertEqual(controller.limit, 2)
+
+
+class TestDomainRateLimiter(unittest.TestCase):
+    def limiter(self, **limits):
+        return DomainRateLimiter(RateLimit(requests_per_second=1000, burst=100, cooldown=0.01, **limits), initial_concurrency=2)
+
+    def test_caps_requests_in_flight(self):
+        limiter = self.limiter(max_concurrency=2)
+        running = []
+
+        async def fetch(i):
+            async with limiter.slot(f"https://jobs.example.com/{i}"):
+                running.append(limiter.controllers["jobs.example.com"].in_flight)
+                await asyncio.sleep(0.01)
+
+        async def run():
+            await asyncio.gather(*(fetch(i) for i in range(6)))
+
+        asyncio.run(run())
+        self.assertEqual(max(running), 2)
+
+    def test_throttling_backs_off_domain(self):
+        limiter = self.limiter()
+
+        async def run():
+            with self.assertRaises(RateLimited):
+                async with limiter.slot("https://jobs.example.com/1"):
+                    raise RateLimited("https://jobs.example.com/1", "HTTP 429")
+            async with limiter.slot("https://other.example.com/1"):
+                pass
+
+        asyncio.run(run())
+        stats = limiter.stats()
+        self.assertEqual(stats["jobs.example.com"], {"concurrency": 1, "latency": 0.0, "throttled": 1})
+        self.assertEqual(stats["other.example.com"]["throttled"], 0)
+        self.assertGreater(limiter.buckets["jobs.example.com"].paused_until, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import asyncio
+import unittest
+from src.scrapers.resource_policy import ResourcePolicy
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class TestResourcePolicy(unittest.TestCase):
+    def test_blocks_by_resource_type(self):
+        policy = ResourcePolicy()
+        self.assertTrue(policy.should_block("image", "https://glints.com/logo.png"))
+        self.assertTrue(policy.should_block("font", "https://fonts.gstatic.com/a.woff2"))
+        self.assertFalse(policy.should_block("document", "https://glints.com/id/opportunities/jobs/1"))
+
+    def test_blocks_tracker_subdomains(self):
+        policy = ResourcePolicy(extra_blocked_domains={"px.ads.linkedin.com"})
+        self.assertTrue(policy.should_block("script", "https://www.google-analytics.com/analytics.js"))
+        self.assertTrue(policy.should_block("xhr", "https://px.ads.linkedin.com/collect"))
+        self.assertFalse(policy.should_block("script", "https://static.licdn.com/app.js"))
+
+    def test_custom_policy_allows_everything(self):
+        policy = ResourcePolicy(blocked_resource_types=(), blocked_domains=())
+        self.assertFalse(policy.should_block("image", "https://www.google-analytics.com/pixel.gif"))
+
+    def test_route_handler_counts_savings(self):
+        policy = ResourcePolicy()
+        routes = [
+            FakeRoute("image", "https://glints.com/banner.jpg"),
+            FakeRoute("document", "https://glints.com/id/opportunities/jobs/1"),
+            FakeRoute("script", "https://www.googletagmanager.com/gtm.js"),
+        ]
+
+        async def handle_all():
+            for route in routes:
+                await policy.handle_route(route)
+
+        asyncio.run(handle_all())
+        self.assertEqual([route.outcome for route in routes], ["aborted", "continued", "aborted"])
+        stats = policy.stats()
+        self.assertEqual(stats["blocked_requests"], 2)
+        self.assertEqual(stats["allowed_requests"], 1)
+        self.assertEqual(stats["blocked_by_type"], {"image": 1, "script": 1})
+        self.assertGreater(stats["estimated_bytes_saved"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
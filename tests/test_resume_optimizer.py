@@ -0,0 +1,88 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+import httpx
+import openai
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from src.resume.optimizer import ResumeOptimizer
+from src.scrapers.retry import RetryPolicy
+from src.utils.llm_cache import LLMCache
+
+
+class SlowChatModel(FakeListChatModel):
+    """Fake chat model taking `delay` seconds per call; the first `rate_limited` calls are throttled."""
+
+    delay: float = 0.2
+    rate_limited: int = 0
+    calls: int = 0
+
+    async def _agenerate(self, *args, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.rate_limited:
+            response = httpx.Response(429, headers={"retry-after": "0"}, request=httpx.Request("POST", "https://api.openai.com"))
+            raise openai.RateLimitError("rate limited", response=response, body=None)
+        return await super()._agenerate(*args, **kwargs)
+
+
+class RecordingDB:
+    def __init__(self):
+        self.resumes = {}
+
+    def save_resume(self, resume_data):
+        self.resumes[resume_data["job_id"]] = resume_data
+
+
+class TestOptimizeMany(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = LLMCache(os.path.join(self.tmpdir.name, "llm_cache.sqlite3"))
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def collect(self, optimizer, jobs, **kwargs):
+        async def run():
+            return [result async for result in optimizer.optimize_many("My resume", jobs, **kwargs)]
+        return asyncio.run(run())
+
+    def jobs(self, count):
+        return [{"url": f"https://example.com/{i}", "description": f"Job {i}"} for i in range(count)]
+
+    def test_calls_run_concurrently_and_are_saved(self):
+        llm = SlowChatModel(responses=["Tailored resume"])
+        optimizer = ResumeOptimizer(cache=self.cache, llm=llm)
+        db = RecordingDB()
+        started = time.perf_counter()
+        results = self.collect(optimizer, self.jobs(20), max_concurrency=20, db=db)
+        # 20 calls of 0.2s each take about as long as one
+        self.assertLess(time.perf_counter() - started, 1.5)
+        self.assertEqual(len(results), 20)
+        self.assertEqual(set(db.resumes), {job["url"] for job in self.jobs(20)})
+        self.assertEqual(db.resumes["https://example.com/3"]["resume"], "Tailored resume")
+
+    def test_cache_stats_logged_after_the_batch(self):
+        optimizer = ResumeOptimizer(cache=self.cache, llm=SlowChatModel(responses=["Tailored resume"], delay=0))
+        jobs = self.jobs(2) + self.jobs(1)
+        with self.assertLogs(level="INFO") as logs:
+            self.collect(optimizer, jobs, max_concurrency=1)
+        self.assertEqual(optimizer.cache_stats()["hits"], 1)
+        self.assertIn("Resume optimizer LLM cache: 1 hits, 2 misses", logs.output[-1])
+
+    def test_rate_limits_retried_and_failures_reported(self):
+        policy = RetryPolicy(max_attempts=2, base_delay=0.001)
+        llm = SlowChatModel(responses=["Tailored resume"], delay=0, rate_limited=1)
+        results = self.collect(ResumeOptimizer(cache=self.cache, llm=llm, retry_policy=policy), self.jobs(1))
+        self.assertEqual(results, [{"job_id": "https://example.com/0", "resume": "Tailored resume"}])
+
+        llm = SlowChatModel(responses=["Tailored resume"], delay=0, rate_limited=5)
+        results = self.collect(ResumeOptimizer(cache=self.cache, llm=llm, retry_policy=policy), self.jobs(2)[1:])
+        self.assertEqual(results[0]["job_id"], "https://example.com/1")
+        self.assertIn("rate limited", results[0]["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
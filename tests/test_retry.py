@@ -0,0 +1,84 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from src.scrapers.dead_letters import DeadLetterQueue
+from src.db.job_record import JobRecord
+from src.scrapers.retry import FetchError, DescriptionNotFound, RetryPolicy
+from tests.test_scrapers import FakeBrowser, ScriptedScraper
+
+
+class FlakyScraper(ScriptedScraper):
+    """Scripted scraper whose detail pages fail according to `failures`."""
+
+    def __init__(self, failures, dead_letters):
+        super().__init__(listings_per_search=2, dead_letters=dead_letters)
+        # url suffix -> exceptions to raise before succeeding
+        self.failures = failures
+        self.attempts = {}
+
+    async def fetch_description(self, context, job_url, fetcher=None):
+        self.attempts[job_url] = self.attempts.get(job_url, 0) + 1
+        pending = self.failures.get(job_url[-2:], [])
+        if pending:
+            raise pending.pop(0)
+        return await super().fetch_description(context, job_url, fetcher)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+        for attempt in range(1, 8):
+            delay = policy.delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(5.0, 2 ** (attempt - 1)))
+
+
+class TestDeadLetters(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dead_letters = DeadLetterQueue(os.path.join(self.tmpdir.name, "dead.sqlite3"), max_failures=2)
+
+    def tearDown(self):
+        self.dead_letters.close()
+        self.tmpdir.cleanup()
+
+    def test_no_file_until_first_failure(self):
+        self.assertEqual(self.dead_letters.pending("Indeed"), [])
+        self.assertFalse(os.path.exists(self.dead_letters.path))
+
+    def test_entries_retire_after_max_failures(self):
+        job = JobRecord.create("https://example.com/1", "AI Engineer", "Indeed", description="partial")
+        self.dead_letters.add("Indeed", job, DescriptionNotFound(job.url))
+        self.assertEqual(self.dead_letters.pending("Indeed"), [JobRecord.create("https://example.com/1", "AI Engineer", "Indeed")])
+        self.dead_letters.add("Indeed", job, FetchError(job.url, "connection reset"))
+        self.assertEqual(self.dead_letters.pending("Indeed"), [])
+        self.assertEqual(self.dead_letters.counts(), {"Indeed": 1})
+
+    def collect(self, scraper):
+        async def run():
+            return [job async for job in scraper.stream(["AI Engineer"], ["Jakarta"], False, browser=FakeBrowser())]
+        return {job.url[-2:]: job for job in asyncio.run(run())}
+
+    def test_retries_then_dead_letters_and_redrives(self):
+        scraper = FlakyScraper({
+            "#0": [FetchError("u", "connection reset")],
+            "#1": [DescriptionNotFound("u")],
+        }, self.dead_letters)
+        jobs = self.collect(scraper)
+
+        # A transient error is retried within the run
+        self.assertTrue(jobs["#0"].description.startswith("Description of"))
+        # A permanent one is not, and the job goes out without a description
+        self.assertIsNone(jobs["#1"].description)
+        self.assertEqual(list(scraper.attempts.values()), [2, 1])
+        self.assertEqual(len(self.dead_letters.pending("Indeed")), 1)
+
+        # The next run re-drives the failed page and clears it
+        rerun = self.collect(FlakyScraper({}, self.dead_letters))
+        self.assertIsNotNone(rerun["#1"].description)
+        self.assertEqual(self.dead_letters.counts(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import asyncio
+import unittest
+from src.scrapers.base_scraper import CrawlState, Scraper
+from src.scrapers.glints_scraper import GlintsScraper
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.linkedin_scraper import LinkedInScraper
+from src.scrapers.rate_limiter import RateLimit
+from src.scrapers.retry import RetryPolicy
+from src.scrapers.spec import ExtractionSpec
+from src.db.job_record import JobRecord
+
+
+class TestSearchUrls(unittest.TestCase):
+    def test_one_search_per_title_and_location(self):
+        urls = LinkedInScraper().search_urls(["AI Engineer", "Data Scientist"], ["Jakarta", "Remote"], False)
+        self.assertEqual(len(urls), 4)
+        self.assertIn("https://www.linkedin.com/jobs/search?keywords=AI%20Engineer&location=Jakarta", urls)
+
+    def test_remote_filter_appended(self):
+        urls = IndeedScraper().search_urls(["AI Engineer"], ["New York"], True)
+        self.assertEqual(urls, ["https://www.indeed.com/jobs?q=AI+Engineer&l=New+York&sc=0kf%3Aattr%28DSQF7%29%3B"])
+
+    def test_location_free_searches_deduplicated(self):
+        urls = GlintsScraper().search_urls(["AI Engineer"], ["Jakarta", "Bandung"], False)
+        self.assertEqual(len(urls), 1)
+        self.assertIn("keyword=AI+Engineer", urls[0])
+
+
+class TestParseDescription(unittest.TestCase):
+    def test_selector_description(self):
+        html = "<html><body><div class='show-more-less-html__markup'>Build <b>models</b></div></body></html>"
+        self.assertEqual(LinkedInScraper().parse_description(html), "Build \nmodels")
+
+    def test_missing_description(self):
+        self.assertIsNone(IndeedScraper().parse_description("<html><body><p>Blocked</p></body></html>"))
+
+    def test_hidden_text_and_empty_pages(self):
+        html = "<div id='jobDescriptionText'><script>track()</script>Ship <!-- ad -->features</div>"
+        self.assertEqual(IndeedScraper().parse_description(html), "Ship features")
+        self.assertIsNone(IndeedScraper().parse_description(""))
+
+    def test_glints_section_slicing(self):
+        html = "<main><h1>AI Engineer</h1><h2>Deskripsi pekerjaan</h2><p>Train models</p><h2>Tentang Perusahaan</h2><p>We are a startup</p></main>"
+        description = GlintsScraper().parse_description(html)
+        self.assertTrue(description.startswith("Deskripsi pekerjaan"))
+        self.assertIn("Train models", description)
+        self.assertNotIn("We are a startup", description)
+
+
+class TestExtractionSpec(unittest.TestCase):
+    def test_bundled_specs_compile(self):
+        for name in ["linkedin", "indeed", "glints"]:
+            spec = ExtractionSpec.load(name)
+            self.assertEqual(spec.data["platform_name"].lower(), name)
+
+    def test_new_site_from_spec_alone(self):
+        spec = ExtractionSpec({
+            "platform_name": "Example",
+            "base_url": "https://jobs.example.com",
+            "search": {"url_template": "https://jobs.example.com/search?q={job_title}&where={location}", "splitter": "+"},
+            "cards": {"card": "article", "title": "h2", "company": ".company", "location": ".where"},
+            "description": {"selectors": ["section.job"], "start_pattern": "Role|Rolle", "end_pattern": "Benefits"},
+        })
+        scraper = Scraper.from_spec(spec)
+        self.assertEqual(scraper.search_urls(["AI Engineer"], ["Berlin"], False), ["https://jobs.example.com/search?q=AI+Engineer&where=Berlin"])
+        html = "<section class='job'><h1>AI Engineer</h1><h2>Rolle</h2><p>Build agents</p><h2>Benefits</h2><p>Snacks</p></section>"
+        self.assertEqual(scraper.parse_description(html), "Rolle\nBuild agents")
+
+    def test_missing_keys_rejected(self):
+        with self.assertRaises(ValueError):
+            ExtractionSpec({"platform_name": "Broken", "base_url": "x", "search": {}, "cards": {}, "description": {}})
+
+
+class TestDispatchListings(unittest.TestCase):
+    def listings(self, *ids):
+        return [JobRecord.create(f"https://www.indeed.com/viewjob?jk={i}", f"Job {i}", "Indeed") for i in ids]
+
+    def test_skips_seen_and_respects_budget(self):
+        state = CrawlState(limit_per_search=10)
+        scraper = IndeedScraper()
+        taken = asyncio.run(scraper.dispatch_listings(self.listings(1, 2), state, budget=10))
+        self.assertEqual(taken, 2)
+        taken = asyncio.run(scraper.dispatch_listings(self.listings(2, 3, 4, 5), state, budget=2))
+        self.assertEqual(taken, 2)
+        self.assertEqual(state.queue.qsize(), 4)
+
+    def test_incremental_mode_skips_fresh_details(self):
+        fresh = {"https://www.indeed.com/viewjob?jk=1"}
+        state = CrawlState(limit_per_search=10, known_urls=lambda urls: fresh & set(urls))
+        taken = asyncio.run(IndeedScraper().dispatch_listings(self.listings(1, 2), state, budget=10))
+        self.assertEqual(taken, 2)
+        self.assertEqual(state.queue.qsize(), 1)
+        self.assertEqual(state.queue.get_nowait().title, "Job 2")
+        self.assertEqual(state.output.get_nowait(), JobRecord.create("https://www.indeed.com/viewjob?jk=1", "Job 1", "Indeed"))
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    async def route(self, pattern, handler):
+        pass
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    async def new_context(self, **kwargs):
+        return FakeContext()
+
+
+class ScriptedScraper(IndeedScraper):
+    """Indeed configuration whose searches and detail pages are scripted."""
+
+    def __init__(self, listings_per_search=3, dead_letters=None):
+        super().__init__()
+        self.description_marker = None
+        self.rate_limit = RateLimit(requests_per_second=1000, burst=100)
+        self.retry_policy = RetryPolicy(base_delay=0.001)
+        if dead_letters is not None:
+            self.dead_letters = dead_letters
+        self.listings_per_search = listings_per_search
+
+    async def search(self, context, search_url, state):
+        listings = [JobRecord.create(f"{search_url}#{i}", f"Job {i}", "Indeed") for i in range(self.listings_per_search)]
+        await self.dispatch_listings(listings, state, state.limit_per_search)
+
+    async def fetch_description(self, context, job_url, fetcher=None):
+        await asyncio.sleep(0)
+        return f"Description of {job_url}"
+
+
+class TestStream(unittest.TestCase):
+    def collect(self, scraper, **kwargs):
+        async def run():
+            return [job async for job in scraper.stream(["AI Engineer", "Data Scientist"], ["Jakarta"], False, browser=FakeBrowser(), **kwargs)]
+        return asyncio.run(run())
+
+    def test_yields_every_job_with_description(self):
+        jobs = self.collect(ScriptedScraper())
+        self.assertEqual(len(jobs), 6)
+        self.assertTrue(all(job.description.startswith("Description of") for job in jobs))
+
+    def test_stops_at_limit(self):
+        jobs = self.collect(ScriptedScraper(), limit=4)
+        self.assertEqual(len(jobs), 4)
+
+    def test_login_failure_raised(self):
+        scraper = ScriptedScraper()
+        scraper.requires_login = True
+        scraper.session_store.load = lambda platform_name: None
+
+        async def login(page):
+            raise RuntimeError("captcha")
+        scraper.login = login
+        with self.assertRaisesRegex(RuntimeError, "captcha"):
+            self.collect(scraper)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from src.scrapers.linkedin_scraper import LinkedInScraper
+from src.scrapers.session_store import SessionStore
+
+
+class FakeContext:
+    async def storage_state(self, path):
+        with open(path, "w") as f:
+            json.dump({"cookies": [{"name": "session", "value": "abc"}], "origins": []}, f)
+
+
+class FakeLoginScraper(LinkedInScraper):
+    """LinkedIn selectors with a scripted login and session probe."""
+
+    def __init__(self, session_store, probe_results):
+        super().__init__()
+        self.requires_login = True
+        self.session_store = session_store
+        self.probe_results = list(probe_results)
+        self.logins = 0
+
+    async def login(self, page):
+        self.logins += 1
+
+    async def is_logged_in(self, page):
+        return self.probe_results.pop(0)
+
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = SessionStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_and_load(self):
+        self.assertIsNone(self.store.load("Glints"))
+        asyncio.run(self.store.save(FakeContext(), "Glints"))
+        path = self.store.load("Glints")
+        self.assertEqual(path, os.path.join(self.tmp.name, "glints_state.json"))
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+
+    def test_expired_session_discarded(self):
+        asyncio.run(self.store.save(FakeContext(), "Glints"))
+        old = time.time() - 8 * 24 * 3600
+        os.utime(self.store.path("Glints"), (old, old))
+        self.assertIsNone(self.store.load("Glints"))
+        self.assertFalse(os.path.exists(self.store.path("Glints")))
+
+    def test_valid_restored_session_skips_login(self):
+        scraper = FakeLoginScraper(self.store, probe_results=[True])
+        asyncio.run(scraper.ensure_session(FakeContext(), page=None, restored=True))
+        self.assertEqual(scraper.logins, 0)
+
+    def test_expired_restored_session_logs_in_and_saves(self):
+        scraper = FakeLoginScraper(self.store, probe_results=[False, True])
+        asyncio.run(scraper.ensure_session(FakeContext(), page=None, restored=True))
+        self.assertEqual(scraper.logins, 1)
+        self.assertIsNotNone(self.store.load("LinkedIn"))
+
+    def test_failed_login_not_saved(self):
+        scraper = FakeLoginScraper(self.store, probe_results=[False])
+        asyncio.run(scraper.ensure_session(FakeContext(), page=None, restored=False))
+        self.assertEqual(scraper.logins, 1)
+        self.assertIsNone(self.store.load("LinkedIn"))
+
+
+if __name__ == '__main__':
+    unittest.main()
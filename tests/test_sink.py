@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+from src.db.sink import BatchingSink
+from src.db.job_record import JobRecord
+from src.utils.description_compactor import DescriptionCompactor
+
+
+class RecordingDB:
+    """Stands in for MongoDB, recording each save_jobs batch."""
+
+    def __init__(self):
+        self.batches = []
+        self.descriptions = {}
+
+    def save_jobs(self, jobs):
+        self.batches.append([job.url for job in jobs])
+        self.descriptions.update({job.url: job.description for job in jobs})
+        return {"inserted": len(jobs), "updated": 0, "unchanged": 0, "failed": 0, "errors": []}
+
+
+class TestBatchingSink(unittest.TestCase):
+    def test_flushes_every_batch_size_jobs_and_on_exit(self):
+        db = RecordingDB()
+        flushes = []
+
+        async def run():
+            async with BatchingSink(db, batch_size=2, flush_interval=60, on_flush=lambda s: flushes.append(s["inserted"])) as sink:
+                for i in range(5):
+                    await sink.add(JobRecord.create(f"https://example.com/{i}", f"Job {i}", "Indeed"))
+            return sink
+
+        sink = asyncio.run(run())
+        self.assertEqual([len(batch) for batch in db.batches], [2, 2, 1])
+        self.assertEqual(flushes, [2, 4, 5])
+        self.assertEqual(sink.received, 5)
+        self.assertEqual(sink.summary["inserted"], 5)
+
+    def test_flushes_on_timer(self):
+        db = RecordingDB()
+
+        async def run():
+            async with BatchingSink(db, batch_size=100, flush_interval=0.05) as sink:
+                await sink.add(JobRecord.create("https://example.com/1", "Job 1", "Indeed"))
+                await asyncio.sleep(0.2)
+                self.assertEqual(db.batches, [["https://example.com/1"]])
+
+        asyncio.run(run())
+        self.assertEqual(len(db.batches), 1)
+
+    def test_descriptions_compacted_before_saving(self):
+        db = RecordingDB()
+        compactor = DescriptionCompactor(count_tokens=lambda text: len(text.split()))
+
+        async def run():
+            async with BatchingSink(db, compactor=compactor) as sink:
+                await sink.add(JobRecord.create("https://example.com/1", "Job 1", "Indeed", description="Build APIs\nShow more\nBuild APIs"))
+            return sink
+
+        sink = asyncio.run(run())
+        self.assertEqual(db.descriptions["https://example.com/1"], "Build APIs")
+        self.assertEqual(sink.summary["tokens_saved"], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()